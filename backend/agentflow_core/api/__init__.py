@@ -4,12 +4,9 @@ AgentFlow Core - API Module
 Exports API components including routers and models.
 """
 
-from agentflow_core.api.main import app, create_app
-from agentflow_core.api.routes import (
-    health_router,
-    sources_router,
-    workflows_router,
-)
+from importlib import import_module
+from typing import Any
+
 from agentflow_core.api.models.workflow_model import (
     WorkflowSpecModel,
     NodeModel,
@@ -25,6 +22,26 @@ from agentflow_core.api.models.workflow_model import (
     ErrorResponse,
 )
 
+# The application and routers import the whole runtime, so they are only
+# loaded on first access. Servers should target agentflow_core.api.main:app.
+_LAZY_EXPORTS = {
+    "app": "agentflow_core.api.main",
+    "create_app": "agentflow_core.api.main",
+    "health_router": "agentflow_core.api.routes",
+    "sources_router": "agentflow_core.api.routes",
+    "workflows_router": "agentflow_core.api.routes",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve application exports lazily (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     # Application
     "app",
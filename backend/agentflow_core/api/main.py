@@ -6,27 +6,53 @@ Main FastAPI application with all routers and middleware configured.
 
 # Load environment variables from .env file
 import os
+import time
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
-# Load .env from backend directory (parent of agentflow_core)
+# Load .env from backend directory (parent of agentflow_core) once per process tree.
+# Set AGENTFLOW_SKIP_DOTENV=1 where the environment is injected (e.g. production).
 env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
+if not os.environ.get("AGENTFLOW_SKIP_DOTENV") and "AGENTFLOW_ENV_LOADED" not in os.environ:
+    if env_path.is_file():
+        # Same semantics as load_dotenv(): existing variables are never overridden
+        for _key, _value in dotenv_values(env_path).items():
+            if _value is not None:
+                os.environ.setdefault(_key, _value)
+    os.environ["AGENTFLOW_ENV_LOADED"] = "1"
 from contextlib import asynccontextmanager
-from datetime import datetime
 from typing import Any, Dict
 
 from fastapi import FastAPI, Request, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.routing import Route
 
+from agentflow_core.api.middleware import CachedPreflightCORSMiddleware
+from agentflow_core.api.responses import ORJSONResponse, dumps
 from agentflow_core.api.routes import (
     health_router,
     sources_router,
     workflows_router,
 )
+from agentflow_core.utils.clock import utc_now_iso
 from agentflow_core.utils.error_handler import AgentFlowError
-from agentflow_core.utils.logger import get_logger
+from agentflow_core.utils.logger import (
+    get_logger,
+    record_error,
+    setup_logging,
+    start_error_flusher,
+    stop_error_flusher,
+)
+
+# Route structured logs through the queued handler before anything logs
+setup_logging(
+    log_level=os.getenv("LOG_LEVEL", "INFO"),
+    json_format=os.getenv("ENVIRONMENT", "development") == "production",
+)
 
 logger = get_logger(__name__)
 
@@ -38,9 +64,18 @@ logger = get_logger(__name__)
 API_VERSION = "v1"
 
 # CORS Configuration
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
-CORS_METHODS = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
-CORS_HEADERS = ["*"]
+# Comma-separated origins, parsed once. Set CORS_ORIGINS to an empty value to
+# disable cross-origin support and skip the CORS middleware entirely.
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "*").split(",")
+    if origin.strip()
+)
+CORS_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+CORS_HEADERS = ("*",)
+
+# Worker threads shared by sync endpoints and offloaded graph build/execution
+THREADPOOL_SIZE = int(os.getenv("AGENTFLOW_THREADPOOL_SIZE", "100"))
 
 
 # =============================================================================
@@ -62,20 +97,85 @@ async def lifespan(app: FastAPI):
         environment=os.getenv("ENVIRONMENT", "development")
     )
     
-    # Initialize runtime registry
-    from agentflow_core.runtime.registry import get_registry
-    registry = get_registry()
-    logger.info(
-        "runtime_registry_initialized",
-        registered_sources=len(registry.sources)
-    )
+    # Size the worker pool used for blocking work (default anyio limit is 40)
+    import anyio.to_thread
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
+    # Warm-up work can be deferred to first use (AGENTFLOW_EAGER_INIT=0),
+    # e.g. for probe-only replicas where startup time matters more
+    if os.getenv("AGENTFLOW_EAGER_INIT", "1") == "1":
+        # Render the OpenAPI document before the first docs request arrives
+        if app.openapi_url:
+            app.state.render_openapi("")
+        
+        # Initialize runtime registry
+        from agentflow_core.runtime.registry import get_registry
+        registry = get_registry()
+        logger.info(
+            "runtime_registry_initialized",
+            registered_sources=len(registry.sources)
+        )
+        
+        # Evaluate readiness checks once so probes read a cached result
+        from agentflow_core.api.routes.health import run_readiness_checks
+        app.state.ready_checks = (time.monotonic(), run_readiness_checks())
+    
+    # Aggregate handler errors off the request path
+    start_error_flusher()
     
     yield
     
     # Shutdown
+    await stop_error_flusher()
     logger.info("agentflow_core_shutting_down")
 
 
+# =============================================================================
+# OpenAPI Schema
+# =============================================================================
+
+
+def _install_openapi_cache(app: FastAPI) -> None:
+    """
+    Serve the OpenAPI document as pre-rendered bytes.
+    
+    FastAPI already memoizes the schema dict, but its default route
+    re-encodes the whole document on every request. This replaces that
+    route with one that encodes once per root path and then serves the
+    cached bytes. The render is warmed during application startup.
+    
+    Args:
+        app: Application whose openapi_url route should be replaced
+    """
+    rendered: Dict[str, bytes] = {}
+    
+    def render_openapi(root_path: str) -> bytes:
+        cached = rendered.get(root_path)
+        if cached is None:
+            schema = app.openapi()
+            if root_path and app.root_path_in_servers:
+                server_urls = {s.get("url") for s in schema.get("servers", [])}
+                if root_path not in server_urls:
+                    schema = dict(schema)
+                    schema["servers"] = [{"url": root_path}] + schema.get("servers", [])
+            cached = rendered[root_path] = dumps(schema)
+        return cached
+    
+    async def openapi(request: Request) -> Response:
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        return Response(
+            content=render_openapi(root_path),
+            media_type="application/json"
+        )
+    
+    app.router.routes = [
+        route for route in app.router.routes
+        if not (isinstance(route, Route) and route.path == app.openapi_url)
+    ]
+    app.add_route(app.openapi_url, openapi, include_in_schema=False)
+    app.state.render_openapi = render_openapi
+
+
 # =============================================================================
 # Application Factory
 # =============================================================================
@@ -100,45 +200,70 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # ==========================================================================
     # Middleware
     # ==========================================================================
     
-    # CORS middleware
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=CORS_ORIGINS,
-        allow_credentials=True,
-        allow_methods=CORS_METHODS,
-        allow_headers=CORS_HEADERS,
-    )
+    # CORS middleware (only when cross-origin clients are configured)
+    if CORS_ORIGINS:
+        app.add_middleware(
+            CachedPreflightCORSMiddleware,
+            allow_origins=CORS_ORIGINS,
+            allow_credentials=True,
+            allow_methods=CORS_METHODS,
+            allow_headers=CORS_HEADERS,
+        )
     
     # ==========================================================================
     # Exception Handlers
     # ==========================================================================
     
+    @app.exception_handler(StarletteHTTPException)
+    async def http_exception_handler(
+        request: Request,
+        exc: StarletteHTTPException
+    ) -> Response:
+        """Render HTTPException details with orjson (same shape as FastAPI's)."""
+        headers = getattr(exc, "headers", None)
+        if not is_body_allowed_for_status_code(exc.status_code):
+            return Response(status_code=exc.status_code, headers=headers)
+        return ORJSONResponse(
+            status_code=exc.status_code,
+            content={"detail": exc.detail},
+            headers=headers
+        )
+    
+    @app.exception_handler(RequestValidationError)
+    async def request_validation_error_handler(
+        request: Request,
+        exc: RequestValidationError
+    ) -> ORJSONResponse:
+        """Render request validation errors with orjson (same shape as FastAPI's)."""
+        return ORJSONResponse(
+            status_code=422,
+            content={"detail": jsonable_encoder(exc.errors())}
+        )
+    
     @app.exception_handler(AgentFlowError)
     async def agentflow_error_handler(
         request: Request,
         exc: AgentFlowError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle AgentFlow custom exceptions."""
-        logger.error(
-            "agentflow_error",
-            error_type=type(exc).__name__,
-            message=str(exc),
-            path=request.url.path
-        )
+        error_type = type(exc).__name__
+        message = str(exc)
+        record_error("agentflow_error", exc, with_traceback=False, path=request.url.path)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={
                 "error": {
-                    "type": type(exc).__name__,
-                    "message": str(exc),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "type": error_type,
+                    "message": message,
+                    "timestamp": utc_now_iso()
                 }
             }
         )
@@ -147,22 +272,17 @@ def create_app() -> FastAPI:
     async def general_exception_handler(
         request: Request,
         exc: Exception
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle unexpected exceptions."""
-        logger.exception(
-            "unexpected_error",
-            error_type=type(exc).__name__,
-            message=str(exc),
-            path=request.url.path
-        )
+        record_error("unexpected_error", exc, path=request.url.path)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": {
                     "type": "InternalServerError",
                     "message": "An unexpected error occurred",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": utc_now_iso()
                 }
             }
         )
@@ -189,6 +309,10 @@ def create_app() -> FastAPI:
         routes=["health", "workflows", "sources"]
     )
     
+    # Serve /openapi.json from pre-rendered bytes
+    if app.openapi_url:
+        _install_openapi_cache(app)
+    
     return app
 
 
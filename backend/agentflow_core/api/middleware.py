@@ -0,0 +1,54 @@
+"""
+AgentFlow Core - API Middleware
+
+Middleware specializations for the FastAPI application.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+
+
+# =============================================================================
+# CORS
+# =============================================================================
+
+# Distinct preflight requests remembered before the cache is reset
+PREFLIGHT_CACHE_SIZE = 256
+
+PreflightKey = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class CachedPreflightCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that reuses rendered preflight responses.
+
+    The CORS configuration is fixed at startup, so the preflight response
+    depends only on the request's origin, requested method, requested
+    headers and private-network flag. Browsers send the same few
+    combinations over and over; each is evaluated once and the rendered
+    response is replayed afterwards.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._preflight_cache: Dict[PreflightKey, Response] = {}
+
+    def preflight_response(self, request_headers: Headers) -> Response:
+        key = (
+            request_headers["origin"],
+            request_headers["access-control-request-method"],
+            request_headers.get("access-control-request-headers"),
+            request_headers.get("access-control-request-private-network"),
+        )
+
+        response = self._preflight_cache.get(key)
+        if response is None:
+            if len(self._preflight_cache) >= PREFLIGHT_CACHE_SIZE:
+                # Origins/headers are client-controlled, so keep the cache bounded
+                self._preflight_cache.clear()
+            response = super().preflight_response(request_headers)
+            self._preflight_cache[key] = response
+        return response
@@ -5,11 +5,13 @@ Pydantic models for WorkflowSpec and related components.
 These models provide type-safe validation for all workflow specifications.
 """
 
+import hashlib
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Set, Tuple, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
 
 
 # =============================================================================
@@ -17,28 +19,47 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 # =============================================================================
 
 
+# Interned plain-string values for runtime dispatch. Compare these against
+# `node.type.value` / `source.kind.value` instead of going through Enum __eq__;
+# the enums below are built from them and remain the API schema.
+NODE_TYPE_INPUT = sys.intern("input")
+NODE_TYPE_ROUTER = sys.intern("router")
+NODE_TYPE_LLM = sys.intern("llm")
+NODE_TYPE_IMAGE = sys.intern("image")
+NODE_TYPE_DB = sys.intern("db")
+NODE_TYPE_AGGREGATOR = sys.intern("aggregator")
+
+SOURCE_KIND_LLM = sys.intern("llm")
+SOURCE_KIND_IMAGE = sys.intern("image")
+SOURCE_KIND_DB = sys.intern("db")
+SOURCE_KIND_API = sys.intern("api")
+
+
 class NodeType(str, Enum):
     """Supported node types in AgentFlow workflows."""
-    INPUT = "input"
-    ROUTER = "router"
-    LLM = "llm"
-    IMAGE = "image"
-    DB = "db"
-    AGGREGATOR = "aggregator"
+    INPUT = NODE_TYPE_INPUT
+    ROUTER = NODE_TYPE_ROUTER
+    LLM = NODE_TYPE_LLM
+    IMAGE = NODE_TYPE_IMAGE
+    DB = NODE_TYPE_DB
+    AGGREGATOR = NODE_TYPE_AGGREGATOR
 
 
 class SourceKind(str, Enum):
     """Supported source kinds for external integrations."""
-    LLM = "llm"
-    IMAGE = "image"
-    DB = "db"
-    API = "api"
+    LLM = SOURCE_KIND_LLM
+    IMAGE = SOURCE_KIND_IMAGE
+    DB = SOURCE_KIND_DB
+    API = SOURCE_KIND_API
 
 
 # =============================================================================
 # Node Models
 # =============================================================================
 
+# Deletes the separators allowed in node IDs so the rest can be checked with isalnum()
+_NODE_ID_SEPARATORS = str.maketrans("", "", "_-")
+
 
 class NodeModel(BaseModel):
     """
@@ -60,7 +81,7 @@ class NodeModel(BaseModel):
     @classmethod
     def validate_id(cls, v: str) -> str:
         """Validate node ID format."""
-        if not v.replace("_", "").replace("-", "").isalnum():
+        if not v.translate(_NODE_ID_SEPARATORS).isalnum():
             raise ValueError("Node ID must be alphanumeric with underscores or hyphens")
         return v
 
@@ -103,6 +124,17 @@ class EdgeModel(BaseModel):
         elif not v:
             raise ValueError("Target node ID cannot be empty")
         return v
+    
+    @property
+    def targets(self) -> Tuple[str, ...]:
+        """
+        Target node ID(s) as a tuple, regardless of the wire format of `to`.
+        
+        Derived from `to` on each access rather than cached, so it follows
+        edits to the edge.
+        """
+        to = self.to
+        return (to,) if isinstance(to, str) else tuple(to)
 
 
 # =============================================================================
@@ -221,30 +253,47 @@ class WorkflowSpecModel(BaseModel):
     @model_validator(mode="after")
     def validate_workflow(self) -> "WorkflowSpecModel":
         """Validate workflow consistency."""
-        node_ids = {node.id for node in self.nodes}
+        node_ids = frozenset(node.id for node in self.nodes)
         
         # Validate start_node exists
         if self.start_node not in node_ids:
             raise ValueError(f"start_node '{self.start_node}' does not exist in nodes")
         
-        # Validate edge references
+        # Collect every node referenced by edges and queues in one pass
+        referenced: Set[str] = set()
+        for edge in self.edges:
+            referenced.add(edge.from_node)
+            referenced.update(edge.targets)
+        for queue in self.queues:
+            referenced.add(queue.from_node)
+            referenced.add(queue.to)
+        
+        # Single set comparison; only walk the references again to report an error
+        if not referenced <= node_ids:
+            raise ValueError(self._describe_missing_reference(node_ids))
+        
+        return self
+    
+    def _describe_missing_reference(self, node_ids: FrozenSet[str]) -> str:
+        """Build the error message for the first dangling edge/queue reference."""
         for edge in self.edges:
             if edge.from_node not in node_ids:
-                raise ValueError(f"Edge source '{edge.from_node}' does not exist in nodes")
+                return f"Edge source '{edge.from_node}' does not exist in nodes"
             
-            targets = edge.to if isinstance(edge.to, list) else [edge.to]
-            for target in targets:
+            for target in edge.targets:
                 if target not in node_ids:
-                    raise ValueError(f"Edge target '{target}' does not exist in nodes")
+                    return f"Edge target '{target}' does not exist in nodes"
         
-        # Validate queue references
         for queue in self.queues:
             if queue.from_node not in node_ids:
-                raise ValueError(f"Queue source '{queue.from_node}' does not exist in nodes")
+                return f"Queue source '{queue.from_node}' does not exist in nodes"
             if queue.to not in node_ids:
-                raise ValueError(f"Queue target '{queue.to}' does not exist in nodes")
+                return f"Queue target '{queue.to}' does not exist in nodes"
         
-        return self
+        return "Workflow references nodes that do not exist"
+    
+    # Lookups and the hash are not cached on the instance: the model is
+    # mutable, and a cached value would go stale if the spec were edited
     
     def get_node(self, node_id: str) -> Optional[NodeModel]:
         """Get a node by ID."""
@@ -259,6 +308,10 @@ class WorkflowSpecModel(BaseModel):
             if source.id == source_id:
                 return source
         return None
+    
+    def spec_hash(self) -> str:
+        """Hash the canonical JSON form of the specification."""
+        return hashlib.blake2b(self.model_dump_json().encode(), digest_size=16).hexdigest()
 
 
 # =============================================================================
@@ -287,7 +340,8 @@ class ExecuteResponse(BaseModel):
     
     Attributes:
         status: Execution status (success, error)
-        final_state: Final state after execution
+        final_state: Final state after execution (image results from
+            nodes with storage "file" hold a server-local `path`)
         execution_time_ms: Execution time in milliseconds
         tokens_used: Total tokens consumed (if applicable)
         cost: Estimated cost (if applicable)
@@ -354,3 +408,11 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error code")
     message: str = Field(..., description="Error message")
     context: Optional[Dict[str, Any]] = Field(default=None, description="Additional context")
+
+
+# =============================================================================
+# Request Adapters
+# =============================================================================
+
+# Built once at import so routes parsing raw bodies reuse compiled validators
+EXECUTE_REQUEST_ADAPTER: TypeAdapter[ExecuteRequest] = TypeAdapter(ExecuteRequest)
@@ -0,0 +1,232 @@
+"""
+AgentFlow Core - API Response Classes
+
+orjson-backed response classes used by the FastAPI application.
+Returning these directly from routes skips FastAPI's jsonable_encoder pass.
+"""
+
+import base64
+import hashlib
+from decimal import Decimal
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+    get_origin,
+)
+
+import orjson
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+from pydantic.fields import FieldInfo
+
+from agentflow_core.api.models.workflow_model import ExecuteResponse
+
+
+# =============================================================================
+# Serialization
+# =============================================================================
+
+# orjson handles datetime, date, UUID, Enum and dataclasses natively
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    """Serialize types that orjson does not support natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to JSON bytes using orjson.
+
+    Args:
+        content: JSON-compatible content (datetimes, enums and UUIDs allowed)
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+# =============================================================================
+# Response Classes
+# =============================================================================
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Used as the application's default response class. Routes on hot paths
+    return it directly so the content is serialized in a single C call.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# =============================================================================
+# Conditional Responses
+# =============================================================================
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Cache-Control for payloads that only change with a deploy
+STATIC_CACHE_CONTROL = "public, max-age=300"
+
+# Cache-Control for payloads that can change at any time but may be revalidated
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def compute_etag(payload: bytes) -> str:
+    """
+    Build a weak ETag for a rendered payload.
+    
+    Args:
+        payload: Response body bytes
+        
+    Returns:
+        Quoted weak entity tag, e.g. 'W/"1f2e..."'
+    """
+    return f'W/"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_json_response(
+    request: Request,
+    payload: bytes,
+    etag: Optional[str] = None,
+    cache_control: str = STATIC_CACHE_CONTROL
+) -> Response:
+    """
+    Return pre-rendered JSON, or 304 Not Modified when the client has it.
+    
+    Args:
+        request: Incoming request (for If-None-Match)
+        payload: Rendered JSON body
+        etag: Precomputed ETag for the payload (computed if omitted)
+        cache_control: Cache-Control header value
+        
+    Returns:
+        200 response with the payload, or an empty 304 response
+    """
+    if etag is None:
+        etag = compute_etag(payload)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+# =============================================================================
+# Schema-Specialized Serializers
+# =============================================================================
+
+ModelSerializer = Callable[[Mapping[str, Any]], bytes]
+
+
+def _compile_field_encoder(name: str, field: FieldInfo) -> Callable[[Any], bytes]:
+    """Pick an encoder for a field based on its declared annotation."""
+    if get_origin(field.annotation) is Literal:
+        # Closed set of values: every possible encoding is known up front
+        table = {value: dumps(value) for value in get_args(field.annotation)}
+
+        def encode_literal(value: Any) -> bytes:
+            try:
+                return table[value]
+            except KeyError:
+                raise ValueError(f"Invalid value for '{name}': {value!r}") from None
+
+        return encode_literal
+
+    return dumps
+
+
+def _compile_field_default(field: FieldInfo) -> Optional[Callable[[], bytes]]:
+    """Pre-render a field's default, deferring to its factory when it has one."""
+    if field.is_required():
+        return None
+    if field.default_factory is not None:
+        factory = field.default_factory
+        return lambda: dumps(factory())
+    rendered = dumps(field.default)
+    return lambda: rendered
+
+
+def compile_model_serializer(model: Type[BaseModel]) -> ModelSerializer:
+    """
+    Compile a JSON serializer specialized to a model's fixed field layout.
+
+    Keys are pre-encoded and each field gets its encoder chosen once, so
+    serializing a payload is a single pass that concatenates bytes without
+    Pydantic's per-field type dispatch.
+
+    Args:
+        model: Pydantic model class describing the response shape
+
+    Returns:
+        Callable that renders a mapping of field values to JSON bytes.
+        Missing optional fields are rendered with the model's defaults.
+
+    Example:
+        >>> serialize = compile_model_serializer(ExecuteResponse)
+        >>> serialize({"status": "success", "final_state": {}})
+        b'{"status":"success","final_state":{},...}'
+    """
+    plan: List[Tuple[str, bytes, Callable[[Any], bytes], Optional[Callable[[], bytes]]]] = []
+    for name, field in model.model_fields.items():
+        key = field.serialization_alias or field.alias or name
+        plan.append((
+            name,
+            dumps(key) + b":",
+            _compile_field_encoder(name, field),
+            _compile_field_default(field),
+        ))
+
+    def serialize(values: Mapping[str, Any]) -> bytes:
+        parts: List[bytes] = []
+        for name, prefix, encode, default in plan:
+            if name in values:
+                parts.append(prefix + encode(values[name]))
+            elif default is None:
+                raise ValueError(f"Missing required field '{name}' for {model.__name__}")
+            else:
+                parts.append(prefix + default())
+        return b"{" + b",".join(parts) + b"}"
+
+    serialize.__name__ = f"serialize_{model.__name__}"
+    return serialize
+
+
+serialize_execute_response = compile_model_serializer(ExecuteResponse)
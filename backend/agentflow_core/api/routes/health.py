@@ -4,17 +4,59 @@ AgentFlow Core - Health Check Routes
 Health and readiness endpoints for monitoring.
 """
 
-from datetime import datetime
-from typing import Any, Dict
+import time
+from typing import Dict, Tuple
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, Response, status
 
+from agentflow_core.api.responses import JSON_MEDIA_TYPE, ORJSONResponse, dumps
+from agentflow_core.utils.clock import utc_now_iso
 from agentflow_core.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 # Create router
-router = APIRouter(tags=["health"])
+router = APIRouter(tags=["health"], default_response_class=ORJSONResponse)
+
+
+# =============================================================================
+# Precomputed Payloads
+# =============================================================================
+
+# Seconds a rendered /health payload (and its timestamp) is reused
+HEALTH_PAYLOAD_TTL = 1.0
+
+_ROOT_BYTES = dumps({
+    "service": "AgentFlow Core",
+    "version": "1.0.0",
+    "description": "Multi-Agent Workflow Orchestration Engine",
+    "docs": "/docs",
+    "health": "/health"
+})
+
+_LIVE_BYTES = dumps({"status": "alive"})
+
+# (expires_at, payload) keyed on time.monotonic()
+_health_payload: Tuple[float, bytes] = (0.0, b"")
+
+# Seconds cached readiness checks are trusted before being re-evaluated
+READY_CHECKS_TTL = 5.0
+
+
+def _get_health_bytes() -> bytes:
+    """Return the /health payload, re-rendering at most once per TTL."""
+    global _health_payload
+    
+    now = time.monotonic()
+    expires_at, payload = _health_payload
+    if now >= expires_at:
+        payload = dumps({
+            "status": "healthy",
+            "timestamp": utc_now_iso(),
+            "service": "agentflow-core"
+        })
+        _health_payload = (now + HEALTH_PAYLOAD_TTL, payload)
+    return payload
 
 
 # =============================================================================
@@ -28,18 +70,17 @@ router = APIRouter(tags=["health"])
     summary="Health check",
     description="Returns the health status of the service.",
 )
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """
     Basic health check endpoint.
     
+    The payload is cached for HEALTH_PAYLOAD_TTL seconds, so the
+    timestamp has that resolution.
+    
     Returns:
         Health status with timestamp
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "service": "agentflow-core"
-    }
+    return Response(content=_get_health_bytes(), media_type=JSON_MEDIA_TYPE)
 
 
 @router.get(
@@ -47,15 +88,17 @@ async def health_check() -> Dict[str, Any]:
     status_code=status.HTTP_200_OK,
     summary="Liveness probe",
     description="Kubernetes liveness probe - returns 200 if the service is alive.",
+    response_class=ORJSONResponse,
+    include_in_schema=False,
 )
-async def liveness_probe() -> Dict[str, str]:
+async def liveness_probe() -> Response:
     """
     Kubernetes liveness probe.
     
     Returns:
         Simple ok status
     """
-    return {"status": "alive"}
+    return Response(content=_LIVE_BYTES, media_type=JSON_MEDIA_TYPE)
 
 
 @router.get(
@@ -63,28 +106,28 @@ async def liveness_probe() -> Dict[str, str]:
     status_code=status.HTTP_200_OK,
     summary="Readiness probe",
     description="Kubernetes readiness probe - returns 200 if the service is ready to accept traffic.",
+    response_class=ORJSONResponse,
+    include_in_schema=False,
 )
-async def readiness_probe() -> Dict[str, Any]:
+async def readiness_probe(request: Request) -> ORJSONResponse:
     """
     Kubernetes readiness probe.
     
-    Checks if all dependencies are available.
+    Checks if all dependencies are available. Results are computed at
+    startup and refreshed at most once per READY_CHECKS_TTL.
     
     Returns:
         Readiness status with dependency checks
     """
-    checks = {
-        "langgraph": _check_langgraph(),
-        "runtime_registry": _check_registry(),
-    }
+    checks = _get_ready_checks(request)
     
     all_ready = all(checks.values())
     
-    return {
+    return ORJSONResponse(content={
         "status": "ready" if all_ready else "not_ready",
         "checks": checks,
-        "timestamp": datetime.utcnow().isoformat()
-    }
+        "timestamp": utc_now_iso()
+    })
 
 
 @router.get(
@@ -93,20 +136,14 @@ async def readiness_probe() -> Dict[str, Any]:
     summary="Root endpoint",
     description="Returns basic service information.",
 )
-async def root() -> Dict[str, Any]:
+async def root() -> Response:
     """
     Root endpoint with service information.
     
     Returns:
         Service name and version
     """
-    return {
-        "service": "AgentFlow Core",
-        "version": "1.0.0",
-        "description": "Multi-Agent Workflow Orchestration Engine",
-        "docs": "/docs",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BYTES, media_type=JSON_MEDIA_TYPE)
 
 
 # =============================================================================
@@ -114,6 +151,30 @@ async def root() -> Dict[str, Any]:
 # =============================================================================
 
 
+def run_readiness_checks() -> Dict[str, bool]:
+    """
+    Evaluate all readiness dependency checks.
+    
+    Returns:
+        Mapping of dependency name to availability
+    """
+    return {
+        "langgraph": _check_langgraph(),
+        "runtime_registry": _check_registry(),
+    }
+
+
+def _get_ready_checks(request: Request) -> Dict[str, bool]:
+    """Read cached readiness checks from app state, refreshing when stale."""
+    state = request.app.state
+    now = time.monotonic()
+    cached = getattr(state, "ready_checks", None)
+    if cached is None or now - cached[0] >= READY_CHECKS_TTL:
+        cached = (now, run_readiness_checks())
+        state.ready_checks = cached
+    return cached[1]
+
+
 def _check_langgraph() -> bool:
     """Check if LangGraph is available."""
     try:
@@ -126,8 +187,8 @@ def _check_langgraph() -> bool:
 def _check_registry() -> bool:
     """Check if runtime registry is functioning."""
     try:
-        from agentflow_core.runtime.registry import get_all_sources
-        get_all_sources()
+        from agentflow_core.runtime.registry import list_sources
+        list_sources()
         return True
     except Exception:
         return False
@@ -4,11 +4,22 @@ AgentFlow Core - Sources API Routes
 REST API endpoints for source configuration management.
 """
 
-from typing import Any, Dict, List
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from starlette.concurrency import run_in_threadpool
 
 from agentflow_core.api.models.workflow_model import SourceModel
+from agentflow_core.api.responses import (
+    REVALIDATE_CACHE_CONTROL,
+    ORJSONResponse,
+    compute_etag,
+    conditional_json_response,
+    dumps,
+)
 from agentflow_core.runtime.registry import (
     reset_registry,
     list_sources as get_all_sources,
@@ -16,7 +27,14 @@ from agentflow_core.runtime.registry import (
     register_source,
     unregister_source,
 )
-from agentflow_core.sources import SOURCE_FACTORIES, create_source_client
+from agentflow_core.sources import (
+    POSTGRES_KINDS,
+    SOURCE_FACTORIES,
+    clear_source_client_cache,
+    evict_source_client,
+    get_cached_source_client,
+)
+from agentflow_core.utils.error_handler import SourceNotFoundError
 from agentflow_core.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,35 +43,112 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/sources", tags=["sources"])
 
 
+# =============================================================================
+# Sensitive Data Masking
+# =============================================================================
+
+# Keys whose values are never returned to clients (matched case-insensitively)
+_SENSITIVE_KEY_RE = re.compile(
+    r"api_key|password|secret|token|connection_string|credentials",
+    re.IGNORECASE
+)
+
+# Exact (lowercased) key names, checked before falling back to the regex
+_SENSITIVE_KEYS = frozenset({
+    "api_key", "password", "secret", "token", "connection_string", "credentials",
+})
+
+MASKED_VALUE = "***MASKED***"
+
+
+@lru_cache(maxsize=1024)
+def _is_sensitive_key(key: str) -> bool:
+    """
+    Check whether a config key holds a sensitive value.
+    
+    Well-known names hit the frozenset; anything else (e.g. `openai_api_key`)
+    goes through the substring regex. Config keys come from a small, recurring
+    vocabulary, so results are memoized per key.
+    """
+    return key.lower() in _SENSITIVE_KEYS or _SENSITIVE_KEY_RE.search(key) is not None
+
+
+# =============================================================================
+# Static Payloads
+# =============================================================================
+
+# Frozen and rendered once at import; the catalog only changes with the code
+_AVAILABLE_TYPES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "llm": MappingProxyType({
+        "name": "Gemini LLM",
+        "description": "Google Gemini language model for text generation",
+        "required_config": ("api_key_env",),
+        "optional_config": ("model", "temperature", "max_tokens")
+    }),
+    "image": MappingProxyType({
+        "name": "Gemini Image",
+        "description": "Google Imagen for image generation",
+        "required_config": ("api_key_env",),
+        "optional_config": ("size", "quality")
+    }),
+    "db": MappingProxyType({
+        "name": "PostgreSQL Database",
+        "description": "PostgreSQL database for data queries",
+        "required_config": ("connection_string_env",),
+        "optional_config": ("pool_size", "timeout")
+    }),
+    "api": MappingProxyType({
+        "name": "HTTP API",
+        "description": "Generic HTTP API client",
+        "required_config": ("base_url",),
+        "optional_config": ("headers", "auth_type", "timeout")
+    })
+})
+
+_AVAILABLE_TYPES_PAYLOAD = dumps({
+    "types": _AVAILABLE_TYPES,
+    "count": len(_AVAILABLE_TYPES)
+})
+
+_AVAILABLE_TYPES_ETAG = compute_etag(_AVAILABLE_TYPES_PAYLOAD)
+
+
 # =============================================================================
 # Source Management Endpoints
 # =============================================================================
 
+# Handlers that touch the registry or source clients are plain `def`, so
+# FastAPI runs them on the threadpool; the registry is lock-protected.
+
 
 @router.get(
     "/",
     summary="List registered sources",
     description="Returns a list of all registered source configurations.",
 )
-async def list_sources_endpoint() -> Dict[str, Any]:
+def list_sources_endpoint(request: Request) -> Response:
     """
     List all registered sources.
     
+    The registry can change at any time, so clients must revalidate, but
+    an unchanged listing is answered with 304 Not Modified.
+    
     Returns:
         Dictionary with source IDs and their configurations
     """
-    sources = get_all_sources()
-    
     # Mask sensitive data - sources is a list of dicts with 'id' key
-    masked_sources = {}
-    for source in sources:
-        source_id = source.get("id", "unknown")
-        masked_sources[source_id] = _mask_sensitive_config(source)
+    masked_sources = {
+        source.get("id", "unknown"): _mask_sensitive_config(source)
+        for source in get_all_sources()
+    }
     
-    return {
+    payload = dumps({
         "sources": masked_sources,
         "count": len(masked_sources)
-    }
+    })
+    return conditional_json_response(
+        request, payload, cache_control=REVALIDATE_CACHE_CONTROL
+    )
 
 
 @router.get(
@@ -61,7 +156,7 @@ async def list_sources_endpoint() -> Dict[str, Any]:
     summary="Get source configuration",
     description="Returns the configuration for a specific source.",
 )
-async def get_source_config(source_id: str) -> Dict[str, Any]:
+def get_source_config(source_id: str) -> ORJSONResponse:
     """
     Get a specific source configuration.
     
@@ -73,7 +168,7 @@ async def get_source_config(source_id: str) -> Dict[str, Any]:
     """
     try:
         config = get_source(source_id)
-        return _mask_sensitive_config(config)
+        return ORJSONResponse(content=_mask_sensitive_config(config))
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -87,10 +182,13 @@ async def get_source_config(source_id: str) -> Dict[str, Any]:
     summary="Register a source",
     description="Registers a new source configuration.",
 )
-async def register_source_endpoint(source: SourceModel) -> Dict[str, Any]:
+def register_source_endpoint(source: SourceModel) -> Dict[str, Any]:
     """
     Register a new source configuration.
     
+    Database sources get their connection pool opened here, so later
+    connection tests and queries only check out a pooled connection.
+    
     Args:
         source: Source configuration
         
@@ -98,11 +196,28 @@ async def register_source_endpoint(source: SourceModel) -> Dict[str, Any]:
         Registration confirmation
     """
     try:
+        try:
+            previous = get_source(source.id)
+        except SourceNotFoundError:
+            previous = None
+        
         # Register in the registry
-        register_source(source.id, source.model_dump())
+        config = source.model_dump()
+        register_source(source.id, config)
+        
+        # A replaced configuration must not keep its old pool alive
+        if previous is not None and previous != config:
+            evict_source_client(previous.get("kind", "unknown"), previous.get("config", previous))
         
         logger.info("source_registered", source_id=source.id, kind=source.kind)
         
+        if config["kind"] in POSTGRES_KINDS:
+            try:
+                get_cached_source_client(config["kind"], config["config"])
+            except Exception as e:
+                # Registration still succeeds; the test endpoint reports the failure
+                logger.warning("source_pool_warmup_failed", source_id=source.id, error=str(e))
+        
         return {
             "status": "registered",
             "source_id": source.id,
@@ -121,7 +236,7 @@ async def register_source_endpoint(source: SourceModel) -> Dict[str, Any]:
     summary="Unregister a source",
     description="Removes a source configuration from the registry.",
 )
-async def unregister_source_endpoint(source_id: str) -> Dict[str, Any]:
+def unregister_source_endpoint(source_id: str) -> Dict[str, Any]:
     """
     Unregister a source configuration.
     
@@ -132,8 +247,17 @@ async def unregister_source_endpoint(source_id: str) -> Dict[str, Any]:
         Confirmation message
     """
     try:
+        try:
+            config = get_source(source_id)
+        except SourceNotFoundError:
+            config = None
+        
         unregister_source(source_id)
         
+        # Release any client kept alive by connection tests
+        if config is not None:
+            evict_source_client(config.get("kind", "unknown"), config.get("config", config))
+        
         logger.info("source_unregistered", source_id=source_id)
         
         return {
@@ -174,13 +298,16 @@ async def test_source_connection(source_id: str) -> Dict[str, Any]:
     kind = config.get("kind", "unknown")
     
     try:
-        # Attempt to create client
-        client = create_source_client(kind, config.get("config", config))
+        # Client creation and connection tests do blocking I/O, so they run
+        # on the threadpool instead of stalling the event loop
+        client = await run_in_threadpool(
+            get_cached_source_client, kind, config.get("config", config)
+        )
         
         # Test based on source type
-        if kind in ("db", "postgres", "postgresql"):
+        if kind in POSTGRES_KINDS:
             from agentflow_core.sources import test_postgres_connection
-            success = test_postgres_connection(client)
+            success = await run_in_threadpool(test_postgres_connection, client)
         else:
             # For other types, client creation success is enough
             success = True
@@ -206,7 +333,7 @@ async def test_source_connection(source_id: str) -> Dict[str, Any]:
     summary="Clear all sources",
     description="Removes all source configurations from the registry.",
 )
-async def clear_all_sources() -> Dict[str, Any]:
+def clear_all_sources() -> Dict[str, Any]:
     """
     Clear all registered sources.
     
@@ -214,6 +341,7 @@ async def clear_all_sources() -> Dict[str, Any]:
         Confirmation message
     """
     reset_registry()
+    clear_source_client_cache()
     
     logger.info("all_sources_cleared")
     
@@ -233,44 +361,16 @@ async def clear_all_sources() -> Dict[str, Any]:
     summary="Get available source types",
     description="Returns a list of all available source types that can be configured.",
 )
-async def get_available_source_types() -> Dict[str, Any]:
+async def get_available_source_types(request: Request) -> Response:
     """
     Get available source types.
     
+    Supports conditional requests via ETag / If-None-Match.
+    
     Returns:
         List of available source types with descriptions
     """
-    types = {
-        "llm": {
-            "name": "Gemini LLM",
-            "description": "Google Gemini language model for text generation",
-            "required_config": ["api_key_env"],
-            "optional_config": ["model", "temperature", "max_tokens"]
-        },
-        "image": {
-            "name": "Gemini Image",
-            "description": "Google Imagen for image generation",
-            "required_config": ["api_key_env"],
-            "optional_config": ["size", "quality"]
-        },
-        "db": {
-            "name": "PostgreSQL Database",
-            "description": "PostgreSQL database for data queries",
-            "required_config": ["connection_string_env"],
-            "optional_config": ["pool_size", "timeout"]
-        },
-        "api": {
-            "name": "HTTP API",
-            "description": "Generic HTTP API client",
-            "required_config": ["base_url"],
-            "optional_config": ["headers", "auth_type", "timeout"]
-        }
-    }
-    
-    return {
-        "types": types,
-        "count": len(types)
-    }
+    return conditional_json_response(request, _AVAILABLE_TYPES_PAYLOAD, _AVAILABLE_TYPES_ETAG)
 
 
 # =============================================================================
@@ -282,28 +382,27 @@ def _mask_sensitive_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Mask sensitive configuration values.
     
+    Configurations without sensitive keys are returned as-is rather than
+    copied, so callers must treat the result as read-only.
+    
     Args:
         config: Configuration dictionary
         
     Returns:
         Configuration with sensitive values masked
     """
-    sensitive_keys = [
-        "api_key", "password", "secret", "token",
-        "connection_string", "credentials"
-    ]
-    
-    masked = dict(config)
+    # Handle nested config
+    nested = config.get("config")
+    masked_nested = _mask_sensitive_config(nested) if isinstance(nested, dict) else nested
     
-    for key in list(masked.keys()):
-        lower_key = key.lower()
-        for sensitive in sensitive_keys:
-            if sensitive in lower_key:
-                masked[key] = "***MASKED***"
-                break
+    if masked_nested is nested and not any(map(_is_sensitive_key, config)):
+        return config
     
-    # Handle nested config
-    if "config" in masked and isinstance(masked["config"], dict):
-        masked["config"] = _mask_sensitive_config(masked["config"])
+    masked = {
+        key: MASKED_VALUE if _is_sensitive_key(key) else value
+        for key, value in config.items()
+    }
+    if masked_nested is not nested:
+        masked["config"] = masked_nested
     
     return masked
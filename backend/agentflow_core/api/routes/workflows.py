@@ -4,27 +4,224 @@ AgentFlow Core - Workflow API Routes
 REST API endpoints for workflow validation, execution, and management.
 """
 
-from typing import Any, Dict, List, Optional
+import os
+from collections import OrderedDict
+from functools import cache
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+from starlette.concurrency import run_in_threadpool
 
 from agentflow_core.api.models.workflow_model import (
-    ExecuteRequest,
+    EXECUTE_REQUEST_ADAPTER,
     ExecuteResponse,
     ValidationResult,
     WorkflowSpecModel,
 )
-from agentflow_core.runtime.builder import build_graph_from_json
-from agentflow_core.runtime.executor import create_execution_result, run_workflow
-from agentflow_core.runtime.validator import validate_workflow
+from agentflow_core.api.responses import (
+    compute_etag,
+    conditional_json_response,
+    dumps,
+    serialize_execute_response,
+)
+from agentflow_core.nodes import NODE_FACTORIES
+from agentflow_core.sources import SOURCE_FACTORIES
+from agentflow_core.runtime.validator import ValidationError, validate_workflow
 from agentflow_core.utils.id_generator import generate_workflow_id
-from agentflow_core.utils.logger import get_logger, log_workflow_event
+from agentflow_core.utils.logger import get_logger, is_log_enabled, log_workflow_event
 
 logger = get_logger(__name__)
 
 # Create router
 router = APIRouter(prefix="/workflows", tags=["workflows"])
 
+T = TypeVar("T")
+
+# Run workflows on the event loop with async LLM/image nodes instead of
+# one threadpool thread per execution
+ASYNC_EXECUTION = os.getenv("AGENTFLOW_ASYNC_EXECUTION", "0") == "1"
+
+
+@cache
+def _load_graph_runtime() -> Tuple[Callable[..., Any], Callable[..., Any], Callable[..., Any]]:
+    """
+    Import the LangGraph-backed builder and executor on first use.
+    
+    Keeps LangGraph out of the import path of processes that never
+    build or run a workflow (e.g. probe-only replicas).
+    
+    Returns:
+        Tuple of (build_graph_from_json, build_graph_cached, run_workflow);
+        the runner is run_workflow_async when ASYNC_EXECUTION is enabled
+    """
+    from agentflow_core.runtime.builder import build_graph_cached, build_graph_from_json
+    from agentflow_core.runtime.executor import run_workflow, run_workflow_async
+    
+    return (
+        build_graph_from_json,
+        build_graph_cached,
+        run_workflow_async if ASYNC_EXECUTION else run_workflow,
+    )
+
+
+# =============================================================================
+# Static Payloads
+# =============================================================================
+
+# The type catalogs only change with the code, so they are frozen and
+# rendered once at import
+_NODE_TYPE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "input": "Entry point node that accepts user input",
+    "router": "Conditional routing based on intent classification",
+    "llm": "Language model node for text generation",
+    "image": "Image generation node",
+    "db": "Database query node (read-only)",
+    "aggregator": "Combines results from multiple nodes",
+})
+
+_SOURCE_TYPE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "llm": "Google Gemini language model",
+    "gemini": "Google Gemini language model",
+    "image": "Google Imagen/Gemini image generation",
+    "imagen": "Google Imagen image generation",
+    "db": "PostgreSQL database",
+    "postgres": "PostgreSQL database",
+    "api": "HTTP API client",
+    "http": "HTTP API client",
+})
+
+_NODE_TYPES_PAYLOAD = dumps({
+    "node_types": tuple(NODE_FACTORIES),
+    "descriptions": _NODE_TYPE_DESCRIPTIONS,
+})
+
+_SOURCE_TYPES_PAYLOAD = dumps({
+    "source_types": tuple(sorted(SOURCE_FACTORIES)),
+    "descriptions": _SOURCE_TYPE_DESCRIPTIONS,
+})
+
+_NODE_TYPES_ETAG = compute_etag(_NODE_TYPES_PAYLOAD)
+_SOURCE_TYPES_ETAG = compute_etag(_SOURCE_TYPES_PAYLOAD)
+
+
+# =============================================================================
+# Request Parsing
+# =============================================================================
+
+
+async def _parse_json_body(request: Request, adapter: TypeAdapter[T]) -> T:
+    """
+    Validate a request body straight from its raw bytes.
+    
+    Parsing and validation happen in a single pass inside pydantic-core,
+    skipping FastAPI's intermediate dict decode. Failures are reported as
+    RequestValidationError so clients get the usual 422 response.
+    
+    Args:
+        request: Incoming request
+        adapter: Module-level TypeAdapter describing the body
+        
+    Returns:
+        Validated body
+    """
+    body = await request.body()
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    
+    try:
+        return adapter.validate_json(body)
+    except PydanticValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ],
+            body=body
+        )
+
+
+def _json_body_openapi(adapter: TypeAdapter[Any]) -> Dict[str, Any]:
+    """
+    Describe a manually parsed request body for the OpenAPI schema.
+    
+    Nested model definitions are inlined because they are not otherwise
+    registered as components.
+    
+    Args:
+        adapter: TypeAdapter describing the body
+        
+    Returns:
+        Value for the route's openapi_extra
+    """
+    schema = adapter.json_schema()
+    definitions = schema.pop("$defs", {})
+    
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if ref is not None:
+                return inline(definitions[ref.rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+    
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": inline(schema)}},
+        }
+    }
+
+
+# =============================================================================
+# Validation Cache
+# =============================================================================
+
+# Maximum number of spec validation results kept (oldest evicted first)
+VALIDATION_CACHE_SIZE = 1024
+
+# spec hash -> validation errors for that spec
+_validation_cache: "OrderedDict[str, Tuple[ValidationError, ...]]" = OrderedDict()
+_validation_cache_lock = Lock()
+
+
+def _validate_workflow_cached(spec: WorkflowSpecModel, spec_hash: str) -> List[ValidationError]:
+    """
+    Validate a workflow, reusing the result for a previously seen spec.
+    
+    Validation is a pure function of the spec, so the validate, build and
+    execute endpoints share results: a spec validated by the editor is not
+    walked again when it is executed.
+    
+    Args:
+        spec: Workflow specification to validate
+        spec_hash: Hash of the specification from spec.spec_hash()
+        
+    Returns:
+        List of validation errors (empty if valid)
+    """
+    with _validation_cache_lock:
+        cached = _validation_cache.get(spec_hash)
+    if cached is not None:
+        return list(cached)
+    
+    errors = validate_workflow(spec)
+    
+    with _validation_cache_lock:
+        _validation_cache[spec_hash] = tuple(errors)
+        while len(_validation_cache) > VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+    
+    return errors
+
 
 # =============================================================================
 # Validation Endpoints
@@ -59,18 +256,20 @@ async def validate_workflow_endpoint(
     try:
         # Generate a temporary workflow ID for logging
         workflow_id = spec.name or generate_workflow_id()
+        log_enabled = is_log_enabled()
         
-        log_workflow_event(
-            "workflow_validation_requested",
-            workflow_id,
-            node_count=len(spec.nodes),
-            edge_count=len(spec.edges)
-        )
+        if log_enabled:
+            log_workflow_event(
+                "workflow_validation_requested",
+                workflow_id,
+                node_count=len(spec.nodes),
+                edge_count=len(spec.edges)
+            )
         
         # Run validation
-        errors = validate_workflow(spec)
+        errors = _validate_workflow_cached(spec, spec.spec_hash())
         
-        logger.info(f"Validation completed with {len(errors)} errors")
+        logger.info("Validation completed with %d errors", len(errors))
         
         if errors:
             log_workflow_event(
@@ -79,35 +278,14 @@ async def validate_workflow_endpoint(
                 error_count=len(errors)
             )
             
-            # Convert ValidationError objects to ValidationErrorModel objects
-            error_models = []
-            for error in errors:
-                try:
-                    if hasattr(error, 'model_dump'):
-                        error_models.append(error.model_dump())
-                    else:
-                        # Fallback: create ValidationErrorModel manually
-                        error_models.append({
-                            "type": getattr(error, 'type', 'unknown'),
-                            "message": getattr(error, 'message', str(error)),
-                            "node_id": getattr(error, 'node_id', None),
-                            "field": getattr(error, 'field', None)
-                        })
-                except Exception as e:
-                    logger.error(f"Error converting validation error: {e}")
-                    error_models.append({
-                        "type": "conversion_error",
-                        "message": f"Failed to convert error: {str(error)}",
-                        "node_id": None,
-                        "field": None
-                    })
-            
+            # validate_workflow() returns ValidationError models, which dump directly
             return ValidationResult(
                 valid=False,
-                errors=error_models
+                errors=[error.model_dump() for error in errors]
             )
         
-        log_workflow_event("workflow_validation_passed", workflow_id)
+        if log_enabled:
+            log_workflow_event("workflow_validation_passed", workflow_id)
         
         return ValidationResult(
             valid=True,
@@ -115,7 +293,7 @@ async def validate_workflow_endpoint(
         )
         
     except Exception as e:
-        logger.error(f"Unexpected error in validate_workflow_endpoint: {e}", exc_info=True)
+        logger.error("Unexpected error in validate_workflow_endpoint: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -135,10 +313,11 @@ async def validate_workflow_endpoint(
     response_model=ExecuteResponse,
     summary="Execute a workflow",
     description="Validates and executes a workflow with the provided initial state.",
+    openapi_extra=_json_body_openapi(EXECUTE_REQUEST_ADAPTER),
 )
 async def execute_workflow_endpoint(
-    request: ExecuteRequest
-) -> ExecuteResponse:
+    raw_request: Request
+) -> Response:
     """
     Execute a workflow with initial state.
     
@@ -149,30 +328,35 @@ async def execute_workflow_endpoint(
     4. Returns the final state and execution metadata
     
     Args:
-        request: ExecuteRequest with workflow and initial_state
+        raw_request: Request whose JSON body is an ExecuteRequest
         
     Returns:
-        ExecuteResponse with status, final_state, and execution metadata
+        ExecuteResponse JSON with status, final_state, and execution metadata,
+        rendered by the schema-specialized serializer
         
     Raises:
         HTTPException: 400 if validation fails
         HTTPException: 500 if execution fails
     """
+    request = await _parse_json_body(raw_request, EXECUTE_REQUEST_ADAPTER)
     workflow = request.workflow
     initial_state = request.initial_state
     
     # Use workflow name or generate ID for logging
     workflow_id = workflow.name or generate_workflow_id()
+    log_enabled = is_log_enabled()
     
-    log_workflow_event(
-        "workflow_execution_requested",
-        workflow_id,
-        node_count=len(workflow.nodes),
-        edge_count=len(workflow.edges)
-    )
+    if log_enabled:
+        log_workflow_event(
+            "workflow_execution_requested",
+            workflow_id,
+            node_count=len(workflow.nodes),
+            edge_count=len(workflow.edges)
+        )
     
     # Step 1: Validate workflow
-    errors = validate_workflow(workflow)
+    spec_hash = workflow.spec_hash()
+    errors = _validate_workflow_cached(workflow, spec_hash)
     if errors:
         log_workflow_event(
             "workflow_execution_rejected",
@@ -189,9 +373,13 @@ async def execute_workflow_endpoint(
             }
         )
     
-    # Step 2: Build graph
+    _, build_graph_cached, run_workflow = _load_graph_runtime()
+    
+    # Step 2: Build graph (compiled graphs are shared across identical specs)
     try:
-        graph = build_graph_from_json(workflow)
+        graph = await run_in_threadpool(
+            build_graph_cached, workflow, async_nodes=ASYNC_EXECUTION, spec_hash=spec_hash
+        )
     except Exception as e:
         log_workflow_event(
             "workflow_build_failed",
@@ -209,23 +397,40 @@ async def execute_workflow_endpoint(
     
     # Step 3: Execute workflow
     try:
-        final_state = run_workflow(
-            graph=graph,
-            initial_state=initial_state,
-            workflow_id=workflow.name or "unnamed"
-        )
+        if ASYNC_EXECUTION:
+            final_state = await run_workflow(
+                graph=graph,
+                initial_state=initial_state,
+                workflow_id=workflow.name or "unnamed"
+            )
+        else:
+            # Graph execution blocks (LLM/DB calls), so keep it off the event loop
+            final_state = await run_in_threadpool(
+                run_workflow,
+                graph=graph,
+                initial_state=initial_state,
+                workflow_id=workflow.name or "unnamed"
+            )
         
-        log_workflow_event(
-            "workflow_execution_completed",
-            workflow_id,
-            tokens_used=final_state.get("tokens_used", 0)
-        )
+        tokens_used = final_state.get("tokens_used", 0)
+        execution_time_ms = final_state.get("metadata", {}).get("execution_time_ms", 0)
+        
+        if log_enabled:
+            log_workflow_event(
+                "workflow_execution_completed",
+                workflow_id,
+                tokens_used=tokens_used
+            )
         
-        return ExecuteResponse(
-            status="success",
-            final_state=dict(final_state),
-            execution_time_ms=final_state.get("metadata", {}).get("execution_time_ms", 0),
-            tokens_used=final_state.get("tokens_used", 0)
+        # final_state is serialized in place; the state is not copied first
+        return Response(
+            content=serialize_execute_response({
+                "status": "success",
+                "final_state": final_state,
+                "execution_time_ms": execution_time_ms,
+                "tokens_used": tokens_used,
+            }),
+            media_type="application/json"
         )
         
     except Exception as e:
@@ -270,7 +475,7 @@ async def build_workflow_endpoint(
         Dictionary with build information
     """
     # Validate first
-    errors = validate_workflow(spec)
+    errors = _validate_workflow_cached(spec, spec.spec_hash())
     if errors:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -281,8 +486,9 @@ async def build_workflow_endpoint(
         )
     
     # Build graph
+    build_graph_from_json, _, _ = _load_graph_runtime()
     try:
-        graph = build_graph_from_json(spec, register_sources=False)
+        await run_in_threadpool(build_graph_from_json, spec, register_sources=False)
         
         return {
             "status": "success",
@@ -307,26 +513,16 @@ async def build_workflow_endpoint(
     summary="Get available node types",
     description="Returns a list of all available node types.",
 )
-async def get_node_types() -> Dict[str, Any]:
+async def get_node_types(request: Request) -> Response:
     """
     Get available node types.
     
+    Supports conditional requests via ETag / If-None-Match.
+    
     Returns:
         Dictionary with node types and descriptions
     """
-    from agentflow_core.nodes import NODE_FACTORIES
-    
-    return {
-        "node_types": list(NODE_FACTORIES.keys()),
-        "descriptions": {
-            "input": "Entry point node that accepts user input",
-            "router": "Conditional routing based on intent classification",
-            "llm": "Language model node for text generation",
-            "image": "Image generation node",
-            "db": "Database query node (read-only)",
-            "aggregator": "Combines results from multiple nodes",
-        }
-    }
+    return conditional_json_response(request, _NODE_TYPES_PAYLOAD, _NODE_TYPES_ETAG)
 
 
 @router.get(
@@ -334,25 +530,13 @@ async def get_node_types() -> Dict[str, Any]:
     summary="Get available source types",
     description="Returns a list of all available source adapter types.",
 )
-async def get_source_types() -> Dict[str, Any]:
+async def get_source_types(request: Request) -> Response:
     """
     Get available source types.
     
+    Supports conditional requests via ETag / If-None-Match.
+    
     Returns:
         Dictionary with source types and descriptions
     """
-    from agentflow_core.sources import SOURCE_FACTORIES
-    
-    return {
-        "source_types": list(set(SOURCE_FACTORIES.keys())),
-        "descriptions": {
-            "llm": "Google Gemini language model",
-            "gemini": "Google Gemini language model",
-            "image": "Google Imagen/Gemini image generation",
-            "imagen": "Google Imagen image generation",
-            "db": "PostgreSQL database",
-            "postgres": "PostgreSQL database",
-            "api": "HTTP API client",
-            "http": "HTTP API client",
-        }
-    }
+    return conditional_json_response(request, _SOURCE_TYPES_PAYLOAD, _SOURCE_TYPES_ETAG)
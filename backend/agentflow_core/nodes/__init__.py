@@ -7,9 +7,11 @@ Exports all node types and utilities.
 from agentflow_core.nodes.base_node import (
     BaseNode,
     NodeCallable,
+    compile_template,
     create_node_wrapper,
     get_metadata_value,
     interpolate_template,
+    parse_template,
 )
 from agentflow_core.nodes.input_node import create_input_node
 from agentflow_core.nodes.router_node import (
@@ -18,8 +20,17 @@ from agentflow_core.nodes.router_node import (
     create_routing_function,
     get_route_condition_function,
 )
-from agentflow_core.nodes.llm_node import create_llm_node
-from agentflow_core.nodes.image_node import create_image_node
+from agentflow_core.nodes.llm_node import (
+    clear_llm_cache,
+    create_llm_node,
+    create_llm_node_async,
+)
+from agentflow_core.nodes.image_node import (
+    clear_image_cache,
+    create_image_node,
+    create_image_node_async,
+    create_image_node_batch,
+)
 from agentflow_core.nodes.db_node import create_db_node
 from agentflow_core.nodes.aggregator_node import (
     AggregationStrategy,
@@ -37,6 +48,14 @@ NODE_FACTORIES = {
     "aggregator": create_aggregator_node,
 }
 
+# Same mapping with async executes for the nodes that call remote models;
+# graphs built from it must be run with ainvoke()
+ASYNC_NODE_FACTORIES = {
+    **NODE_FACTORIES,
+    "llm": create_llm_node_async,
+    "image": create_image_node_async,
+}
+
 
 def create_node(
     node_type: str,
@@ -77,15 +96,20 @@ __all__ = [
     # Base
     "BaseNode",
     "NodeCallable",
+    "compile_template",
     "create_node_wrapper",
     "get_metadata_value",
     "interpolate_template",
+    "parse_template",
     # Node factories
     "create_node",
     "create_input_node",
     "create_router_node",
     "create_llm_node",
+    "create_llm_node_async",
     "create_image_node",
+    "create_image_node_async",
+    "create_image_node_batch",
     "create_db_node",
     "create_aggregator_node",
     # Strategies and utilities
@@ -94,6 +118,9 @@ __all__ = [
     "create_routing_function",
     "get_route_condition_function",
     "create_final_output",
+    "clear_llm_cache",
+    "clear_image_cache",
     # Registry
     "NODE_FACTORIES",
+    "ASYNC_NODE_FACTORIES",
 ]
@@ -5,19 +5,36 @@ Aggregator node that combines results from multiple nodes into final output.
 Supports various aggregation strategies.
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 from agentflow_core.nodes.base_node import (
     NodeCallable,
     create_node_wrapper,
     get_metadata_value,
-    interpolate_template,
+    compile_template,
 )
 from agentflow_core.runtime.state import GraphState, merge_state
 from agentflow_core.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Shared immutable default for a missing execution path
+_EMPTY: Tuple[str, ...] = ()
+
+# Shared read-only fallback for states without an outputs mapping
+_EMPTY_OUTPUTS: Mapping[str, Any] = MappingProxyType({})
+
+# Output template used by the template strategy when none is configured
+_DEFAULT_TEMPLATE = """
+Result:
+{text_result}
+
+Image: {image_result}
+
+Data: {db_result}
+""".strip()
+
 
 # =============================================================================
 # Aggregation Strategies
@@ -78,41 +95,41 @@ def create_aggregator_node(
     """
     _metadata = metadata or {}
     
+    # Configuration is fixed for the node's lifetime, so resolve it once here
+    strategy = get_metadata_value(_metadata, "strategy", AggregationStrategy.MERGE)
+    output_key = get_metadata_value(_metadata, "output_key", "final_output")
+    source_keys = get_metadata_value(
+        _metadata,
+        "source_keys",
+        ["text_result", "image_result", "db_result"]
+    )
+    include_metadata = get_metadata_value(_metadata, "include_metadata", True)
+    priority_order = get_metadata_value(_metadata, "priority_order", source_keys)
+    template = get_metadata_value(_metadata, "template", "")
+    separator = get_metadata_value(_metadata, "separator", "\n\n")
+    select_key = get_metadata_value(_metadata, "select_key", "text_result")
+    
+    strategies: Dict[str, Callable[[GraphState], Any]] = {
+        AggregationStrategy.MERGE: lambda state: _aggregate_merge(state, source_keys),
+        AggregationStrategy.PRIORITY: lambda state: _aggregate_priority(state, priority_order),
+        AggregationStrategy.TEMPLATE: compile_template(template or _DEFAULT_TEMPLATE),
+        AggregationStrategy.CONCAT: lambda state: _aggregate_concat(state, source_keys, separator),
+        AggregationStrategy.SELECT: lambda state: state.get(select_key),
+    }
+    aggregate = strategies.get(strategy)
+    if aggregate is None:
+        logger.warning("unknown_aggregation_strategy", node_id=node_id, strategy=strategy)
+        aggregate = strategies[AggregationStrategy.MERGE]
+    
     def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
         """Execute aggregator node logic."""
-        strategy = get_metadata_value(meta, "strategy", AggregationStrategy.MERGE)
-        output_key = get_metadata_value(meta, "output_key", "final_output")
-        source_keys = get_metadata_value(
-            meta,
-            "source_keys",
-            ["text_result", "image_result", "db_result"]
-        )
-        include_metadata = get_metadata_value(meta, "include_metadata", True)
-        
-        # Aggregate based on strategy
-        if strategy == AggregationStrategy.MERGE:
-            result = _aggregate_merge(state, source_keys)
-        elif strategy == AggregationStrategy.PRIORITY:
-            priority_order = get_metadata_value(meta, "priority_order", source_keys)
-            result = _aggregate_priority(state, priority_order)
-        elif strategy == AggregationStrategy.TEMPLATE:
-            template = get_metadata_value(meta, "template", "")
-            result = _aggregate_template(state, template)
-        elif strategy == AggregationStrategy.CONCAT:
-            separator = get_metadata_value(meta, "separator", "\n\n")
-            result = _aggregate_concat(state, source_keys, separator)
-        elif strategy == AggregationStrategy.SELECT:
-            select_key = get_metadata_value(meta, "select_key", "text_result")
-            result = state.get(select_key)
-        else:
-            logger.warning("unknown_aggregation_strategy", strategy=strategy)
-            result = _aggregate_merge(state, source_keys)
+        result = aggregate(state)
         
         # Optionally include execution metadata
         if include_metadata:
             final_result = {
                 "result": result,
-                "execution_path": state.get("execution_path", []),
+                "execution_path": state.get("execution_path", _EMPTY),
                 "tokens_used": state.get("tokens_used", 0),
                 "cost": state.get("cost", 0.0),
             }
@@ -136,6 +153,33 @@ def create_aggregator_node(
 # =============================================================================
 
 
+def _first_nonempty(
+    state: GraphState,
+    outputs: Mapping[str, Any],
+    key: str
+) -> Any:
+    """
+    Look up a key in the state, falling back to state["outputs"].
+    
+    None, "", [] and {} count as empty; other falsy values such as 0 or
+    False are real results and are kept.
+    
+    Args:
+        state: Current graph state
+        outputs: The state's outputs mapping
+        key: Key to look up
+        
+    Returns:
+        The first non-empty value, or None
+    """
+    value = state.get(key)
+    if value is None or (not value and isinstance(value, (str, list, dict))):
+        value = outputs.get(key)
+        if value is None or (not value and isinstance(value, (str, list, dict))):
+            return None
+    return value
+
+
 def _aggregate_merge(
     state: GraphState,
     source_keys: List[str]
@@ -153,15 +197,11 @@ def _aggregate_merge(
         Dictionary with all non-empty values
     """
     result: Dict[str, Any] = {}
-    outputs = state.get("outputs", {})
+    outputs = state.get("outputs") or _EMPTY_OUTPUTS
     
     for key in source_keys:
-        # First check direct state, then outputs
-        value = state.get(key)
-        if value is None or value == "" or value == [] or value == {}:
-            value = outputs.get(key)
-        
-        if value is not None and value != "" and value != [] and value != {}:
+        value = _first_nonempty(state, outputs, key)
+        if value is not None:
             result[key] = value
     
     return result
@@ -183,49 +223,53 @@ def _aggregate_priority(
     Returns:
         First non-empty value found
     """
-    outputs = state.get("outputs", {})
+    outputs = state.get("outputs") or _EMPTY_OUTPUTS
     
     for key in priority_order:
-        # First check direct state, then outputs
-        value = state.get(key)
-        if value is None or value == "" or value == [] or value == {}:
-            value = outputs.get(key)
-        
-        if value is not None and value != "" and value != [] and value != {}:
+        value = _first_nonempty(state, outputs, key)
+        if value is not None:
             return value
     
     return None
 
 
-def _aggregate_template(
-    state: GraphState,
-    template: str
-) -> str:
-    """
-    Format output using a template.
-    
-    Args:
-        state: Current graph state
-        template: Template string with {placeholders}
-        
-    Returns:
-        Formatted string
-        
-    Example:
-        >>> template = "Result: {text_result}\nImage: {image_result[url]}"
-    """
-    if not template:
-        # Default template
-        template = """
-Result:
-{text_result}
+def _concat_str(key: str, value: str) -> str:
+    """Strings are used as-is."""
+    return value
 
-Image: {image_result}
 
-Data: {db_result}
-        """.strip()
-    
-    return interpolate_template(template, state)
+def _concat_dict(key: str, value: Dict[str, Any]) -> str:
+    """For dicts, use a formatted representation."""
+    return f"{key}: {value}"
+
+
+def _concat_list(key: str, value: List[Any]) -> str:
+    """For lists, join items."""
+    return f"{key}: {', '.join(map(str, value))}"
+
+
+def _concat_other(key: str, value: Any) -> str:
+    """Fall back to the value's string form."""
+    return str(value)
+
+
+# Exact type -> formatter for concat parts, so common values skip isinstance checks
+_CONCAT_FORMATTERS: Dict[type, Callable[[str, Any], str]] = {
+    str: _concat_str,
+    dict: _concat_dict,
+    list: _concat_list,
+}
+
+
+def _resolve_concat_formatter(value: Any) -> Callable[[str, Any], str]:
+    """Pick the concat formatter for subclasses and other types."""
+    if isinstance(value, str):
+        return _concat_str
+    if isinstance(value, dict):
+        return _concat_dict
+    if isinstance(value, list):
+        return _concat_list
+    return _concat_other
 
 
 def _aggregate_concat(
@@ -247,25 +291,13 @@ def _aggregate_concat(
         Concatenated string
     """
     parts: List[str] = []
-    outputs = state.get("outputs", {})
+    outputs = state.get("outputs") or _EMPTY_OUTPUTS
     
     for key in source_keys:
-        # First check direct state, then outputs
-        value = state.get(key)
-        if value is None or value == "" or value == [] or value == {}:
-            value = outputs.get(key)
-        
+        value = _first_nonempty(state, outputs, key)
         if value:
-            if isinstance(value, str):
-                parts.append(value)
-            elif isinstance(value, dict):
-                # For dicts, use a formatted representation
-                parts.append(f"{key}: {value}")
-            elif isinstance(value, list):
-                # For lists, join items
-                parts.append(f"{key}: {', '.join(str(v) for v in value)}")
-            else:
-                parts.append(str(value))
+            formatter = _CONCAT_FORMATTERS.get(type(value)) or _resolve_concat_formatter(value)
+            parts.append(formatter(key, value))
     
     return separator.join(parts)
 
@@ -274,6 +306,14 @@ def _aggregate_concat(
 # Utility Functions
 # =============================================================================
 
+# Default keys to include in the final output
+_DEFAULT_FINAL_KEYS = (
+    "text_result", "image_result", "db_result", "api_result",
+    "final_output", "intent", "tokens_used", "cost",
+)
+
+_NO_KEYS: FrozenSet[str] = frozenset()
+
 
 def create_final_output(
     state: GraphState,
@@ -293,14 +333,8 @@ def create_final_output(
     """
     output: Dict[str, Any] = {}
     
-    # Default keys to include
-    default_keys = [
-        "text_result", "image_result", "db_result", "api_result",
-        "final_output", "intent", "tokens_used", "cost"
-    ]
-    
-    keys_to_include = include_keys or default_keys
-    keys_to_exclude = set(exclude_keys or [])
+    keys_to_include = include_keys or _DEFAULT_FINAL_KEYS
+    keys_to_exclude = frozenset(exclude_keys) if exclude_keys else _NO_KEYS
     
     for key in keys_to_include:
         if key not in keys_to_exclude:
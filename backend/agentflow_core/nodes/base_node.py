@@ -5,11 +5,15 @@ Defines the common interface and utilities for all node types.
 All node implementations should follow the patterns defined here.
 """
 
+import inspect
+import string
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Optional
+from collections import ChainMap
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from agentflow_core.runtime.state import GraphState, add_to_execution_path
-from agentflow_core.utils.logger import get_logger, log_node_event
+from agentflow_core.utils.logger import get_logger, is_log_enabled, log_node_event
 
 logger = get_logger(__name__)
 
@@ -17,6 +21,19 @@ logger = get_logger(__name__)
 # Type alias for node callable
 NodeCallable = Callable[[GraphState], GraphState]
 
+# Result keys diffed even when a node declares its writes; custom
+# output_key values live under outputs, so it is always checked
+_ALWAYS_DIFFED_KEYS = frozenset({"user_input", "outputs", "errors", "tokens_used", "cost"})
+
+# Additive counters; the wrapper returns only their increase
+_DELTA_KEYS = ("tokens_used", "cost")
+
+# Result keys the wrapper's diff loop leaves to dedicated handling
+_SEPARATELY_HANDLED_KEYS = frozenset({"execution_path", "current_node", "errors", *_DELTA_KEYS})
+
+# Shared parser for template placeholder grammar
+_FORMATTER = string.Formatter()
+
 
 class BaseNode(ABC):
     """
@@ -60,18 +77,22 @@ class BaseNode(ABC):
     
     def __call__(self, state: GraphState) -> GraphState:
         """Make node callable for LangGraph integration."""
-        log_node_event("node_started", self.node_id, self.node_type)
+        # Checked once per call; skips both lifecycle events when INFO is off
+        log_enabled = is_log_enabled()
+        if log_enabled:
+            log_node_event("node_started", self.node_id, self.node_type)
         
         # Add node to execution path
         state = add_to_execution_path(state, self.node_id)
         
         try:
             result = self.execute(state)
-            log_node_event(
-                "node_completed",
-                self.node_id,
-                self.node_type
-            )
+            if log_enabled:
+                log_node_event(
+                    "node_completed",
+                    self.node_id,
+                    self.node_type
+                )
             return result
         except Exception as e:
             log_node_event(
@@ -86,7 +107,7 @@ class BaseNode(ABC):
 def create_node_wrapper(
     node_id: str,
     node_type: str,
-    execute_fn: Callable[[GraphState, Dict[str, Any]], GraphState],
+    execute_fn: Callable[[GraphState, Dict[str, Any]], Any],
     metadata: Optional[Dict[str, Any]] = None
 ) -> NodeCallable:
     """
@@ -97,8 +118,16 @@ def create_node_wrapper(
     Args:
         node_id: Unique identifier for the node
         node_type: The type of node
-        execute_fn: Function that performs the actual node logic
-        metadata: Node-specific configuration
+        execute_fn: Function that performs the actual node logic; may be
+            an `async def`, in which case the returned node is async too
+        metadata: Node-specific configuration. An optional "writes" list
+            declares the state keys the node changes; only those (plus
+            user_input, outputs, errors, tokens_used and cost) are diffed
+            against the input state instead of every key in the result.
+            Custom keys (e.g. an llm node's output_key) are stored in
+            outputs, so they are returned whether or not they are declared.
+            Setting "track_path" to False leaves the node out of
+            execution_path (current_node is still updated).
         
     Returns:
         A callable that wraps the execution with logging
@@ -111,65 +140,131 @@ def create_node_wrapper(
     """
     _metadata = metadata or {}
     
-    def wrapper(state: GraphState) -> GraphState:
-        log_node_event("node_started", node_id, node_type)
+    # Keys to diff, resolved once; None means scan the whole result
+    declared_writes = _metadata.get("writes")
+    _writes = (
+        frozenset(declared_writes) | _ALWAYS_DIFFED_KEYS
+        if declared_writes is not None
+        else None
+    )
+    
+    # Appended by operator.add reducers, which build a new list and never
+    # mutate their operands, so one list can be returned on every call
+    _path_update = [node_id]
+    track_path = _metadata.get("track_path", True)
+    
+    def collect_updates(state: GraphState, result: GraphState) -> Dict[str, Any]:
+        """Reduce a node's result to the fields it actually changed."""
+        # Get updates from the result (compare to input state)
+        # For reducer fields, we only want the delta
+        # For parallel execution, we MUST NOT include unchanged fields
+        updates: Dict[str, Any] = {}
         
-        try:
-            # Execute the node logic
-            result = execute_fn(state, _metadata)
+        # Add execution path tracking (current_node uses an operator.add
+        # reducer in GraphState, so it takes a list rather than a bare id)
+        if track_path:
+            updates["execution_path"] = _path_update
+        updates["current_node"] = _path_update
+        
+        # Only include fields that were actually modified
+        # This is CRITICAL for parallel execution to avoid concurrent update errors
+        if _writes is None:
+            changed = result.items()
+        else:
+            changed = [(key, result[key]) for key in _writes if key in result]
+        
+        for key, value in changed:
+            # Skip fields we handle separately
+            if key in _SEPARATELY_HANDLED_KEYS:
+                continue
             
-            # Get updates from the result (compare to input state)
-            # For reducer fields, we only want the delta
-            # For parallel execution, we MUST NOT include unchanged fields
-            updates: Dict[str, Any] = {}
+            # IMPORTANT: Do NOT skip user_input - it needs to be available to ALL subsequent nodes
+            # The keep_first reducer in GraphState will handle immutability
+            # if key in ("user_input", "intent") and state.get(key) == value:
+            #     continue
             
-            # Add execution path tracking
-            updates["execution_path"] = [node_id]
-            updates["current_node"] = [node_id]
+            # For all other fields, only include if changed
+            # EXCEPTION: Always include user_input to ensure it's available to all nodes
+            if key == "user_input":
+                updates[key] = value
+                continue
             
-            # Only include fields that were actually modified
-            # This is CRITICAL for parallel execution to avoid concurrent update errors
-            for key, value in result.items():
-                # Skip fields we handle separately
-                if key in ("execution_path", "current_node"):
-                    continue
-                
-                # IMPORTANT: Do NOT skip user_input - it needs to be available to ALL subsequent nodes
-                # The keep_first reducer in GraphState will handle immutability
-                # if key in ("user_input", "intent") and state.get(key) == value:
-                #     continue
-                
-                # Handle errors - only include NEW errors
-                if key == "errors":
-                    old_errors = state.get("errors", [])
-                    new_errors = [e for e in value if e not in old_errors]
-                    if new_errors:
-                        updates["errors"] = new_errors
-                    continue
-                
-                # Handle tokens_used and cost - only include if changed
-                if key in ("tokens_used", "cost"):
-                    old_value = state.get(key, 0)
-                    delta = value - old_value
-                    if delta > 0:
-                        updates[key] = delta  # Return only the delta for addition
-                    continue
+            # Values carried over from the input state are the same objects,
+            # so the identity check skips deep comparisons of large payloads
+            old_value = state.get(key)
+            if old_value is not value and old_value != value:
+                updates[key] = value
+        
+        # Handle errors - only include NEW errors
+        errors = result.get("errors")
+        old_errors = state.get("errors", [])
+        # Nodes that copy the state pass the same list through untouched
+        if errors and errors is not old_errors:
+            try:
+                seen = set(old_errors)
+            except TypeError:
+                seen = old_errors  # Unhashable entries: linear membership
+            new_errors = [e for e in errors if e not in seen]
+            if new_errors:
+                updates["errors"] = new_errors
+        
+        # Handle tokens_used and cost - only include if changed
+        for key in _DELTA_KEYS:
+            if key in result:
+                delta = result[key] - state.get(key, 0)
+                if delta > 0:
+                    updates[key] = delta  # Return only the delta for addition
+        
+        return updates
+    
+    if inspect.iscoroutinefunction(execute_fn):
+        # Async node logic (e.g. network-bound model calls) gets a coroutine
+        # wrapper, which LangGraph awaits when the graph runs via ainvoke()
+        async def wrapper(state: GraphState) -> GraphState:
+            # Checked once per call; skips both lifecycle events when INFO is off
+            log_enabled = is_log_enabled()
+            if log_enabled:
+                log_node_event("node_started", node_id, node_type)
+            
+            try:
+                # Execute the node logic
+                result = await execute_fn(state, _metadata)
+                updates = collect_updates(state, result)
                 
-                # For all other fields, only include if changed
-                # EXCEPTION: Always include user_input to ensure it's available to all nodes
-                if key == "user_input" or state.get(key) != value:
-                    updates[key] = value
+                if log_enabled:
+                    log_node_event("node_completed", node_id, node_type)
+                return updates  # type: ignore
+            except Exception as e:
+                log_node_event(
+                    "node_failed",
+                    node_id,
+                    node_type,
+                    error=str(e)
+                )
+                raise
+    else:
+        def wrapper(state: GraphState) -> GraphState:
+            # Checked once per call; skips both lifecycle events when INFO is off
+            log_enabled = is_log_enabled()
+            if log_enabled:
+                log_node_event("node_started", node_id, node_type)
             
-            log_node_event("node_completed", node_id, node_type)
-            return updates  # type: ignore
-        except Exception as e:
-            log_node_event(
-                "node_failed",
-                node_id,
-                node_type,
-                error=str(e)
-            )
-            raise
+            try:
+                # Execute the node logic
+                result = execute_fn(state, _metadata)
+                updates = collect_updates(state, result)
+                
+                if log_enabled:
+                    log_node_event("node_completed", node_id, node_type)
+                return updates  # type: ignore
+            except Exception as e:
+                log_node_event(
+                    "node_failed",
+                    node_id,
+                    node_type,
+                    error=str(e)
+                )
+                raise
     
     # Set function name for debugging
     wrapper.__name__ = f"node_{node_id}"
@@ -205,6 +300,169 @@ def get_metadata_value(
     return value
 
 
+class _TemplateContext(ChainMap):
+    """Template lookup over outputs then state that keeps unknown placeholders."""
+    
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"  # Keep placeholder if not found
+
+
+@lru_cache(maxsize=1024)
+def parse_template(template: str) -> Tuple[Tuple[str, Optional[str], Optional[str], Optional[str]], ...]:
+    """
+    Parse a template's {placeholder} structure once per distinct template.
+    
+    Args:
+        template: Template string with {placeholders}
+        
+    Returns:
+        Parsed (literal_text, field_name, format_spec, conversion) tuples
+        
+    Raises:
+        ValueError: If the template is malformed
+    """
+    return tuple(_FORMATTER.parse(template))
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str) -> Callable[[GraphState], str]:
+    """
+    Build a renderer for a template, compiled once per distinct template.
+    
+    Templates whose placeholders are all plain names ({user_input}) render
+    by joining precomputed literals with looked-up values, skipping the
+    format machinery. Anything else ({a.b}, {x!r}, {n:>5}) renders through
+    str.format_map. Either way, outputs take precedence over state and
+    unknown placeholders are kept as-is.
+    
+    Templates containing Jinja2 blocks ({% if %}...{% endif %}) are
+    compiled with a sandboxed Jinja2 environment instead, when it is
+    installed; its variables use {{ name }} syntax.
+    
+    Args:
+        template: Template string with {placeholders}
+        
+    Returns:
+        A callable rendering the template for a state
+        
+    Example:
+        >>> render = compile_template("Hello {user_input}")
+        >>> render({"user_input": "world"})
+        'Hello world'
+    """
+    if "{%" in template:
+        render_jinja = _compile_jinja_template(template)
+        if render_jinja is not None:
+            return render_jinja
+    
+    try:
+        parts = parse_template(template)
+    except ValueError as e:
+        error = e
+        return lambda state: _template_failed(template, error)
+    
+    if all(field_name is None for _, field_name, _, _ in parts):
+        # Only escaped braces ("{{", "}}") can differ from the raw template
+        static_text = "".join(literal for literal, _, _, _ in parts)
+        return lambda state: static_text
+    
+    if not all(
+        field_name is None or (field_name.isidentifier() and not format_spec and conversion is None)
+        for _, field_name, format_spec, conversion in parts
+    ):
+        def render_formatted(state: GraphState) -> str:
+            try:
+                # The lookup avoids copying either dict
+                outputs = state.get("outputs") or {}
+                return template.format_map(_TemplateContext(outputs, state))
+            except Exception as e:
+                return _template_failed(template, e)
+        
+        return render_formatted
+    
+    pieces = tuple((literal, field_name) for literal, field_name, _, _ in parts)
+    
+    def render(state: GraphState) -> str:
+        outputs = state.get("outputs") or {}
+        chunks = []
+        for literal, field_name in pieces:
+            chunks.append(literal)
+            if field_name is None:
+                continue
+            if field_name in outputs:
+                value = outputs[field_name]
+            elif field_name in state:
+                value = state[field_name]
+            else:
+                # Keep placeholder if not found
+                chunks.append(f"{{{field_name}}}")
+                continue
+            try:
+                chunks.append(value if type(value) is str else format(value))
+            except Exception as e:
+                return _template_failed(template, e)
+        return "".join(chunks)
+    
+    return render
+
+
+@lru_cache(maxsize=1)
+def _jinja_environment() -> Optional[Any]:
+    """
+    Shared sandboxed Jinja2 environment, or None if jinja2 is not installed.
+    
+    Templates arrive with workflow specs over the API, so they are
+    untrusted: the sandbox rejects access to dunder and other unsafe
+    attributes, which would otherwise reach Python internals.
+    """
+    try:
+        from jinja2.sandbox import SandboxedEnvironment
+    except ImportError:
+        logger.warning("jinja2_not_installed", hint="pip install agentflow-core[templates]")
+        return None
+    
+    # Templates come from strings, so there is nothing to reload or stat
+    return SandboxedEnvironment(auto_reload=False, cache_size=400)
+
+
+def _compile_jinja_template(template: str) -> Optional[Callable[[GraphState], str]]:
+    """
+    Compile a Jinja2 template into a renderer.
+    
+    Returns:
+        A callable rendering the template for a state, or None if Jinja2
+        is unavailable
+    """
+    env = _jinja_environment()
+    if env is None:
+        return None
+    
+    try:
+        compiled = env.from_string(template)
+    except Exception as e:
+        error = e
+        return lambda state: _template_failed(template, error)
+    
+    def render_jinja(state: GraphState) -> str:
+        try:
+            # Outputs take precedence over state, as for {placeholders}
+            return compiled.render({**state, **(state.get("outputs") or {})})
+        except Exception as e:
+            return _template_failed(template, e)
+    
+    return render_jinja
+
+
+def _template_failed(template: str, error: Exception) -> str:
+    """Log a template that could not be rendered and return it unchanged."""
+    logger.warning(
+        "template_interpolation_failed",
+        template=template[:100],
+        error=str(error)
+    )
+    return template
+
+
 def interpolate_template(
     template: str,
     state: GraphState
@@ -229,23 +487,4 @@ def interpolate_template(
         >>> print(result)
         'Hello world, your intent is greeting'
     """
-    try:
-        # Use format_map to handle missing keys gracefully
-        class SafeDict(dict):
-            def __missing__(self, key: str) -> str:
-                return f"{{{key}}}"  # Keep placeholder if not found
-        
-        # Merge state with outputs for template interpolation
-        # This allows templates to reference custom keys like {summary}
-        outputs = state.get("outputs", {})
-        merged_state = {**state, **outputs}
-        
-        safe_state = SafeDict(merged_state)
-        return template.format_map(safe_state)
-    except Exception as e:
-        logger.warning(
-            "template_interpolation_failed",
-            template=template[:100],
-            error=str(e)
-        )
-        return template
+    return compile_template(template)(state)
@@ -7,13 +7,15 @@ Supports PostgreSQL (primary) and other databases.
 
 import os
 import re
-from typing import Any, Dict, List, Optional
+from collections import ChainMap
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from agentflow_core.nodes.base_node import (
     NodeCallable,
+    compile_template,
     create_node_wrapper,
     get_metadata_value,
-    interpolate_template,
+    parse_template,
 )
 from agentflow_core.runtime.registry import get_source, has_source
 from agentflow_core.runtime.state import GraphState, merge_state
@@ -28,10 +30,21 @@ logger = get_logger(__name__)
 # =============================================================================
 
 # SQL keywords that indicate write operations (blocked)
-WRITE_KEYWORDS = {
+WRITE_KEYWORDS = frozenset({
     "INSERT", "UPDATE", "DELETE", "DROP", "CREATE", "ALTER",
     "TRUNCATE", "REPLACE", "MERGE", "GRANT", "REVOKE", "EXECUTE",
-}
+})
+
+# Statements a read-only query may start with
+READ_ONLY_STATEMENTS = frozenset({"SELECT", "WITH", "EXPLAIN"})
+
+# Query normalization patterns, compiled once
+_LINE_COMMENT_RE = re.compile(r"--.*$", re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+# Matches any write keyword as a whole word, so the scan runs in the regex
+# engine instead of looking up every identifier in Python
+_WRITE_KEYWORD_RE = re.compile(r"\b(?:" + "|".join(sorted(WRITE_KEYWORDS)) + r")\b")
 
 
 # =============================================================================
@@ -55,6 +68,10 @@ def create_db_node(
             - source_id: ID of the database source to use
             - query: Static SQL query
             - query_template: Query template with {placeholders}
+            - param_keys: Template placeholders bound as query parameters
+              instead of being interpolated into the SQL text (must not
+              sit inside quotes, e.g. `name LIKE {pattern}`); `%` in the
+              values of other placeholders is escaped for the driver
             - params: Query parameters dictionary
             - output_key: State key for output (default: "db_result")
             - limit: Max rows to return (default: 100)
@@ -69,24 +86,76 @@ def create_db_node(
         ...     "query_template": "SELECT * FROM users WHERE name LIKE '%{user_input}%'",
         ...     "limit": 10
         ... })
+        >>> node = create_db_node("db_2", {
+        ...     "query_template": "SELECT * FROM users WHERE name = {user_input}",
+        ...     "param_keys": ["user_input"]
+        ... })
     """
     _metadata = metadata or {}
     
+    # Configuration is fixed for the node's lifetime, so resolve it once here
+    source_id = get_metadata_value(_metadata, "source_id")
+    query = get_metadata_value(_metadata, "query")
+    query_template = get_metadata_value(_metadata, "query_template")
+    params = get_metadata_value(_metadata, "params", {})
+    output_key = get_metadata_value(_metadata, "output_key", "db_result")
+    limit = get_metadata_value(_metadata, "limit", 100)
+    timeout = get_metadata_value(_metadata, "timeout", 30)
+    param_keys = tuple(get_metadata_value(_metadata, "param_keys", ()))
+    
+    # Inline or environment configuration, used when the node names no source
+    fallback_source_config = _get_db_source_config(None, _metadata)
+    
+    # Decide LIMIT injection from the query text itself, not interpolated values
+    base_query = query_template or query or ""
+    limit_suffix = ""
+    if limit and "LIMIT" not in base_query.upper():
+        base_query = base_query.rstrip(";")
+        limit_suffix = f" LIMIT {limit}"
+    
+    # Static queries are finalized and checked once
+    static_query = base_query + limit_suffix
+    static_query_allowed = False
+    
+    if query_template:
+        # Compile the template at build time so executions only render it
+        try:
+            if param_keys:
+                render_query = _compile_parameterized_query(base_query, param_keys)
+            else:
+                if "{%" not in base_query:
+                    parse_template(base_query)
+                render_query = compile_template(base_query)
+        except ValueError as e:
+            # A malformed template would otherwise reach the database as-is
+            raise NodeExecutionError(
+                message=f"Malformed query template: {e}",
+                node_id=node_id,
+                node_type="db"
+            )
+        
+        if not param_keys:
+            logger.warning(
+                "db_query_template_interpolated",
+                node_id=node_id,
+                hint="set param_keys to bind values as query parameters"
+            )
+    elif query:
+        static_query_allowed = _is_read_only_query(query)
+    
     def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
         """Execute database node logic."""
-        source_id = get_metadata_value(meta, "source_id")
-        query = get_metadata_value(meta, "query")
-        query_template = get_metadata_value(meta, "query_template")
-        params = get_metadata_value(meta, "params", {})
-        output_key = get_metadata_value(meta, "output_key", "db_result")
-        limit = get_metadata_value(meta, "limit", 100)
-        timeout = get_metadata_value(meta, "timeout", 30)
-        
         # Build query from template or static query
+        query_params = params
         if query_template:
-            final_query = interpolate_template(query_template, state)
+            final_query = render_query(state) + limit_suffix
+            allowed = _is_read_only_query(final_query)
+            if param_keys:
+                context = ChainMap(state.get("outputs") or {}, state)
+                query_params = {**params, **{key: context.get(key) for key in param_keys}}
         elif query:
-            final_query = query
+            final_query = static_query
+            allowed = static_query_allowed
         else:
             raise NodeExecutionError(
                 message="No query provided for database node",
@@ -95,27 +164,29 @@ def create_db_node(
             )
         
         # Validate query is read-only
-        if not _is_read_only_query(final_query):
+        if not allowed:
             raise NodeExecutionError(
                 message="Only SELECT queries are allowed. Write operations are blocked.",
                 node_id=node_id,
                 node_type="db"
             )
         
-        # Add LIMIT if not present
-        if limit and "LIMIT" not in final_query.upper():
-            final_query = f"{final_query.rstrip(';')} LIMIT {limit}"
-        
-        # Get source configuration
-        source_config = _get_db_source_config(source_id, meta)
+        # Registered sources are looked up per call since they can be re-registered
+        source_config = (
+            _get_db_source_config(source_id, _metadata)
+            if source_id
+            else fallback_source_config
+        )
         
         # Execute query
         results = _execute_query(
             source_config=source_config,
             query=final_query,
-            params=params,
+            params=query_params,
             timeout=timeout,
-            node_id=node_id
+            node_id=node_id,
+            # Parameterized SQL text is stable, so the server can reuse its plan
+            prepare=bool(param_keys) or None
         )
         
         logger.info(
@@ -145,37 +216,81 @@ def _is_read_only_query(query: str) -> bool:
     Returns:
         True if query is read-only, False otherwise
     """
-    # Normalize query
-    normalized = query.upper().strip()
-    
-    # Remove comments
-    normalized = re.sub(r"--.*$", "", normalized, flags=re.MULTILINE)
-    normalized = re.sub(r"/\*.*?\*/", "", normalized, flags=re.DOTALL)
-    
-    # Check for write keywords
-    words = set(re.findall(r"\b\w+\b", normalized))
-    
-    for keyword in WRITE_KEYWORDS:
-        if keyword in words:
-            logger.warning(
-                "write_operation_blocked",
-                keyword=keyword,
-                query_preview=query[:100]
-            )
-            return False
+    # Normalize query and remove comments
+    normalized = _BLOCK_COMMENT_RE.sub("", _LINE_COMMENT_RE.sub("", query.upper()))
     
     # Must start with SELECT, WITH, or EXPLAIN
-    first_word = normalized.split()[0] if normalized.split() else ""
-    if first_word not in ("SELECT", "WITH", "EXPLAIN"):
+    tokens = normalized.split(None, 1)
+    first_word = tokens[0] if tokens else ""
+    if first_word not in READ_ONLY_STATEMENTS:
         logger.warning(
             "non_select_query_blocked",
             first_word=first_word
         )
         return False
     
+    # Check for write keywords, stopping at the first one found
+    match = _WRITE_KEYWORD_RE.search(normalized)
+    if match is not None:
+        logger.warning(
+            "write_operation_blocked",
+            keyword=match.group(),
+            query_preview=query[:100]
+        )
+        return False
+    
     return True
 
 
+# =============================================================================
+# Query Parameterization
+# =============================================================================
+
+
+def _compile_parameterized_query(
+    template: str,
+    param_keys: Tuple[str, ...]
+) -> Callable[[GraphState], str]:
+    """
+    Compile a query template whose `param_keys` are bound as query parameters.
+    
+    `{key}` becomes the psycopg placeholder `%(key)s`, so the value is bound
+    by the driver instead of being spliced into the SQL text. Other
+    placeholders are still interpolated, and `%` is escaped in both the
+    literal SQL and the interpolated values, since the driver reads the
+    rendered query as a `%` format string.
+    
+    Args:
+        template: Query template with {placeholders}
+        param_keys: Placeholder names to bind as parameters
+        
+    Returns:
+        A callable rendering parameterized SQL for a state
+        
+    Raises:
+        ValueError: If the template is malformed
+    """
+    pieces: List[Union[str, Callable[[GraphState], str]]] = []
+    for literal, field_name, format_spec, conversion in parse_template(template):
+        pieces.append(literal.replace("%", "%%"))
+        if field_name is None:
+            continue
+        if field_name in param_keys:
+            pieces.append(f"%({field_name})s")
+        else:
+            conversion_part = f"!{conversion}" if conversion else ""
+            spec_part = f":{format_spec}" if format_spec else ""
+            pieces.append(compile_template(f"{{{field_name}{conversion_part}{spec_part}}}"))
+    
+    def render(state: GraphState) -> str:
+        return "".join(
+            piece if type(piece) is str else piece(state).replace("%", "%%")
+            for piece in pieces
+        )
+    
+    return render
+
+
 # =============================================================================
 # Database Source Configuration
 # =============================================================================
@@ -218,7 +333,8 @@ def _execute_query(
     query: str,
     params: Dict[str, Any],
     timeout: int,
-    node_id: str
+    node_id: str,
+    prepare: Optional[bool] = None
 ) -> List[Dict[str, Any]]:
     """
     Execute a database query and return results.
@@ -234,7 +350,8 @@ def _execute_query(
             query=query,
             params=params,
             timeout=timeout,
-            node_id=node_id
+            node_id=node_id,
+            prepare=prepare
         )
     else:
         raise NodeExecutionError(
@@ -249,11 +366,15 @@ def _execute_postgresql(
     query: str,
     params: Dict[str, Any],
     timeout: int,
-    node_id: str
+    node_id: str,
+    prepare: Optional[bool] = None
 ) -> List[Dict[str, Any]]:
     """
     Execute query against PostgreSQL.
     
+    `prepare=True` asks psycopg to use a server-side prepared statement;
+    None leaves it to psycopg's automatic preparation.
+    
     Returns:
         List of dictionaries representing rows
     """
@@ -271,7 +392,7 @@ def _execute_postgresql(
         return []
     
     try:
-        import psycopg
+        from psycopg.rows import dict_row
     except ImportError:
         raise NodeExecutionError(
             message="psycopg package not installed. Run: pip install psycopg[binary]",
@@ -279,33 +400,42 @@ def _execute_postgresql(
             node_type="db"
         )
     
+    from agentflow_core.sources import get_cached_source_client
+    from agentflow_core.sources.db_postgres import get_connection
+    
     try:
-        # Connect and execute
-        with psycopg.connect(connection_string) as conn:
-            conn.execute(f"SET statement_timeout = {timeout * 1000}")
-            
-            with conn.cursor() as cursor:
+        # Connections come from a pool shared by every node and request
+        # using this database (including the pool opened when the source
+        # was registered), so only the first query pays for connecting.
+        # The timeout is part of the pool config and applied when each
+        # connection opens, so queries skip a SET round trip
+        client = get_cached_source_client(
+            "postgres",
+            {
+                **source_config,
+                "connection_string": connection_string,
+                "statement_timeout": timeout,
+            }
+        )
+        
+        with get_connection(client) as conn:
+            # dict_row builds each row dict directly, so the result set is
+            # materialized once instead of as tuples and then as dicts
+            with conn.cursor(row_factory=dict_row) as cursor:
                 # Execute with parameters if provided
                 if params:
-                    cursor.execute(query, params)
+                    cursor.execute(query, params, prepare=prepare)
                 else:
-                    cursor.execute(query)
+                    cursor.execute(query, prepare=prepare)
                 
                 # Fetch results
                 if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
-                    rows = cursor.fetchall()
-                    
-                    # Convert to list of dicts
-                    results = [
-                        dict(zip(columns, row))
-                        for row in rows
-                    ]
+                    results = cursor.fetchall()
                     
                     logger.info(
                         "postgresql_query_success",
                         row_count=len(results),
-                        column_count=len(columns)
+                        column_count=len(cursor.description)
                     )
                     
                     return results
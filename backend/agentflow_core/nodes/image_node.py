@@ -5,17 +5,28 @@ Image generation node that creates images using AI models.
 Supports Google Imagen and other image generation providers.
 """
 
+import asyncio
+import mimetypes
 import os
-from typing import Any, Dict, Optional
+import tempfile
+from collections import OrderedDict, deque
+from threading import Lock
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
 
 from agentflow_core.nodes.base_node import (
     NodeCallable,
+    compile_template,
     create_node_wrapper,
     get_metadata_value,
-    interpolate_template,
 )
 from agentflow_core.runtime.registry import get_source, has_source
 from agentflow_core.runtime.state import GraphState, add_tokens, merge_state
+from agentflow_core.sources.llm_gemini import (
+    bind_gemini_credentials,
+    generate_content_with_retry,
+    get_genai,
+    generate_content_with_retry_async,
+)
 from agentflow_core.utils.error_handler import NodeExecutionError
 from agentflow_core.utils.logger import get_logger
 
@@ -47,6 +58,13 @@ def create_image_node(
             - quality: Image quality (standard, hd)
             - style: Image style (vivid, natural)
             - output_key: State key for output (default: "image_result")
+            - cache: Reuse the image for identical model/prompt/size
+              (default: False)
+            - storage: Where generated image bytes are kept: "memory"
+              (in the result as `data`) or "file" (written once under
+              AGENTFLOW_IMAGE_DIR, result holds only the `path`; the
+              newest AGENTFLOW_IMAGE_RETENTION files are kept)
+              (default: "memory")
     
     Returns:
         A callable that performs image generation
@@ -59,20 +77,73 @@ def create_image_node(
         ... })
     """
     _metadata = metadata or {}
+    prepare_call = _compile_image_call(node_id, _metadata)
     
     def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
         """Execute image node logic."""
-        source_id = get_metadata_value(meta, "source_id")
-        prompt = get_metadata_value(meta, "prompt")
-        prompt_template = get_metadata_value(meta, "prompt_template")
-        size = get_metadata_value(meta, "size", "1024x1024")
-        quality = get_metadata_value(meta, "quality", "standard")
-        style = get_metadata_value(meta, "style", "vivid")
-        output_key = get_metadata_value(meta, "output_key", "image_result")
-        
+        call, output_key = prepare_call(state)
+        result = _generate_image(**call)
+        return _complete_image_call(node_id, state, output_key, result)
+    
+    return create_node_wrapper(node_id, "image", execute, _metadata)
+
+
+def create_image_node_async(
+    node_id: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Callable[[GraphState], Awaitable[GraphState]]:
+    """
+    Create an async image node.
+    
+    Same configuration and behavior as create_image_node, but the model
+    call is awaited instead of blocking a thread.
+    
+    Args:
+        node_id: Unique identifier for this node
+        metadata: Configuration options (see create_image_node)
+    
+    Returns:
+        An async callable that performs image generation
+    """
+    _metadata = metadata or {}
+    prepare_call = _compile_image_call(node_id, _metadata)
+    
+    async def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
+        """Execute image node logic."""
+        call, output_key = prepare_call(state)
+        result = await _generate_image_async(**call)
+        return _complete_image_call(node_id, state, output_key, result)
+    
+    return create_node_wrapper(node_id, "image", execute, _metadata)
+
+
+def _compile_image_call(
+    node_id: str,
+    metadata: Dict[str, Any]
+) -> Callable[[GraphState], Tuple[Dict[str, Any], str]]:
+    """
+    Resolve node metadata once and return the per-call preparation step.
+    
+    Returns:
+        A callable mapping the state to (keyword arguments for
+        _generate_image, output state key)
+    """
+    source_id = get_metadata_value(metadata, "source_id")
+    prompt = get_metadata_value(metadata, "prompt")
+    prompt_template = get_metadata_value(metadata, "prompt_template")
+    size = get_metadata_value(metadata, "size", "1024x1024")
+    quality = get_metadata_value(metadata, "quality", "standard")
+    style = get_metadata_value(metadata, "style", "vivid")
+    output_key = get_metadata_value(metadata, "output_key", "image_result")
+    use_cache = get_metadata_value(metadata, "cache", False)
+    storage = get_metadata_value(metadata, "storage", IMAGE_STORAGE_MEMORY)
+    render_prompt = compile_template(prompt_template) if prompt_template else None
+    
+    def prepare(state: GraphState) -> Tuple[Dict[str, Any], str]:
+        """Resolve the prompt and generation options for one image call."""
         # Build prompt from template or static prompt
-        if prompt_template:
-            final_prompt = interpolate_template(prompt_template, state)
+        if render_prompt is not None:
+            final_prompt = render_prompt(state)
         elif prompt:
             final_prompt = prompt
         else:
@@ -86,27 +157,109 @@ def create_image_node(
                 node_type="image"
             )
         
-        # Get source configuration
-        source_config = _get_image_source_config(source_id, meta)
+        call = {
+            # Registered sources can change between calls
+            "source_config": _get_image_source_config(source_id, metadata),
+            "prompt": final_prompt,
+            "size": size,
+            "quality": quality,
+            "style": style,
+            "node_id": node_id,
+            "use_cache": use_cache,
+            "storage": storage,
+        }
+        return call, output_key
+    
+    return prepare
+
+
+def _complete_image_call(
+    node_id: str,
+    state: GraphState,
+    output_key: str,
+    result: Dict[str, Any]
+) -> GraphState:
+    """Record an image result in the state."""
+    logger.info(
+        "image_node_completed",
+        node_id=node_id,
+        has_url="url" in result
+    )
+    
+    # Update state
+    return merge_state(state, {output_key: result})
+
+
+def create_image_node_batch(
+    node_id: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Callable[[GraphState], Awaitable[GraphState]]:
+    """
+    Create an async node that generates one image per prompt.
+    
+    All images are requested concurrently, bounded by the shared Gemini
+    concurrency limit (AGENTFLOW_GEMINI_CONCURRENCY).
+    
+    Args:
+        node_id: Unique identifier for this node
+        metadata: Configuration options (see create_image_node), plus:
+            - prompts: List of prompts or prompt templates
+            - output_key: State key for the list of results
+              (default: "image_results")
+    
+    Returns:
+        An async callable that performs batch image generation
         
-        # Generate image
-        result = _generate_image(
-            source_config=source_config,
-            prompt=final_prompt,
-            size=size,
-            quality=quality,
-            style=style,
-            node_id=node_id
+    Example:
+        >>> node = create_image_node_batch("images_1", {
+        ...     "prompts": ["A cat", "A dog in {user_input}"]
+        ... })
+    """
+    _metadata = metadata or {}
+    
+    source_id = get_metadata_value(_metadata, "source_id")
+    prompts = get_metadata_value(_metadata, "prompts", [])
+    size = get_metadata_value(_metadata, "size", "1024x1024")
+    quality = get_metadata_value(_metadata, "quality", "standard")
+    style = get_metadata_value(_metadata, "style", "vivid")
+    output_key = get_metadata_value(_metadata, "output_key", "image_results")
+    use_cache = get_metadata_value(_metadata, "cache", False)
+    storage = get_metadata_value(_metadata, "storage", IMAGE_STORAGE_MEMORY)
+    
+    if not prompts:
+        raise NodeExecutionError(
+            message="No prompts provided for image batch node",
+            node_id=node_id,
+            node_type="image"
         )
+    
+    render_prompts = tuple(compile_template(prompt) for prompt in prompts)
+    
+    async def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
+        """Execute batch image node logic."""
+        source_config = _get_image_source_config(source_id, meta)
+        
+        results = await asyncio.gather(*(
+            _generate_image_async(
+                source_config=source_config,
+                prompt=render_prompt(state),
+                size=size,
+                quality=quality,
+                style=style,
+                node_id=node_id,
+                use_cache=use_cache,
+                storage=storage
+            )
+            for render_prompt in render_prompts
+        ))
         
         logger.info(
-            "image_node_completed",
+            "image_batch_node_completed",
             node_id=node_id,
-            has_url="url" in result
+            image_count=len(results)
         )
         
-        # Update state
-        return merge_state(state, {output_key: result})
+        return merge_state(state, {output_key: list(results)})
     
     return create_node_wrapper(node_id, "image", execute, _metadata)
 
@@ -144,6 +297,123 @@ def _get_image_source_config(
     }
 
 
+# =============================================================================
+# Image Cache
+# =============================================================================
+
+# Generated images kept for nodes with `cache` enabled; in-memory entries
+# hold the image bytes, so the limit is small
+IMAGE_CACHE_SIZE = 32
+
+# (model, prompt, size, storage) -> image result
+_image_cache: "OrderedDict[Tuple[str, str, str, str], Dict[str, Any]]" = OrderedDict()
+_image_cache_lock = Lock()
+
+
+def _get_cached_image(
+    key: Tuple[str, str, str, str],
+    node_id: str
+) -> Optional[Dict[str, Any]]:
+    """Return a cached image result, marking it as recently used."""
+    with _image_cache_lock:
+        result = _image_cache.get(key)
+        if result is not None:
+            _image_cache.move_to_end(key)
+    
+    if result is None:
+        return None
+    
+    if result.get("type") == "file" and not os.path.exists(result["path"]):
+        # The file was pruned by image retention; generate it again
+        with _image_cache_lock:
+            _image_cache.pop(key, None)
+        return None
+    
+    logger.info("image_cache_hit", node_id=node_id)
+    # Each state gets its own copy of the result dict
+    return dict(result)
+
+
+def _cache_image(key: Tuple[str, str, str, str], result: Dict[str, Any]) -> None:
+    """Store an image result, evicting the least recently used beyond the limit."""
+    with _image_cache_lock:
+        _image_cache[key] = result
+        _image_cache.move_to_end(key)
+        while len(_image_cache) > IMAGE_CACHE_SIZE:
+            _image_cache.popitem(last=False)
+
+
+def clear_image_cache() -> None:
+    """Drop all cached image results."""
+    with _image_cache_lock:
+        _image_cache.clear()
+
+
+# =============================================================================
+# Image Storage
+# =============================================================================
+
+IMAGE_STORAGE_MEMORY = "memory"
+IMAGE_STORAGE_FILE = "file"
+
+# Directory for images stored as files (defaults to the system temp dir)
+IMAGE_DIR = os.getenv("AGENTFLOW_IMAGE_DIR") or None
+
+# Max image files kept on disk by this process; older ones are deleted as
+# new ones are written (0 keeps every file)
+IMAGE_RETENTION = int(os.getenv("AGENTFLOW_IMAGE_RETENTION", "256"))
+
+# Paths of image files written by this process, oldest first
+_stored_images: Deque[str] = deque()
+_stored_images_lock = Lock()
+
+
+def _retain_image_file(path: str) -> None:
+    """Record a written image file, deleting the oldest beyond the limit."""
+    expired = []
+    with _stored_images_lock:
+        _stored_images.append(path)
+        while IMAGE_RETENTION > 0 and len(_stored_images) > IMAGE_RETENTION:
+            expired.append(_stored_images.popleft())
+    
+    for old_path in expired:
+        try:
+            os.unlink(old_path)
+        except OSError:
+            pass
+
+
+def _store_image(
+    data: bytes,
+    mime_type: str,
+    storage: str
+) -> Dict[str, Any]:
+    """
+    Build the part of an image result that holds the image itself.
+    
+    Results are shared by reference as they move through the graph state,
+    so the bytes are never decoded or copied here. With file storage they
+    are written out once and only the path travels with the state. The
+    path is local to the server: it is meant for nodes and hosts that share
+    its filesystem, and the file is deleted once IMAGE_RETENTION newer
+    images have been written.
+    
+    Returns:
+        Image fields ({"type", "data" or "path", "mime_type"})
+    """
+    if storage != IMAGE_STORAGE_FILE:
+        return {"type": "base64", "data": data, "mime_type": mime_type}
+    
+    suffix = mimetypes.guess_extension(mime_type or "") or ".png"
+    with tempfile.NamedTemporaryFile(
+        prefix="agentflow_", suffix=suffix, dir=IMAGE_DIR, delete=False
+    ) as f:
+        f.write(data)
+    _retain_image_file(f.name)
+    
+    return {"type": "file", "path": f.name, "mime_type": mime_type}
+
+
 # =============================================================================
 # Image Generation
 # =============================================================================
@@ -155,7 +425,9 @@ def _generate_image(
     size: str,
     quality: str,
     style: str,
-    node_id: str
+    node_id: str,
+    use_cache: bool = False,
+    storage: str = IMAGE_STORAGE_MEMORY
 ) -> Dict[str, Any]:
     """
     Generate an image using the configured provider.
@@ -166,12 +438,25 @@ def _generate_image(
     provider = source_config.get("provider", "gemini")
     
     if provider == "gemini":
-        return _generate_with_gemini(
+        cache_key = (source_config.get("model", "imagen-3.0"), prompt, size, storage)
+        if use_cache:
+            cached = _get_cached_image(cache_key, node_id)
+            if cached is not None:
+                return cached
+        
+        result = _generate_with_gemini(
             source_config=source_config,
             prompt=prompt,
             size=size,
-            node_id=node_id
+            node_id=node_id,
+            storage=storage
         )
+        
+        # Placeholders stand in for failures and are never cached
+        if use_cache and result.get("type") != "placeholder":
+            _cache_image(cache_key, result)
+        
+        return result
     else:
         # Fallback: Return placeholder for unsupported providers
         logger.warning(
@@ -182,38 +467,70 @@ def _generate_image(
         return _generate_placeholder(prompt, size)
 
 
-def _generate_with_gemini(
+async def _generate_image_async(
     source_config: Dict[str, Any],
     prompt: str,
     size: str,
-    node_id: str
+    quality: str,
+    style: str,
+    node_id: str,
+    use_cache: bool = False,
+    storage: str = IMAGE_STORAGE_MEMORY
 ) -> Dict[str, Any]:
     """
-    Generate image using Gemini/Imagen.
+    Generate an image without blocking the event loop.
     
-    Note: Gemini's image generation (Imagen) requires specific API access.
-    This implementation uses the genai library if available.
+    Returns:
+        Dictionary with image details (url, prompt, model, size, etc.)
     """
-    try:
-        import google.generativeai as genai
-    except ImportError:
-        logger.warning("google-generativeai not installed, using placeholder")
-        return _generate_placeholder(prompt, size)
-    
-    # Get API key
-    api_key_env = source_config.get("api_key_env", "GEMINI_API_KEY")
-    api_key = os.getenv(api_key_env)
+    provider = source_config.get("provider", "gemini")
     
-    if not api_key:
+    if provider == "gemini":
+        cache_key = (source_config.get("model", "imagen-3.0"), prompt, size, storage)
+        if use_cache:
+            cached = _get_cached_image(cache_key, node_id)
+            if cached is not None:
+                return cached
+        
+        result = await _generate_with_gemini_async(
+            source_config=source_config,
+            prompt=prompt,
+            size=size,
+            node_id=node_id,
+            storage=storage
+        )
+        
+        # Placeholders stand in for failures and are never cached
+        if use_cache and result.get("type") != "placeholder":
+            _cache_image(cache_key, result)
+        
+        return result
+    else:
+        # Fallback: Return placeholder for unsupported providers
         logger.warning(
-            "gemini_api_key_not_found",
-            env_var=api_key_env,
+            "unsupported_image_provider",
+            provider=provider,
             using_placeholder=True
         )
         return _generate_placeholder(prompt, size)
+
+
+def _generate_with_gemini(
+    source_config: Dict[str, Any],
+    prompt: str,
+    size: str,
+    node_id: str,
+    storage: str = IMAGE_STORAGE_MEMORY
+) -> Dict[str, Any]:
+    """
+    Generate image using Gemini/Imagen.
     
-    # Configure Gemini
-    genai.configure(api_key=api_key)
+    Note: Gemini's image generation (Imagen) requires specific API access.
+    This implementation uses the genai library if available.
+    """
+    api_key = _gemini_api_key(source_config)
+    if api_key is None:
+        return _generate_placeholder(prompt, size)
     
     model_name = source_config.get("model", "imagen-3.0")
     
@@ -223,32 +540,49 @@ def _generate_with_gemini(
         # If it fails, we return a placeholder
         
         # Try using Gemini's image generation capabilities
-        model = genai.GenerativeModel(model_name)
+        model = bind_gemini_credentials(get_genai().GenerativeModel(model_name), api_key)
         
         # Generate with image generation prompt
-        response = model.generate_content(
-            f"Generate an image based on this description: {prompt}"
+        response = generate_content_with_retry(
+            model, f"Generate an image based on this description: {prompt}"
         )
+        return _read_image_response(response, prompt, model_name, size, storage)
         
-        # Check if response contains an image
-        if hasattr(response, "candidates") and response.candidates:
-            for candidate in response.candidates:
-                if hasattr(candidate, "content") and candidate.content:
-                    for part in candidate.content.parts:
-                        if hasattr(part, "inline_data"):
-                            # Image data found
-                            return {
-                                "type": "base64",
-                                "data": part.inline_data.data,
-                                "mime_type": part.inline_data.mime_type,
-                                "prompt": prompt,
-                                "model": model_name,
-                                "size": size,
-                            }
-        
-        # No image in response, return placeholder
-        logger.info("gemini_image_generation_no_image_in_response")
+    except Exception as e:
+        logger.warning(
+            "gemini_image_generation_failed",
+            error=str(e),
+            using_placeholder=True
+        )
+        return _generate_placeholder(prompt, size)
+
+
+async def _generate_with_gemini_async(
+    source_config: Dict[str, Any],
+    prompt: str,
+    size: str,
+    node_id: str,
+    storage: str = IMAGE_STORAGE_MEMORY
+) -> Dict[str, Any]:
+    """
+    Generate image using Gemini/Imagen without blocking the event loop.
+    
+    See _generate_with_gemini for the fallback behavior.
+    """
+    api_key = _gemini_api_key(source_config)
+    if api_key is None:
         return _generate_placeholder(prompt, size)
+    
+    model_name = source_config.get("model", "imagen-3.0")
+    
+    try:
+        model = bind_gemini_credentials(
+            get_genai().GenerativeModel(model_name), api_key, asynchronous=True
+        )
+        response = await generate_content_with_retry_async(
+            model, f"Generate an image based on this description: {prompt}"
+        )
+        return _read_image_response(response, prompt, model_name, size, storage)
         
     except Exception as e:
         logger.warning(
@@ -259,6 +593,66 @@ def _generate_with_gemini(
         return _generate_placeholder(prompt, size)
 
 
+def _gemini_api_key(source_config: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the API key for an image call.
+    
+    Returns:
+        The API key, or None if the SDK or API key is unavailable and a
+        placeholder should be returned
+    """
+    if get_genai() is None:
+        logger.warning("google-generativeai not installed, using placeholder")
+        return None
+    
+    # Get API key
+    api_key_env = source_config.get("api_key_env", "GEMINI_API_KEY")
+    api_key = os.getenv(api_key_env)
+    
+    if not api_key:
+        logger.warning(
+            "gemini_api_key_not_found",
+            env_var=api_key_env,
+            using_placeholder=True
+        )
+        return None
+    
+    return api_key
+
+
+def _read_image_response(
+    response: Any,
+    prompt: str,
+    model_name: str,
+    size: str,
+    storage: str = IMAGE_STORAGE_MEMORY
+) -> Dict[str, Any]:
+    """
+    Extract the first inline image from a Gemini response.
+    
+    Returns:
+        Image details, or a placeholder if the response has no image
+    """
+    # Check if response contains an image
+    if hasattr(response, "candidates") and response.candidates:
+        for candidate in response.candidates:
+            if hasattr(candidate, "content") and candidate.content:
+                for part in candidate.content.parts:
+                    if hasattr(part, "inline_data"):
+                        # Image data found
+                        inline_data = part.inline_data
+                        return {
+                            **_store_image(inline_data.data, inline_data.mime_type, storage),
+                            "prompt": prompt,
+                            "model": model_name,
+                            "size": size,
+                        }
+    
+    # No image in response, return placeholder
+    logger.info("gemini_image_generation_no_image_in_response")
+    return _generate_placeholder(prompt, size)
+
+
 def _generate_placeholder(prompt: str, size: str) -> Dict[str, Any]:
     """
     Generate a placeholder image result.
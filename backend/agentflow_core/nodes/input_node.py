@@ -5,7 +5,7 @@ Entry point node that accepts and processes user input.
 Passes state through with minimal transformation.
 """
 
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from agentflow_core.nodes.base_node import (
     NodeCallable,
@@ -13,7 +13,7 @@ from agentflow_core.nodes.base_node import (
     get_metadata_value,
 )
 from agentflow_core.runtime.state import GraphState, merge_state
-from agentflow_core.utils.logger import get_logger
+from agentflow_core.utils.logger import get_logger, is_log_enabled
 
 logger = get_logger(__name__)
 
@@ -46,29 +46,39 @@ def create_input_node(
     """
     _metadata = metadata or {}
     
+    # Metadata is fixed per node, so options are resolved once
+    input_key = get_metadata_value(_metadata, "input_key", "user_input")
+    output_key = get_metadata_value(_metadata, "output_key", input_key)
+    transform_fn = _resolve_transform(get_metadata_value(_metadata, "transform"))
+    checks = _compile_validation(get_metadata_value(_metadata, "validate"))
+    
     def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
         """Execute input node logic."""
-        input_key = get_metadata_value(meta, "input_key", "user_input")
-        output_key = get_metadata_value(meta, "output_key", input_key)
-        
         # Get input value
         input_value = state.get(input_key, "")
         
         # Optional: Apply transform
-        transform = get_metadata_value(meta, "transform")
-        if transform:
-            input_value = _apply_transform(input_value, transform)
+        if transform_fn is not None:
+            try:
+                input_value = transform_fn(input_value)
+            except TypeError:
+                # Transforms only apply to strings
+                pass
         
         # Optional: Validate input
-        validate = get_metadata_value(meta, "validate")
-        if validate:
-            _validate_input(input_value, validate)
+        for check in checks:
+            check(input_value)
         
-        logger.info(
-            "input_node_processed",
-            node_id=node_id,
-            input_length=len(str(input_value))
-        )
+        if is_log_enabled():
+            # Strings (the common case) are measured without a copy
+            logger.info(
+                "input_node_processed",
+                node_id=node_id,
+                input_length=(
+                    len(input_value) if isinstance(input_value, str)
+                    else len(str(input_value))
+                )
+            )
         
         # Update state
         updates: Dict[str, Any] = {}
@@ -87,36 +97,62 @@ def create_input_node(
     return create_node_wrapper(node_id, "input", execute, _metadata)
 
 
-def _apply_transform(value: Any, transform: str) -> Any:
-    """Apply a named transform to the input value."""
-    transforms = {
-        "lowercase": lambda v: v.lower() if isinstance(v, str) else v,
-        "uppercase": lambda v: v.upper() if isinstance(v, str) else v,
-        "strip": lambda v: v.strip() if isinstance(v, str) else v,
-        "trim": lambda v: v.strip() if isinstance(v, str) else v,
-    }
-    
-    transform_fn = transforms.get(transform.lower())
-    if transform_fn:
-        return transform_fn(value)
+# =============================================================================
+# Transforms and Validation
+# =============================================================================
+
+# Named transforms; unbound str methods raise TypeError for non-strings
+_TRANSFORMS: Dict[str, Callable[[str], str]] = {
+    "lowercase": str.lower,
+    "uppercase": str.upper,
+    "strip": str.strip,
+    "trim": str.strip,
+}
+
+
+def _resolve_transform(transform: Optional[str]) -> Optional[Callable[[str], str]]:
+    """Look up a named transform, warning about unknown names."""
+    if not transform:
+        return None
     
-    logger.warning("unknown_transform", transform=transform)
-    return value
+    transform_fn = _TRANSFORMS.get(transform.lower())
+    if transform_fn is None:
+        logger.warning("unknown_transform", transform=transform)
+    return transform_fn
 
 
-def _validate_input(value: Any, rules: Dict[str, Any]) -> None:
-    """Validate input against rules."""
+def _compile_validation(rules: Optional[Dict[str, Any]]) -> Tuple[Callable[[Any], None], ...]:
+    """
+    Turn validation rules into the checks run on every input.
+    
+    Each check raises ValueError when the input breaks its rule.
+    """
+    if not rules:
+        return ()
+    
+    checks: List[Callable[[Any], None]] = []
+    
     # Min length check
     min_length = rules.get("min_length")
-    if min_length and isinstance(value, str) and len(value) < min_length:
-        raise ValueError(f"Input must be at least {min_length} characters")
+    if min_length:
+        def check_min_length(value: Any) -> None:
+            if isinstance(value, str) and len(value) < min_length:
+                raise ValueError(f"Input must be at least {min_length} characters")
+        checks.append(check_min_length)
     
     # Max length check
     max_length = rules.get("max_length")
-    if max_length and isinstance(value, str) and len(value) > max_length:
-        raise ValueError(f"Input must be at most {max_length} characters")
+    if max_length:
+        def check_max_length(value: Any) -> None:
+            if isinstance(value, str) and len(value) > max_length:
+                raise ValueError(f"Input must be at most {max_length} characters")
+        checks.append(check_max_length)
     
     # Required check
-    required = rules.get("required", False)
-    if required and not value:
-        raise ValueError("Input is required")
+    if rules.get("required", False):
+        def check_required(value: Any) -> None:
+            if not value:
+                raise ValueError("Input is required")
+        checks.append(check_required)
+    
+    return tuple(checks)
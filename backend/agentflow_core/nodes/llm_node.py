@@ -5,19 +5,33 @@ Language model node that calls AI models for text generation.
 Supports Gemini AI (primary) and other LLM providers.
 """
 
+import asyncio
+import hashlib
+import inspect
 import os
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
 
 from agentflow_core.nodes.base_node import (
     NodeCallable,
+    compile_template,
     create_node_wrapper,
     get_metadata_value,
-    interpolate_template,
 )
 from agentflow_core.runtime.registry import get_source, has_source
-from agentflow_core.runtime.state import GraphState, add_tokens, merge_state
+from agentflow_core.runtime.state import GraphState, merge_state
+from agentflow_core.sources.llm_gemini import (
+    bind_gemini_credentials,
+    count_tokens,
+    count_tokens_async,
+    generate_content_with_retry,
+    generate_content_with_retry_async,
+    get_genai,
+)
 from agentflow_core.utils.error_handler import NodeExecutionError, SourceNotFoundError
-from agentflow_core.utils.logger import get_logger
+from agentflow_core.utils.logger import get_logger, is_log_enabled
 
 logger = get_logger(__name__)
 
@@ -43,10 +57,20 @@ def create_llm_node(
             - source_id: ID of the LLM source to use
             - prompt: Static prompt text
             - prompt_template: Template with {placeholders}
-            - system_prompt: Optional system prompt
+            - system_prompt: Optional system prompt (used verbatim)
+            - prompt_prefix: Static text placed before the prompt
+            - examples: Static few-shot examples placed after the prefix
             - temperature: Model temperature (0-2)
             - max_tokens: Maximum tokens to generate
             - output_key: State key for output (default: "text_result")
+            - cache: Reuse responses for identical temperature-0 calls
+              (default: True)
+            - track_tokens: Count tokens with the model's tokenizer when
+              the response carries no usage data; False records 0 instead
+              (default: True)
+            - stream_callback: Callable receiving each chunk of generated
+              text as it arrives (programmatic use only; Gemini streams,
+              other providers and cache hits deliver one chunk)
     
     Returns:
         A callable that performs LLM inference
@@ -59,75 +83,183 @@ def create_llm_node(
         ... })
     """
     _metadata = metadata or {}
+    prepare_call = _compile_llm_call(node_id, _metadata)
     
     def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
         """Execute LLM node logic."""
-        source_id = get_metadata_value(meta, "source_id")
-        prompt = get_metadata_value(meta, "prompt")
-        prompt_template = get_metadata_value(meta, "prompt_template")
-        system_prompt = get_metadata_value(meta, "system_prompt")
-        temperature = get_metadata_value(meta, "temperature", 0.7)
-        max_tokens = get_metadata_value(meta, "max_tokens", 4096)
-        output_key = get_metadata_value(meta, "output_key", "text_result")
+        call, output_key = prepare_call(state)
+        result, tokens_used = _call_llm(**call)
+        return _complete_llm_call(node_id, state, output_key, result, tokens_used)
+    
+    return create_node_wrapper(node_id, "llm", execute, _metadata)
+
+
+def create_llm_node_async(
+    node_id: str,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Callable[[GraphState], Awaitable[GraphState]]:
+    """
+    Create an async LLM node.
+    
+    Same configuration and behavior as create_llm_node, but the model call
+    is awaited instead of blocking a thread, so independent LLM nodes in a
+    graph run concurrently when the graph is executed with ainvoke().
+    
+    Args:
+        node_id: Unique identifier for this node
+        metadata: Configuration options (see create_llm_node); the
+            stream_callback may also be a coroutine function
+    
+    Returns:
+        An async callable that performs LLM inference
         
+    Example:
+        >>> node = create_llm_node_async("llm_1", {
+        ...     "prompt_template": "Respond to: {user_input}"
+        ... })
+        >>> result = await node(initial_state)
+    """
+    _metadata = metadata or {}
+    prepare_call = _compile_llm_call(node_id, _metadata)
+    
+    async def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
+        """Execute LLM node logic."""
+        call, output_key = prepare_call(state)
+        result, tokens_used = await _call_llm_async(**call)
+        return _complete_llm_call(node_id, state, output_key, result, tokens_used)
+    
+    return create_node_wrapper(node_id, "llm", execute, _metadata)
+
+
+def _compile_llm_call(
+    node_id: str,
+    metadata: Dict[str, Any]
+) -> Callable[[GraphState], Tuple[Dict[str, Any], str]]:
+    """
+    Resolve node metadata once and return the per-call preparation step.
+    
+    Metadata is fixed when the node is built, so options are read and the
+    static parts of the prompt are assembled here rather than on every call.
+    
+    Returns:
+        A callable mapping the state to (keyword arguments for _call_llm,
+        output state key)
+    """
+    source_id = get_metadata_value(metadata, "source_id")
+    prompt = get_metadata_value(metadata, "prompt")
+    prompt_template = get_metadata_value(metadata, "prompt_template")
+    system_prompt = get_metadata_value(metadata, "system_prompt")
+    temperature = get_metadata_value(metadata, "temperature", 0.7)
+    max_tokens = get_metadata_value(metadata, "max_tokens", 4096)
+    output_key = get_metadata_value(metadata, "output_key", "text_result")
+    use_cache = get_metadata_value(metadata, "cache", True)
+    prompt_prefix = get_metadata_value(metadata, "prompt_prefix")
+    examples = get_metadata_value(metadata, "examples") or ()
+    on_chunk = get_metadata_value(metadata, "stream_callback")
+    track_tokens = get_metadata_value(metadata, "track_tokens", True)
+    
+    # A template is compiled and a static prompt composed only once
+    render_prompt = compile_template(prompt_template) if prompt_template else None
+    static_prompt = None
+    if not prompt_template and prompt:
+        static_prompt = _compose_prompt(prompt_prefix, examples, prompt)
+    
+    def prepare(state: GraphState) -> Tuple[Dict[str, Any], str]:
+        """Resolve the prompt and model parameters for one LLM call."""
         # DEBUG: Log state to understand what's available
-        logger.info(
-            "llm_node_state_check",
-            node_id=node_id,
-            has_user_input="user_input" in state,
-            user_input_preview=str(state.get("user_input", ""))[:100],
-            state_keys=list(state.keys())
-        )
-        
-        # Build prompt from template or static prompt
-        if prompt_template:
-            final_prompt = interpolate_template(prompt_template, state)
+        log_enabled = is_log_enabled()
+        if log_enabled:
             logger.info(
-                "llm_node_template_interpolated",
-                node_id=node_id,
-                template_preview=prompt_template[:100],
-                interpolated_preview=final_prompt[:100]
-            )
-        elif prompt:
-            final_prompt = prompt
-        else:
-            # Use user_input as prompt if nothing else specified
-            final_prompt = state.get("user_input", "")
-        
-        if not final_prompt:
-            raise NodeExecutionError(
-                message="No prompt provided for LLM node",
+                "llm_node_state_check",
                 node_id=node_id,
-                node_type="llm"
+                has_user_input="user_input" in state,
+                user_input_preview=str(state.get("user_input", ""))[:100],
+                state_keys=list(state.keys())
             )
         
-        # Get source configuration
-        source_config = _get_llm_source_config(source_id, meta)
-        
-        # Call LLM
-        result, tokens_used = _call_llm(
-            source_config=source_config,
-            prompt=final_prompt,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            node_id=node_id
-        )
-        
-        logger.info(
-            "llm_node_completed",
-            node_id=node_id,
-            tokens_used=tokens_used,
-            output_length=len(result)
-        )
-        
-        # Update state
-        updated_state = merge_state(state, {output_key: result})
-        updated_state = add_tokens(updated_state, tokens_used)
+        # Build prompt from template or static prompt
+        if static_prompt is not None:
+            final_prompt = static_prompt
+        else:
+            if render_prompt is not None:
+                final_prompt = render_prompt(state)
+                if log_enabled:
+                    logger.info(
+                        "llm_node_template_interpolated",
+                        node_id=node_id,
+                        template_preview=prompt_template[:100],
+                        interpolated_preview=final_prompt[:100]
+                    )
+            else:
+                # Use user_input as prompt if nothing else specified
+                final_prompt = state.get("user_input", "")
+            
+            if not final_prompt:
+                raise NodeExecutionError(
+                    message="No prompt provided for LLM node",
+                    node_id=node_id,
+                    node_type="llm"
+                )
+            
+            final_prompt = _compose_prompt(prompt_prefix, examples, final_prompt)
         
-        return updated_state
+        call = {
+            # Registered sources can change between calls
+            "source_config": _get_llm_source_config(source_id, metadata),
+            "prompt": final_prompt,
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "node_id": node_id,
+            "use_cache": use_cache,
+            "on_chunk": on_chunk,
+            "track_tokens": track_tokens,
+        }
+        return call, output_key
     
-    return create_node_wrapper(node_id, "llm", execute, _metadata)
+    return prepare
+
+
+def _compose_prompt(
+    prefix: Optional[str],
+    examples: Sequence[str],
+    prompt: str
+) -> str:
+    """
+    Assemble the final prompt with static content first.
+    
+    Providers cache prompts by prefix, so the parts that are the same for
+    every call (system prompt, prefix, few-shot examples) come before the
+    per-call text. The system prompt is passed separately and never
+    interpolated with state for the same reason.
+    """
+    parts = [part for part in (prefix, *examples) if part]
+    if not parts:
+        return prompt
+    parts.append(prompt)
+    return "\n\n".join(parts)
+
+
+def _complete_llm_call(
+    node_id: str,
+    state: GraphState,
+    output_key: str,
+    result: str,
+    tokens_used: int
+) -> GraphState:
+    """Record an LLM result and its token usage in the state."""
+    logger.info(
+        "llm_node_completed",
+        node_id=node_id,
+        tokens_used=tokens_used,
+        output_length=len(result)
+    )
+    
+    # Update state (output and token count in a single copy)
+    return merge_state(state, {
+        output_key: result,
+        "tokens_used": state.get("tokens_used", 0) + tokens_used,
+    })
 
 
 # =============================================================================
@@ -168,6 +300,61 @@ def _get_llm_source_config(
     }
 
 
+# =============================================================================
+# Response Cache
+# =============================================================================
+
+# Deterministic (temperature 0) responses kept, least recently used evicted first
+RESPONSE_CACHE_SIZE = 256
+
+_response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_response_cache_lock = Lock()
+
+
+def _response_cache_key(
+    source_config: Dict[str, Any],
+    prompt: str,
+    system_prompt: Optional[str],
+    max_tokens: int
+) -> bytes:
+    """Hash everything that determines a temperature-0 response."""
+    parts = (
+        source_config.get("provider", "gemini"),
+        str(source_config.get("model", source_config.get("model_name", ""))),
+        system_prompt or "",
+        prompt,
+        str(max_tokens),
+    )
+    return hashlib.blake2b("\0".join(parts).encode(), digest_size=16).digest()
+
+
+def _get_cached_response(key: bytes, node_id: str) -> Optional[str]:
+    """Return a cached response, marking it as recently used."""
+    with _response_cache_lock:
+        text = _response_cache.get(key)
+        if text is not None:
+            _response_cache.move_to_end(key)
+    
+    if text is not None:
+        logger.info("llm_response_cache_hit", node_id=node_id)
+    return text
+
+
+def _cache_response(key: bytes, text: str) -> None:
+    """Store a response, evicting the least recently used beyond the limit."""
+    with _response_cache_lock:
+        _response_cache[key] = text
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+def clear_llm_cache() -> None:
+    """Drop all cached LLM responses."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
 # =============================================================================
 # LLM Calling
 # =============================================================================
@@ -179,27 +366,43 @@ def _call_llm(
     system_prompt: Optional[str],
     temperature: float,
     max_tokens: int,
-    node_id: str
+    node_id: str,
+    use_cache: bool = True,
+    on_chunk: Optional[Callable[[str], Any]] = None,
+    track_tokens: bool = True
 ) -> tuple[str, int]:
     """
     Call the LLM API and return the result.
     
+    With `on_chunk`, generated text is also passed to it as it arrives.
+    
     Returns:
         Tuple of (generated_text, tokens_used)
     """
+    cache_key = None
+    if use_cache and temperature == 0:
+        cache_key = _response_cache_key(source_config, prompt, system_prompt, max_tokens)
+        cached = _get_cached_response(cache_key, node_id)
+        if cached is not None:
+            if on_chunk is not None:
+                on_chunk(cached)
+            return cached, 0
+    
     provider = source_config.get("provider", "gemini")
     
     if provider == "gemini":
-        return _call_gemini(
+        result = _call_gemini(
             source_config=source_config,
             prompt=prompt,
             system_prompt=system_prompt,
             temperature=temperature,
             max_tokens=max_tokens,
-            node_id=node_id
+            node_id=node_id,
+            on_chunk=on_chunk,
+            track_tokens=track_tokens
         )
     elif provider == "groq":
-        return _call_groq(
+        result = _call_groq(
             source_config=source_config,
             prompt=prompt,
             system_prompt=system_prompt,
@@ -207,37 +410,170 @@ def _call_llm(
             max_tokens=max_tokens,
             node_id=node_id
         )
+        if on_chunk is not None:
+            on_chunk(result[0])
     else:
         raise NodeExecutionError(
             message=f"Unsupported LLM provider: {provider}",
             node_id=node_id,
             node_type="llm"
         )
+    
+    if cache_key is not None:
+        _cache_response(cache_key, result[0])
+    
+    return result
 
 
-def _call_gemini(
+async def _call_llm_async(
     source_config: Dict[str, Any],
     prompt: str,
     system_prompt: Optional[str],
     temperature: float,
     max_tokens: int,
-    node_id: str
+    node_id: str,
+    use_cache: bool = True,
+    on_chunk: Optional[Callable[[str], Any]] = None,
+    track_tokens: bool = True
 ) -> tuple[str, int]:
     """
-    Call Google Gemini API.
+    Call the LLM API without blocking the event loop.
+    
+    With `on_chunk` (a function or coroutine function), generated text is
+    also passed to it as it arrives.
     
     Returns:
         Tuple of (generated_text, tokens_used)
     """
-    try:
-        import google.generativeai as genai
-    except ImportError:
+    cache_key = None
+    if use_cache and temperature == 0:
+        cache_key = _response_cache_key(source_config, prompt, system_prompt, max_tokens)
+        cached = _get_cached_response(cache_key, node_id)
+        if cached is not None:
+            await _deliver_chunk(on_chunk, cached)
+            return cached, 0
+    
+    provider = source_config.get("provider", "gemini")
+    
+    if provider == "gemini":
+        result = await _call_gemini_async(
+            source_config=source_config,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            node_id=node_id,
+            on_chunk=on_chunk,
+            track_tokens=track_tokens
+        )
+    elif provider == "groq":
+        # The Groq client used here is synchronous; keep it off the loop
+        result = await asyncio.to_thread(
+            _call_groq,
+            source_config=source_config,
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            node_id=node_id
+        )
+        await _deliver_chunk(on_chunk, result[0])
+    else:
         raise NodeExecutionError(
-            message="google-generativeai package not installed",
+            message=f"Unsupported LLM provider: {provider}",
             node_id=node_id,
             node_type="llm"
         )
     
+    if cache_key is not None:
+        _cache_response(cache_key, result[0])
+    
+    return result
+
+
+async def _deliver_chunk(
+    on_chunk: Optional[Callable[[str], Any]],
+    text: str
+) -> None:
+    """Pass non-streamed text to a stream callback as a single chunk."""
+    if on_chunk is None:
+        return
+    delivered = on_chunk(text)
+    if inspect.isawaitable(delivered):
+        await delivered
+
+
+def _call_gemini(
+    source_config: Dict[str, Any],
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    node_id: str,
+    on_chunk: Optional[Callable[[str], Any]] = None,
+    track_tokens: bool = True
+) -> tuple[str, int]:
+    """
+    Call Google Gemini API, streaming the response when `on_chunk` is set.
+    
+    Returns:
+        Tuple of (generated_text, tokens_used)
+    """
+    model, model_name = _get_gemini_model(
+        source_config, system_prompt, temperature, max_tokens, node_id
+    )
+    
+    try:
+        # Generate response (transient failures are retried with backoff)
+        response = generate_content_with_retry(model, prompt, on_chunk)
+        return _read_gemini_response(response, prompt, model, model_name, track_tokens)
+    except Exception as e:
+        raise _gemini_call_error(e, model_name, node_id)
+
+
+async def _call_gemini_async(
+    source_config: Dict[str, Any],
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    node_id: str,
+    on_chunk: Optional[Callable[[str], Any]] = None,
+    track_tokens: bool = True
+) -> tuple[str, int]:
+    """
+    Call Google Gemini API without blocking the event loop.
+    
+    Returns:
+        Tuple of (generated_text, tokens_used)
+    """
+    model, model_name = _get_gemini_model(
+        source_config, system_prompt, temperature, max_tokens, node_id,
+        asynchronous=True
+    )
+    
+    try:
+        # Generate response (transient failures are retried with backoff)
+        response = await generate_content_with_retry_async(model, prompt, on_chunk)
+        return await _read_gemini_response_async(response, prompt, model, model_name, track_tokens)
+    except Exception as e:
+        raise _gemini_call_error(e, model_name, node_id)
+
+
+def _get_gemini_model(
+    source_config: Dict[str, Any],
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    node_id: str,
+    asynchronous: bool = False
+) -> Tuple[Any, str]:
+    """
+    Get the model for one call, bound to the source's API key.
+    
+    Returns:
+        Tuple of (GenerativeModel, model_name)
+    """
     # Get API key
     api_key_env = source_config.get("api_key_env", "GEMINI_API_KEY")
     api_key = os.getenv(api_key_env)
@@ -249,63 +585,148 @@ def _call_gemini(
             node_type="llm"
         )
     
-    # Configure Gemini
-    genai.configure(api_key=api_key)
+    if get_genai() is None:
+        raise NodeExecutionError(
+            message="google-generativeai package not installed",
+            node_id=node_id,
+            node_type="llm"
+        )
     
     # Get model
     model_name = source_config.get("model", source_config.get("model_name", "gemini-2.5-flash"))
     
+    try:
+        model = _build_gemini_model(api_key, model_name, system_prompt, temperature, max_tokens)
+        model = bind_gemini_credentials(model, api_key, asynchronous)
+    except Exception as e:
+        raise _gemini_call_error(e, model_name, node_id)
+    
+    return model, model_name
+
+
+@lru_cache(maxsize=64)
+def _build_gemini_model(
+    api_key: str,
+    model_name: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    max_tokens: int
+) -> Any:
+    """
+    Build a GenerativeModel, shared by all calls with the same settings.
+    
+    Models are bound to the clients of their API key, so the key is part
+    of the cache key.
+    """
+    genai = get_genai()
+    
     # Create generation config
     generation_config = genai.GenerationConfig(
         temperature=temperature,
         max_output_tokens=max_tokens,
     )
     
-    try:
-        # Create model instance
-        model = genai.GenerativeModel(
-            model_name=model_name,
-            system_instruction=system_prompt,
-            generation_config=generation_config,
-        )
-        
-        # Generate response
-        response = model.generate_content(prompt)
-        
-        # Extract text
+    # Create model instance
+    return genai.GenerativeModel(
+        model_name=model_name,
+        system_instruction=system_prompt,
+        generation_config=generation_config,
+    )
+
+
+def _read_gemini_response(
+    response: Any,
+    prompt: str,
+    model: Any,
+    model_name: str,
+    track_tokens: bool = True,
+    counted_tokens: Optional[int] = None
+) -> tuple[str, int]:
+    """
+    Extract the generated text and token usage from a Gemini response.
+    
+    Responses without usage data are counted with the model's tokenizer
+    (cached per text), unless `track_tokens` is off or the caller already
+    counted them (`counted_tokens`).
+    
+    Returns:
+        Tuple of (generated_text, tokens_used)
+    """
+    # Extract text
+    generated_text = response.text if response.text else ""
+    
+    prompt_length = len(prompt)
+    response_length = len(generated_text)
+    
+    # Get token count (approximate if not available)
+    tokens_used = 0
+    cached_tokens = 0
+    if hasattr(response, "usage_metadata"):
+        usage = response.usage_metadata
+        tokens_used = getattr(usage, "total_token_count", 0)
+        # Prompt tokens served from the provider's prefix cache
+        cached_tokens = getattr(usage, "cached_content_token_count", 0)
+    elif counted_tokens is not None:
+        tokens_used = counted_tokens
+    elif track_tokens:
+        tokens_used = count_tokens(model, prompt) + count_tokens(model, generated_text)
+    
+    logger.info(
+        "gemini_call_success",
+        model=model_name,
+        prompt_length=prompt_length,
+        response_length=response_length,
+        tokens_used=tokens_used,
+        cached_tokens=cached_tokens
+    )
+    
+    return generated_text, tokens_used
+
+
+async def _read_gemini_response_async(
+    response: Any,
+    prompt: str,
+    model: Any,
+    model_name: str,
+    track_tokens: bool = True
+) -> tuple[str, int]:
+    """
+    Async variant of _read_gemini_response.
+    
+    Missing usage data is counted through the model's async client, so
+    the event loop is not blocked and the source's API key is used.
+    """
+    counted_tokens = None
+    if track_tokens and not hasattr(response, "usage_metadata"):
         generated_text = response.text if response.text else ""
-        
-        # Get token count (approximate if not available)
-        tokens_used = 0
-        if hasattr(response, "usage_metadata"):
-            usage = response.usage_metadata
-            tokens_used = getattr(usage, "total_token_count", 0)
-        else:
-            # Approximate: 4 chars per token
-            tokens_used = (len(prompt) + len(generated_text)) // 4
-        
-        logger.info(
-            "gemini_call_success",
-            model=model_name,
-            prompt_length=len(prompt),
-            response_length=len(generated_text),
-            tokens_used=tokens_used
-        )
-        
-        return generated_text, tokens_used
-        
-    except Exception as e:
-        logger.error(
-            "gemini_call_failed",
-            model=model_name,
-            error=str(e)
-        )
-        raise NodeExecutionError(
-            message=f"Gemini API call failed: {str(e)}",
-            node_id=node_id,
-            node_type="llm",
-            original_error=e
+        prompt_tokens, text_tokens = await asyncio.gather(
+            count_tokens_async(model, prompt),
+            count_tokens_async(model, generated_text)
         )
+        counted_tokens = prompt_tokens + text_tokens
+    
+    return _read_gemini_response(
+        response, prompt, model, model_name, track_tokens, counted_tokens
+    )
+
+
+def _gemini_call_error(
+    error: Exception,
+    model_name: str,
+    node_id: str
+) -> NodeExecutionError:
+    """Log a failed Gemini call and wrap it as a NodeExecutionError."""
+    logger.error(
+        "gemini_call_failed",
+        model=model_name,
+        error=str(error)
+    )
+    return NodeExecutionError(
+        message=f"Gemini API call failed: {str(error)}",
+        node_id=node_id,
+        node_type="llm",
+        original_error=error
+    )
 
 
 def _call_groq(
@@ -389,20 +810,3 @@ def _call_groq(
             node_type="llm",
             original_error=e
         )
-
-
-# =============================================================================
-# Async Version (for future use)
-# =============================================================================
-
-
-async def create_llm_node_async(
-    node_id: str,
-    metadata: Optional[Dict[str, Any]] = None
-) -> NodeCallable:
-    """
-    Create an async LLM node.
-    
-    Note: Currently not implemented. Use sync version.
-    """
-    raise NotImplementedError("Async LLM node not yet implemented")
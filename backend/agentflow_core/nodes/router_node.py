@@ -6,6 +6,8 @@ Supports keyword-based, rule-based, and LLM-based routing strategies.
 """
 
 import re
+import string
+from functools import lru_cache, partial
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from agentflow_core.nodes.base_node import (
@@ -33,6 +35,12 @@ class RoutingStrategy:
     DEFAULT = "default"
 
 
+class KeywordMatchMode:
+    """Constants for how a keyword route's keywords match the input."""
+    SUBSTRING = "substring"
+    TOKEN = "token"
+
+
 # =============================================================================
 # Main Router Node Factory
 # =============================================================================
@@ -60,6 +68,7 @@ def create_router_node(
         {
             "intent": "greeting",
             "keywords": ["hello", "hi", "hey"],  # For keyword strategy
+            "match_mode": "token",               # Whole words only (default: "substring")
             "pattern": "^(hello|hi).*",          # For pattern strategy
             "condition": "contains('help')",      # For rules strategy
         }
@@ -79,30 +88,22 @@ def create_router_node(
     """
     _metadata = metadata or {}
     
+    # Metadata is fixed per node, so routes are parsed and compiled once
+    strategy = get_metadata_value(_metadata, "strategy", RoutingStrategy.KEYWORD)
+    routes = get_metadata_value(_metadata, "routes", [])
+    default_intent = get_metadata_value(_metadata, "default_intent", "unknown")
+    input_key = get_metadata_value(_metadata, "input_key", "user_input")
+    
+    # Routes are compiled and the strategy resolved once, so each call
+    # is a single classify() call
+    classify = _compile_classifier(strategy, routes, default_intent)
+    
     def execute(state: GraphState, meta: Dict[str, Any]) -> GraphState:
         """Execute router node logic."""
-        strategy = get_metadata_value(meta, "strategy", RoutingStrategy.KEYWORD)
-        routes = get_metadata_value(meta, "routes", [])
-        default_intent = get_metadata_value(meta, "default_intent", "unknown")
-        input_key = get_metadata_value(meta, "input_key", "user_input")
-        
         # Get input to route
         input_value = str(state.get(input_key, ""))
         
-        # Determine intent based on strategy
-        intent = default_intent
-        
-        if strategy == RoutingStrategy.KEYWORD:
-            intent = _route_by_keyword(input_value, routes, default_intent)
-        elif strategy == RoutingStrategy.PATTERN:
-            intent = _route_by_pattern(input_value, routes, default_intent)
-        elif strategy == RoutingStrategy.RULES:
-            intent = _route_by_rules(input_value, routes, default_intent, state)
-        elif strategy == RoutingStrategy.LLM:
-            # LLM-based routing (requires source)
-            intent = _route_by_llm(input_value, routes, default_intent, meta, state)
-        else:
-            logger.warning("unknown_routing_strategy", strategy=strategy)
+        intent = classify(input_value, meta, state)
         
         logger.info(
             "router_classified",
@@ -121,40 +122,257 @@ def create_router_node(
 # =============================================================================
 
 
-def _route_by_keyword(
-    input_value: str,
+def _compile_classifier(
+    strategy: str,
     routes: List[Dict[str, Any]],
     default_intent: str
-) -> str:
+) -> Callable[[str, Dict[str, Any], GraphState], str]:
     """
-    Route based on keyword matching.
+    Compile a router's routes into a classify(input, metadata, state) call.
     
-    Checks if any keywords from routes are present in the input.
+    Each strategy normalizes only the route fields it reads, so the
+    per-call path iterates tuples or compiled matchers, not route dicts.
+    """
+    if strategy == RoutingStrategy.KEYWORD:
+        match_keyword_route = _compile_keyword_routes(routes)
+        return lambda input_value, metadata, state: _route_by_keyword(
+            input_value, match_keyword_route, default_intent
+        )
+    
+    if strategy == RoutingStrategy.PATTERN:
+        match_pattern_route = _compile_pattern_routes(routes)
+        return lambda input_value, metadata, state: _route_by_pattern(
+            input_value, match_pattern_route, default_intent
+        )
+    
+    if strategy == RoutingStrategy.RULES:
+        rule_routes = _compile_rule_routes(routes)
+        return lambda input_value, metadata, state: _route_by_rules(
+            input_value, rule_routes, default_intent, state
+        )
+    
+    if strategy == RoutingStrategy.LLM:
+        # LLM-based routing (requires source)
+        match_keyword_route = _compile_keyword_routes(routes)
+        return lambda input_value, metadata, state: _route_by_llm(
+            input_value, match_keyword_route, default_intent, metadata, state
+        )
+    
+    def classify_unknown(input_value: str, metadata: Dict[str, Any], state: GraphState) -> str:
+        logger.warning("unknown_routing_strategy", strategy=strategy)
+        return default_intent
+    
+    return classify_unknown
+
+
+def _compile_keyword_routes(
+    routes: List[Dict[str, Any]]
+) -> Callable[[str], Optional[str]]:
+    """
+    Compile keyword routes into a matcher returning the first matching intent.
+    
+    Matching is case-insensitive and routes are tried in order. With
+    pyahocorasick installed, all keywords go into one Aho-Corasick
+    automaton and the input is scanned once. Without it, large keyword
+    sets are matched by walking a trie from each input position, and
+    smaller ones by a substring test per keyword, which is faster there.
+    Routes with match_mode "token" are compiled by
+    _compile_token_keyword_routes instead. Routes without an intent or
+    keywords are dropped.
+    """
+    if any(route.get("match_mode") == KeywordMatchMode.TOKEN for route in routes):
+        return _compile_token_keyword_routes(routes)
+    
+    keyword_routes = tuple(
+        (route["intent"], tuple(keyword.lower() for keyword in route["keywords"]))
+        for route in routes
+        if route.get("intent") and route.get("keywords")
+    )
+    
+    automaton = _build_keyword_automaton(keyword_routes)
+    if automaton is not None:
+        def match_automaton(input_value: str) -> Optional[str]:
+            # Matches arrive by position, so keep the earliest route
+            best: Optional[Tuple[int, str]] = None
+            for _, found in automaton.iter(input_value.lower()):
+                if best is None or found[0] < best[0]:
+                    best = found
+                    if best[0] == 0:
+                        break
+            return best[1] if best is not None else None
+        
+        return match_automaton
+    
+    keyword_count = sum(len(keywords) for _, keywords in keyword_routes)
+    # An empty keyword matches every input, which only the loop handles
+    if keyword_count >= KEYWORD_TRIE_MIN_KEYWORDS and not any(
+        "" in keywords for _, keywords in keyword_routes
+    ):
+        trie = _build_keyword_trie(keyword_routes)
+        
+        def match_trie(input_value: str) -> Optional[str]:
+            input_lower = input_value.lower()
+            end = len(input_lower)
+            best: Optional[Tuple[int, str]] = None
+            for start in range(end):
+                node = trie.get(input_lower[start])
+                position = start + 1
+                while node is not None:
+                    found = node.get(_TRIE_LEAF)
+                    if found is not None and (best is None or found[0] < best[0]):
+                        best = found
+                        if best[0] == 0:
+                            return best[1]
+                    if position == end:
+                        break
+                    node = node.get(input_lower[position])
+                    position += 1
+            return best[1] if best is not None else None
+        
+        return match_trie
+    
+    # One flat (keyword, intent) sequence in route order. A keyword shared
+    # by several routes belongs to the first one, so later copies, which
+    # could never decide the intent, are dropped.
+    keyword_owners: Dict[str, str] = {}
+    for intent, keywords in keyword_routes:
+        for keyword in keywords:
+            keyword_owners.setdefault(keyword, intent)
+    keyword_intents = tuple(keyword_owners.items())
+    
+    def match_each(input_value: str) -> Optional[str]:
+        input_lower = input_value.lower()
+        for keyword, intent in keyword_intents:
+            if keyword in input_lower:
+                return intent
+        return None
+    
+    return match_each
+
+
+# Punctuation is read as a word boundary when splitting input into tokens
+_TOKEN_SEPARATORS = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split lowercased text into words at whitespace and punctuation."""
+    return text.translate(_TOKEN_SEPARATORS).split()
+
+
+def _compile_token_keyword_routes(
+    routes: List[Dict[str, Any]]
+) -> Callable[[str], Optional[str]]:
     """
-    input_lower = input_value.lower()
+    Compile keyword routes where some routes match whole words only.
+    
+    The input is split into a set of words once per call, and each
+    "token" route is a single set intersection test against its words.
+    A keyword that is not a single word (e.g. "not working") is still
+    matched as a substring, as are all keywords of other routes. Routes
+    are tried in order.
+    """
+    compiled_routes = []
     
     for route in routes:
         intent = route.get("intent")
-        keywords = route.get("keywords", [])
-        
+        keywords = route.get("keywords")
         if not intent or not keywords:
             continue
         
-        for keyword in keywords:
-            if keyword.lower() in input_lower:
+        keywords = tuple(keyword.lower() for keyword in keywords)
+        if route.get("match_mode") == KeywordMatchMode.TOKEN:
+            words = frozenset(k for k in keywords if _tokenize(k) == [k])
+            phrases = tuple(k for k in keywords if k not in words)
+        else:
+            words, phrases = frozenset(), keywords
+        compiled_routes.append((intent, words, phrases))
+    
+    def match_tokens(input_value: str) -> Optional[str]:
+        input_lower = input_value.lower()
+        tokens = frozenset(_tokenize(input_lower))
+        for intent, words, phrases in compiled_routes:
+            if not words.isdisjoint(tokens):
                 return intent
+            for phrase in phrases:
+                if phrase in input_lower:
+                    return intent
+        return None
     
-    return default_intent
+    return match_tokens
 
 
-def _route_by_pattern(
-    input_value: str,
-    routes: List[Dict[str, Any]],
-    default_intent: str
-) -> str:
+# Keyword count from which a trie walk beats per-keyword substring tests
+KEYWORD_TRIE_MIN_KEYWORDS = 256
+
+# Trie key holding the (route index, intent) of a keyword ending at a node
+_TRIE_LEAF = ""
+
+
+def _build_keyword_trie(
+    keyword_routes: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Dict[str, Any]:
     """
-    Route based on regex pattern matching.
+    Build a dict-of-dicts trie of keywords with (route index, intent) leaves.
+    """
+    root: Dict[str, Any] = {}
+    for index, (intent, keywords) in enumerate(keyword_routes):
+        for keyword in keywords:
+            node = root
+            for char in keyword:
+                node = node.setdefault(char, {})
+            # A keyword shared by several routes belongs to the first one
+            node.setdefault(_TRIE_LEAF, (index, intent))
+    return root
+
+
+def _build_keyword_automaton(
+    keyword_routes: Tuple[Tuple[str, Tuple[str, ...]], ...]
+) -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton mapping keywords to (route index, intent).
+    
+    Returns:
+        The automaton, or None if pyahocorasick is not installed or the
+        routes cannot be represented (no keywords, or an empty keyword,
+        which matches every input)
     """
+    if not keyword_routes or any("" in keywords for _, keywords in keyword_routes):
+        return None
+    
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for index, (intent, keywords) in enumerate(keyword_routes):
+        for keyword in keywords:
+            # A keyword shared by several routes belongs to the first one
+            if keyword not in automaton:
+                automaton.add_word(keyword, (index, intent))
+    automaton.make_automaton()
+    
+    return automaton
+
+
+# Backreferences are numbered per pattern, so such patterns cannot be combined
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _compile_pattern_routes(
+    routes: List[Dict[str, Any]]
+) -> Callable[[str], Optional[str]]:
+    """
+    Compile pattern routes into a matcher returning the first matching intent.
+    
+    All patterns are joined into one alternation, in route order, so an
+    input is matched in a single scan and the matching route is read from
+    the outermost group. The joined regex is cached per route set. Patterns
+    that cannot be combined fall back to being tried one by one. Invalid
+    patterns are logged and dropped.
+    """
+    compiled: List[Tuple[str, "re.Pattern[str]"]] = []
+    
     for route in routes:
         intent = route.get("intent")
         pattern = route.get("pattern")
@@ -162,26 +380,114 @@ def _route_by_pattern(
         if not intent or not pattern:
             continue
         
-        try:
-            if re.match(pattern, input_value, re.IGNORECASE):
+        route_pattern = _compile_route_pattern(pattern)
+        if route_pattern is not None:
+            compiled.append((intent, route_pattern))
+    
+    combined = _combine_patterns(tuple(compiled))
+    if combined is not None:
+        pattern, intents_by_group = combined
+        
+        def match_combined(input_value: str) -> Optional[str]:
+            match = pattern.match(input_value)
+            return intents_by_group[match.lastindex] if match else None
+        
+        return match_combined
+    
+    def match_each(input_value: str) -> Optional[str]:
+        for intent, route_pattern in compiled:
+            if route_pattern.match(input_value):
                 return intent
-        except re.error as e:
-            logger.warning("invalid_regex_pattern", pattern=pattern, error=str(e))
+        return None
     
-    return default_intent
+    return match_each
 
 
-def _route_by_rules(
+@lru_cache(maxsize=1024)
+def _compile_route_pattern(pattern: str) -> Optional["re.Pattern[str]"]:
+    """
+    Compile a route pattern, shared by every router that uses it.
+    
+    Failures are cached too, so an invalid pattern is logged once.
+    
+    Returns:
+        The case-insensitive pattern, or None if it is invalid
+    """
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        logger.warning("invalid_regex_pattern", pattern=pattern, error=str(e))
+        return None
+
+
+@lru_cache(maxsize=256)
+def _combine_patterns(
+    compiled: Tuple[Tuple[str, "re.Pattern[str]"], ...]
+) -> Optional[Tuple["re.Pattern[str]", Dict[int, str]]]:
+    """
+    Join route patterns into one regex with a capturing group per route.
+    
+    Returns:
+        The combined pattern and a map from group index to intent, or
+        None if the patterns cannot be combined
+    """
+    if not compiled or any(_BACKREFERENCE.search(p.pattern) for _, p in compiled):
+        return None
+    
+    intents_by_group: Dict[int, str] = {}
+    group = 1
+    for intent, pattern in compiled:
+        intents_by_group[group] = intent
+        group += pattern.groups + 1
+    
+    try:
+        combined = re.compile(
+            "|".join(f"({pattern.pattern})" for _, pattern in compiled),
+            re.IGNORECASE
+        )
+    except re.error:
+        # e.g. inline global flags or repeated group names
+        return None
+    
+    return combined, intents_by_group
+
+
+def _route_by_keyword(
     input_value: str,
-    routes: List[Dict[str, Any]],
-    default_intent: str,
-    state: GraphState
+    match_keyword_route: Callable[[str], Optional[str]],
+    default_intent: str
 ) -> str:
     """
-    Route based on rule evaluation.
+    Route based on keyword matching.
+    
+    Checks if any keywords from routes are present in the input.
+    """
+    return match_keyword_route(input_value) or default_intent
+
+
+def _route_by_pattern(
+    input_value: str,
+    match_pattern_route: Callable[[str], Optional[str]],
+    default_intent: str
+) -> str:
+    """
+    Route based on regex pattern matching.
+    """
+    return match_pattern_route(input_value) or default_intent
+
+
+def _compile_rule_routes(
+    routes: List[Dict[str, Any]]
+) -> Tuple[Tuple[str, Callable[[str, Optional[str]], bool], bool], ...]:
+    """
+    Parse each route's condition into an (intent, check, uses_text) triple.
     
-    Supports simple condition expressions.
+    uses_text is False for length conditions, which never read the
+    lowercased input. Routes without an intent or condition, or with an
+    unsupported condition (logged), are dropped, as they can never match.
     """
+    rule_routes = []
+    
     for route in routes:
         intent = route.get("intent")
         condition = route.get("condition")
@@ -189,16 +495,109 @@ def _route_by_rules(
         if not intent or not condition:
             continue
         
-        if _evaluate_condition(condition, input_value, state):
+        check = _parse_condition(condition)
+        if check is not None:
+            rule_routes.append((intent, check, check.func not in _LENGTH_PREDICATES))
+    
+    return tuple(rule_routes)
+
+
+def _route_by_rules(
+    input_value: str,
+    rule_routes: Tuple[Tuple[str, Callable[[str, Optional[str]], bool], bool], ...],
+    default_intent: str,
+    state: GraphState
+) -> str:
+    """
+    Route based on rule evaluation.
+    
+    Supports simple condition expressions, parsed when the node is built.
+    """
+    # Lowercased on the first text condition and shared by the rest, so
+    # length-only rules never copy the input
+    input_lower = None
+    
+    for intent, check, uses_text in rule_routes:
+        if uses_text and input_lower is None:
+            input_lower = input_value.lower()
+        if check(input_value, input_lower):
             return intent
     
     return default_intent
 
 
+def _condition_contains(text: str, input_value: str, input_lower: str) -> bool:
+    """Input contains the text (case-insensitive)."""
+    return text in input_lower
+
+
+def _condition_starts_with(text: str, input_value: str, input_lower: str) -> bool:
+    """Input starts with the text (case-insensitive)."""
+    return input_lower.startswith(text)
+
+
+def _condition_ends_with(text: str, input_value: str, input_lower: str) -> bool:
+    """Input ends with the text (case-insensitive)."""
+    return input_lower.endswith(text)
+
+
+def _condition_length_gt(n: int, input_value: str, input_lower: str) -> bool:
+    """Input is longer than n characters."""
+    return len(input_value) > n
+
+
+def _condition_length_lt(n: int, input_value: str, input_lower: str) -> bool:
+    """Input is shorter than n characters."""
+    return len(input_value) < n
+
+
+def _condition_equals(text: str, input_value: str, input_lower: str) -> bool:
+    """Input equals the text (case-insensitive)."""
+    return input_lower == text
+
+
+# Predicates that only look at the input's length
+_LENGTH_PREDICATES = frozenset({_condition_length_gt, _condition_length_lt})
+
+
+# Function name before "(" -> (argument parser, operand conversion, predicate);
+# text operands are lowercased once when the condition is parsed
+_CONDITION_HANDLERS: Dict[str, Tuple["re.Pattern[str]", Callable[[str], Any], Callable[..., bool]]] = {
+    "contains": (re.compile(r"contains\(['\"](.+)['\"]\)"), str.lower, _condition_contains),
+    "starts_with": (re.compile(r"starts_with\(['\"](.+)['\"]\)"), str.lower, _condition_starts_with),
+    "ends_with": (re.compile(r"ends_with\(['\"](.+)['\"]\)"), str.lower, _condition_ends_with),
+    "length_gt": (re.compile(r"length_gt\((\d+)\)"), int, _condition_length_gt),
+    "length_lt": (re.compile(r"length_lt\((\d+)\)"), int, _condition_length_lt),
+    "equals": (re.compile(r"equals\(['\"](.+)['\"]\)"), str.lower, _condition_equals),
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_condition(condition: str) -> Optional[Callable[[str, str], bool]]:
+    """
+    Parse a condition expression into a check on (input, lowercased input).
+    
+    Results are cached, so each distinct condition is parsed once.
+    
+    Returns:
+        The check, or None if the condition is not supported
+    """
+    handler = _CONDITION_HANDLERS.get(condition.partition("(")[0])
+    if handler is not None:
+        pattern, convert, predicate = handler
+        match = pattern.match(condition)
+        if match:
+            return partial(predicate, convert(match.group(1)))
+    
+    logger.warning("unsupported_condition", condition=condition)
+    return None
+
+
 def _evaluate_condition(
     condition: str,
     input_value: str,
-    state: GraphState
+    state: GraphState,
+    input_lower: Optional[str] = None
 ) -> bool:
     """
     Evaluate a simple condition expression.
@@ -210,47 +609,21 @@ def _evaluate_condition(
     - length_gt(n): Check if input length > n
     - length_lt(n): Check if input length < n
     - equals('text'): Check if input equals text
-    """
-    input_lower = input_value.lower()
     
-    # Parse condition
-    if condition.startswith("contains("):
-        match = re.match(r"contains\(['\"](.+)['\"]\)", condition)
-        if match:
-            return match.group(1).lower() in input_lower
-    
-    elif condition.startswith("starts_with("):
-        match = re.match(r"starts_with\(['\"](.+)['\"]\)", condition)
-        if match:
-            return input_lower.startswith(match.group(1).lower())
-    
-    elif condition.startswith("ends_with("):
-        match = re.match(r"ends_with\(['\"](.+)['\"]\)", condition)
-        if match:
-            return input_lower.endswith(match.group(1).lower())
-    
-    elif condition.startswith("length_gt("):
-        match = re.match(r"length_gt\((\d+)\)", condition)
-        if match:
-            return len(input_value) > int(match.group(1))
-    
-    elif condition.startswith("length_lt("):
-        match = re.match(r"length_lt\((\d+)\)", condition)
-        if match:
-            return len(input_value) < int(match.group(1))
-    
-    elif condition.startswith("equals("):
-        match = re.match(r"equals\(['\"](.+)['\"]\)", condition)
-        if match:
-            return input_lower == match.group(1).lower()
+    Unsupported conditions are logged once and evaluate to False.
+    """
+    check = _parse_condition(condition)
+    if check is None:
+        return False
     
-    logger.warning("unsupported_condition", condition=condition)
-    return False
+    if input_lower is None:
+        input_lower = input_value.lower()
+    return check(input_value, input_lower)
 
 
 def _route_by_llm(
     input_value: str,
-    routes: List[Dict[str, Any]],
+    match_keyword_route: Callable[[str], Optional[str]],
     default_intent: str,
     metadata: Dict[str, Any],
     state: GraphState
@@ -263,7 +636,7 @@ def _route_by_llm(
     # Note: For MVP, we'll use keyword routing as fallback
     # Full LLM routing will be implemented with source integration
     logger.info("llm_routing_not_implemented_using_keyword_fallback")
-    return _route_by_keyword(input_value, routes, default_intent)
+    return _route_by_keyword(input_value, match_keyword_route, default_intent)
 
 
 # =============================================================================
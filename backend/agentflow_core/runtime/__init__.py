@@ -4,6 +4,9 @@ AgentFlow Core - Runtime Module
 Exports all runtime components for workflow building and execution.
 """
 
+from importlib import import_module
+from typing import Any
+
 from agentflow_core.runtime.state import GraphState
 from agentflow_core.runtime.registry import (
     register_source,
@@ -19,14 +22,27 @@ from agentflow_core.runtime.validator import (
     ValidationError,
     validate_workflow,
 )
-from agentflow_core.runtime.builder import (
-    build_graph_from_json,
-    create_node_callable,
-)
-from agentflow_core.runtime.executor import (
-    create_execution_result,
-    run_workflow,
-)
+
+# Builder and executor pull in LangGraph, so they are imported on first access
+_LAZY_EXPORTS = {
+    "build_graph_cached": "agentflow_core.runtime.builder",
+    "build_graph_from_json": "agentflow_core.runtime.builder",
+    "create_node_callable": "agentflow_core.runtime.builder",
+    "create_execution_result": "agentflow_core.runtime.executor",
+    "run_workflow": "agentflow_core.runtime.executor",
+    "run_workflow_async": "agentflow_core.runtime.executor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve LangGraph-backed exports lazily (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # State
@@ -47,10 +63,12 @@ __all__ = [
     "validate_workflow",
     
     # Builder
+    "build_graph_cached",
     "build_graph_from_json",
     "create_node_callable",
     
     # Executor
     "create_execution_result",
     "run_workflow",
+    "run_workflow_async",
 ]
@@ -6,16 +6,19 @@ This is the core compilation layer that transforms workflow definitions
 into runnable graphs.
 """
 
-from typing import Annotated, Any, Callable, Dict, List, Optional, Union
+from typing import Annotated, Any, Callable, Dict, List, Optional, Sequence, Union
 
 from langgraph.graph import END, StateGraph
 
 from agentflow_core.api.models.workflow_model import (
+    NODE_TYPE_AGGREGATOR,
+    NODE_TYPE_ROUTER,
     EdgeModel,
     NodeModel,
     WorkflowSpecModel,
 )
 from agentflow_core.nodes import (
+    ASYNC_NODE_FACTORIES,
     NODE_FACTORIES,
     create_aggregator_node,
     create_db_node,
@@ -24,7 +27,12 @@ from agentflow_core.nodes import (
     create_llm_node,
     create_router_node,
 )
-from agentflow_core.runtime.registry import register_sources_from_spec
+from agentflow_core.runtime.registry import (
+    cache_compiled_graph,
+    get_cached_graph,
+    graph_cache_key,
+    register_sources_from_spec,
+)
 from agentflow_core.runtime.state import GraphState
 from agentflow_core.utils.error_handler import ValidationError
 from agentflow_core.utils.logger import get_logger
@@ -39,7 +47,8 @@ logger = get_logger(__name__)
 
 def build_graph_from_json(
     spec: WorkflowSpecModel,
-    register_sources: bool = True
+    register_sources: bool = True,
+    async_nodes: bool = False
 ) -> StateGraph:
     """
     Build a LangGraph StateGraph from a WorkflowSpec.
@@ -50,6 +59,8 @@ def build_graph_from_json(
     Args:
         spec: The workflow specification to compile
         register_sources: Whether to register sources in the registry
+        async_nodes: Use the async LLM and image nodes; the graph must
+            then be run with graph.ainvoke() (see run_workflow_async)
         
     Returns:
         Compiled LangGraph StateGraph
@@ -76,7 +87,7 @@ def build_graph_from_json(
     builder = StateGraph(GraphState)
     
     # Build node ID to callable mapping
-    node_callables = _create_node_callables(spec.nodes)
+    node_callables = _create_node_callables(spec.nodes, async_nodes)
     
     # Add nodes to graph
     for node_id, callable_fn in node_callables.items():
@@ -97,19 +108,58 @@ def build_graph_from_json(
     return compiled
 
 
+# =============================================================================
+# Graph Caching
+# =============================================================================
+
+
+def build_graph_cached(
+    spec: WorkflowSpecModel,
+    async_nodes: bool = False,
+    spec_hash: Optional[str] = None
+) -> StateGraph:
+    """
+    Build a graph, reusing the compiled graph of an identical spec.
+    
+    Graphs are cached in the registry by WorkflowSpecModel.spec_hash()
+    (see clear_graph_cache). Sources are registered on every call, so a
+    cache hit leaves the registry as a fresh build would.
+    
+    Args:
+        spec: The workflow specification to compile
+        async_nodes: Use the async LLM and image nodes
+        spec_hash: spec.spec_hash(), if the caller already computed it
+        
+    Returns:
+        Compiled LangGraph StateGraph
+    """
+    graph_key = graph_cache_key(spec_hash or spec.spec_hash(), async_nodes)
+    graph = get_cached_graph(graph_key)
+    
+    if graph is None:
+        graph = build_graph_from_json(spec, async_nodes=async_nodes)
+        cache_compiled_graph(graph_key, graph)
+    elif spec.sources:
+        register_sources_from_spec([s.model_dump() for s in spec.sources])
+    
+    return graph
+
+
 # =============================================================================
 # Node Creation
 # =============================================================================
 
 
 def _create_node_callables(
-    nodes: List[NodeModel]
+    nodes: List[NodeModel],
+    async_nodes: bool = False
 ) -> Dict[str, Callable[[GraphState], GraphState]]:
     """
     Create callable functions for each node.
     
     Args:
         nodes: List of node models
+        async_nodes: Whether to use the async node factories
         
     Returns:
         Dictionary mapping node IDs to callable functions
@@ -120,7 +170,7 @@ def _create_node_callables(
         node_type = node.type.value  # NodeType enum to string
         metadata = node.metadata or {}
         
-        callable_fn = create_node_callable(node_type, node.id, metadata)
+        callable_fn = create_node_callable(node_type, node.id, metadata, async_nodes)
         callables[node.id] = callable_fn
     
     return callables
@@ -129,7 +179,8 @@ def _create_node_callables(
 def create_node_callable(
     node_type: str,
     node_id: str,
-    metadata: Dict[str, Any]
+    metadata: Dict[str, Any],
+    async_nodes: bool = False
 ) -> Callable[[GraphState], GraphState]:
     """
     Create a callable for a specific node type.
@@ -138,6 +189,7 @@ def create_node_callable(
         node_type: Type of node (input, router, llm, etc.)
         node_id: Unique node identifier
         metadata: Node configuration
+        async_nodes: Whether to use the async node factories
         
     Returns:
         Callable that processes GraphState
@@ -146,7 +198,8 @@ def create_node_callable(
         ValueError: If node type is not supported
     """
     # Map node type to factory function
-    factory = NODE_FACTORIES.get(node_type.lower())
+    factories = ASYNC_NODE_FACTORIES if async_nodes else NODE_FACTORIES
+    factory = factories.get(node_type.lower())
     
     if factory is None:
         supported = ", ".join(NODE_FACTORIES.keys())
@@ -162,6 +215,15 @@ def create_node_callable(
 # Edge Construction
 # =============================================================================
 
+# Distinct intents remembered per conditional edge
+ROUTE_CACHE_SIZE = 256
+
+# Target names (lowercased) that mean the graph's END
+_END_TOKENS = frozenset({"end", "__end__"})
+
+# Node types that end the graph when they have no outgoing edge
+_TERMINAL_TYPES = frozenset({NODE_TYPE_AGGREGATOR})
+
 
 def _add_edges(
     builder: StateGraph,
@@ -192,7 +254,7 @@ def _add_edges(
     
     for edge in edges:
         from_node = edge.from_node
-        to_nodes = edge.to if isinstance(edge.to, list) else [edge.to]
+        to_nodes = edge.targets
         condition = edge.condition
         
         nodes_with_edges.add(from_node)
@@ -205,7 +267,7 @@ def _add_edges(
         # Check if this is a PARALLEL ROUTER (default strategy with multiple targets)
         router_strategy = from_node_metadata.get("strategy", "")
         is_parallel_router = (
-            from_node_type == "router" 
+            from_node_type == NODE_TYPE_ROUTER
             and router_strategy == "default" 
             and len(to_nodes) > 1
         )
@@ -213,12 +275,12 @@ def _add_edges(
         if is_parallel_router:
             # PARALLEL FAN-OUT: Add simple edges to all targets
             for to_node in to_nodes:
-                if to_node.lower() == "end" or to_node == "__end__":
+                if to_node.lower() in _END_TOKENS:
                     builder.add_edge(from_node, END)
                 else:
                     builder.add_edge(from_node, to_node)
                 logger.debug("parallel_edge_added", from_node=from_node, to_node=to_node)
-        elif from_node_type == "router" and len(to_nodes) > 1 and not condition:
+        elif from_node_type == NODE_TYPE_ROUTER and len(to_nodes) > 1 and not condition:
             # CONDITIONAL ROUTER: Use conditional edges for keyword/pattern/rules
             _add_conditional_edge(builder, from_node, to_nodes, condition)
         elif condition:
@@ -227,25 +289,56 @@ def _add_edges(
         else:
             # Simple edge
             for to_node in to_nodes:
-                if to_node.lower() == "end" or to_node == "__end__":
+                if to_node.lower() in _END_TOKENS:
                     builder.add_edge(from_node, END)
                 else:
                     builder.add_edge(from_node, to_node)
                 logger.debug("edge_added", from_node=from_node, to_node=to_node)
     
-    # Add END edges for nodes without outgoing edges (except aggregators which might be terminal)
-    for node in nodes:
-        if node.id not in nodes_with_edges:
-            # Check if this node type is typically terminal
-            if node.type.value == "aggregator":
-                builder.add_edge(node.id, END)
-                logger.debug("terminal_edge_added", node_id=node.id)
+    # Add END edges for terminal node types without outgoing edges
+    orphans = [node for node in nodes if node.id not in nodes_with_edges]
+    for node in orphans:
+        if node.type.value in _TERMINAL_TYPES:
+            builder.add_edge(node.id, END)
+            logger.debug("terminal_edge_added", node_id=node.id)
+
+
+class _RouteTable(dict):
+    """
+    Intent -> target lookup for a conditional edge.
+    
+    An intent routes to the first target whose name matches or contains
+    it (case-insensitive), defaulting to the first target. Target names
+    are resolved when the edge is built; other intents are resolved on
+    first use and remembered, up to ROUTE_CACHE_SIZE of them.
+    """
+    
+    __slots__ = ("_lowered_targets", "_default")
+    
+    def __init__(self, to_nodes: Sequence[str]) -> None:
+        # Targets are fixed, so they are lowercased once here
+        self._lowered_targets = tuple((target.lower(), target) for target in to_nodes)
+        self._default = to_nodes[0] if to_nodes else END
+        super().__init__((target, self._resolve(target)) for target in to_nodes)
+    
+    def _resolve(self, intent: str) -> str:
+        intent_lower = intent.lower()
+        return next(
+            (original for lowered, original in self._lowered_targets if intent_lower in lowered),
+            self._default
+        )
+    
+    def __missing__(self, intent: str) -> str:
+        target = self._resolve(intent)
+        if len(self) < ROUTE_CACHE_SIZE:
+            self[intent] = target
+        return target
 
 
 def _add_conditional_edge(
     builder: StateGraph,
     from_node: str,
-    to_nodes: List[str],
+    to_nodes: Sequence[str],
     condition: Optional[str]
 ) -> None:
     """
@@ -254,25 +347,15 @@ def _add_conditional_edge(
     Args:
         builder: StateGraph builder
         from_node: Source node ID
-        to_nodes: List of possible target nodes
+        to_nodes: Possible target nodes
         condition: Condition expression (optional)
     """
+    routes = _RouteTable(to_nodes)
+    
     # Create routing function based on intent
     def routing_function(state: GraphState) -> str:
         """Route based on intent field in state."""
-        intent = state.get("intent", "")
-        
-        # Try to match intent to a target node
-        for target in to_nodes:
-            # Check if intent matches target node name
-            if intent.lower() == target.lower():
-                return target
-            # Check if intent is contained in target name
-            if intent.lower() in target.lower():
-                return target
-        
-        # Default to first target
-        return to_nodes[0] if to_nodes else END
+        return routes[state.get("intent", "")]
     
     # Build path map for conditional edges
     path_map = {node: node for node in to_nodes}
@@ -332,7 +415,8 @@ def build_from_dict(
     """
     Build graph from a dictionary.
     
-    Convenience function for building from raw JSON/dict.
+    Convenience function for building from raw JSON/dict. Identical
+    specs share one compiled graph (see build_graph_cached).
     
     Args:
         workflow_dict: Workflow specification as dictionary
@@ -341,7 +425,7 @@ def build_from_dict(
         Compiled graph
     """
     spec = WorkflowSpecModel.model_validate(workflow_dict)
-    return build_graph_from_json(spec)
+    return build_graph_cached(spec)
 
 
 # =============================================================================
@@ -5,13 +5,15 @@ Executes compiled LangGraph workflows with initial state and returns results.
 Provides execution management, error handling, and result tracking.
 """
 
+import asyncio
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 
 from langgraph.graph import StateGraph
 
 from agentflow_core.api.models.workflow_model import WorkflowSpecModel
-from agentflow_core.runtime.builder import build_graph_from_json
+from agentflow_core.runtime.builder import build_graph_cached
 from agentflow_core.runtime.registry import (
     complete_execution,
     register_execution,
@@ -60,6 +62,73 @@ def run_workflow(
         >>> result = run_workflow(graph, initial_state)
         >>> print(result["final_output"])
     """
+    exec_id, state, start_time = _start_execution(
+        initial_state, execution_id, workflow_id, timeout
+    )
+    
+    try:
+        # Execute the graph
+        result = graph.invoke(state)
+    except Exception as e:
+        raise _fail_execution(e, exec_id, workflow_id, state, start_time)
+    
+    return _complete_execution(result, exec_id, workflow_id, start_time)
+
+
+async def run_workflow_async(
+    graph: StateGraph,
+    initial_state: Dict[str, Any],
+    execution_id: Optional[str] = None,
+    workflow_id: Optional[str] = None,
+    timeout: Optional[int] = None
+) -> GraphState:
+    """
+    Execute a compiled workflow graph on the running event loop.
+    
+    Nodes that fan out from the same node run in the same LangGraph step;
+    with graph.ainvoke() the async nodes among them are awaited together
+    instead of one after another. Graphs built with
+    build_graph_from_json(spec, async_nodes=True) get async LLM and image
+    nodes; sync nodes are run on a worker thread by LangGraph.
+    
+    Args:
+        graph: Compiled LangGraph StateGraph
+        initial_state: Initial state dictionary
+        execution_id: Optional execution ID for tracking
+        workflow_id: Optional workflow ID for tracking
+        timeout: Optional timeout in seconds
+        
+    Returns:
+        Final GraphState after execution
+        
+    Raises:
+        WorkflowExecutionError: If execution fails
+    """
+    exec_id, state, start_time = _start_execution(
+        initial_state, execution_id, workflow_id, timeout
+    )
+    
+    try:
+        # Execute the graph
+        result = await graph.ainvoke(state)
+    except Exception as e:
+        raise _fail_execution(e, exec_id, workflow_id, state, start_time)
+    
+    return _complete_execution(result, exec_id, workflow_id, start_time)
+
+
+def _start_execution(
+    initial_state: Dict[str, Any],
+    execution_id: Optional[str],
+    workflow_id: Optional[str],
+    timeout: Optional[int]
+) -> Tuple[str, GraphState, float]:
+    """
+    Prepare the state and register the start of an execution.
+    
+    Returns:
+        Tuple of (execution_id, prepared state, start time)
+    """
     # Generate execution ID if not provided
     exec_id = execution_id or generate_execution_id()
     
@@ -79,58 +148,72 @@ def run_workflow(
         execution_id=exec_id
     )
     
-    try:
-        # Execute the graph
-        result = graph.invoke(state)
-        
-        # Calculate execution time
-        execution_time_ms = (time.time() - start_time) * 1000
-        
-        # Track successful completion
-        complete_execution(exec_id, "completed", {
-            "execution_time_ms": execution_time_ms,
-            "tokens_used": result.get("tokens_used", 0),
-        })
-        
-        log_workflow_event(
-            "workflow_execution_completed",
-            workflow_id=workflow_id or "unknown",
-            execution_id=exec_id,
-            execution_time_ms=round(execution_time_ms, 2),
-            tokens_used=result.get("tokens_used", 0)
-        )
-        
-        # Add execution metadata to result
-        result["metadata"] = {
-            **result.get("metadata", {}),
-            "execution_id": exec_id,
-            "execution_time_ms": execution_time_ms,
-        }
-        
-        return result
-        
-    except Exception as e:
-        # Calculate execution time
-        execution_time_ms = (time.time() - start_time) * 1000
-        
-        # Track failed execution
-        complete_execution(exec_id, "failed", {
-            "error": str(e),
-            "execution_time_ms": execution_time_ms,
-        })
-        
-        log_workflow_event(
-            "workflow_execution_failed",
-            workflow_id=workflow_id or "unknown",
-            execution_id=exec_id,
-            error=str(e)
-        )
-        
-        raise WorkflowExecutionError(
-            message=f"Workflow execution failed: {str(e)}",
-            workflow_id=workflow_id,
-            partial_state=state
-        )
+    return exec_id, state, start_time
+
+
+def _complete_execution(
+    result: GraphState,
+    exec_id: str,
+    workflow_id: Optional[str],
+    start_time: float
+) -> GraphState:
+    """Record a successful execution and attach its metadata to the result."""
+    # Calculate execution time
+    execution_time_ms = (time.time() - start_time) * 1000
+    
+    # Track successful completion
+    complete_execution(exec_id, "completed", {
+        "execution_time_ms": execution_time_ms,
+        "tokens_used": result.get("tokens_used", 0),
+    })
+    
+    log_workflow_event(
+        "workflow_execution_completed",
+        workflow_id=workflow_id or "unknown",
+        execution_id=exec_id,
+        execution_time_ms=round(execution_time_ms, 2),
+        tokens_used=result.get("tokens_used", 0)
+    )
+    
+    # Add execution metadata to result
+    result["metadata"] = {
+        **result.get("metadata", {}),
+        "execution_id": exec_id,
+        "execution_time_ms": execution_time_ms,
+    }
+    
+    return result
+
+
+def _fail_execution(
+    error: Exception,
+    exec_id: str,
+    workflow_id: Optional[str],
+    state: GraphState,
+    start_time: float
+) -> WorkflowExecutionError:
+    """Record a failed execution and build the error to raise."""
+    # Calculate execution time
+    execution_time_ms = (time.time() - start_time) * 1000
+    
+    # Track failed execution
+    complete_execution(exec_id, "failed", {
+        "error": str(error),
+        "execution_time_ms": execution_time_ms,
+    })
+    
+    log_workflow_event(
+        "workflow_execution_failed",
+        workflow_id=workflow_id or "unknown",
+        execution_id=exec_id,
+        error=str(error)
+    )
+    
+    return WorkflowExecutionError(
+        message=f"Workflow execution failed: {str(error)}",
+        workflow_id=workflow_id,
+        partial_state=state
+    )
 
 
 def execute_workflow(
@@ -142,6 +225,7 @@ def execute_workflow(
     Build and execute a workflow from specification.
     
     This is a convenience function that combines building and execution.
+    The compiled graph is cached by spec hash and reused on later calls.
     
     Args:
         spec: Workflow specification
@@ -155,8 +239,8 @@ def execute_workflow(
         >>> spec = WorkflowSpecModel.model_validate(workflow_json)
         >>> result = execute_workflow(spec, {"user_input": "Hello"})
     """
-    # Build the graph
-    graph = build_graph_from_json(spec)
+    # Build the graph, or reuse the one compiled for an identical spec
+    graph = build_graph_cached(spec)
     
     # Run the workflow
     return run_workflow(
@@ -208,13 +292,10 @@ def _prepare_initial_state(
         Properly formatted GraphState
     """
     # Start with default state
-    state = create_initial_state(
-        user_input=initial_state.get("user_input", "")
-    )
+    state = create_initial_state()
     
     # Merge user-provided state (allow all keys for flexibility)
-    for key, value in initial_state.items():
-        state[key] = value  # type: ignore
+    state.update(initial_state)  # type: ignore
     
     return state
 
@@ -303,36 +384,97 @@ async def stream_workflow(
 def run_workflow_batch(
     graph: StateGraph,
     initial_states: list[Dict[str, Any]],
+    max_workers: int = 1,
     **kwargs: Any
 ) -> list[GraphState]:
     """
     Execute a workflow with multiple initial states.
     
+    Each state is an independent graph invocation, so with max_workers > 1
+    they run on a thread pool (LLM, image and DB nodes spend most of their
+    time waiting on I/O). Results keep the order of initial_states.
+    
     Args:
         graph: Compiled graph
         initial_states: List of initial states
-        **kwargs: Additional arguments for run_workflow
+        max_workers: Number of states executed concurrently
+        **kwargs: Additional arguments for run_workflow; execution_id is
+            used as the prefix for the per-state execution IDs
         
     Returns:
-        List of final states
+        List of final states; a state that failed carries the error in
+        its "errors" field
     """
-    results = []
+    batch_id = kwargs.pop("execution_id", None) or "batch"
     
-    for i, initial_state in enumerate(initial_states):
+    def run_one(index: int, initial_state: Dict[str, Any]) -> GraphState:
         try:
-            result = run_workflow(
+            return run_workflow(
                 graph=graph,
                 initial_state=initial_state,
-                execution_id=f"{kwargs.get('execution_id', 'batch')}_{i}",
+                execution_id=f"{batch_id}_{index}",
                 **kwargs
             )
-            results.append(result)
         except Exception as e:
-            # Add error state
-            error_state = create_initial_state(
-                user_input=initial_state.get("user_input", "")
+            return _batch_error_state(initial_state, e)
+    
+    if max_workers <= 1 or len(initial_states) <= 1:
+        return [run_one(i, state) for i, state in enumerate(initial_states)]
+    
+    workers = min(max_workers, len(initial_states))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_one, range(len(initial_states)), initial_states))
+
+
+async def run_workflow_batch_async(
+    graph: StateGraph,
+    initial_states: list[Dict[str, Any]],
+    max_concurrency: Optional[int] = None,
+    **kwargs: Any
+) -> list[GraphState]:
+    """
+    Execute a workflow with multiple initial states on the running event loop.
+    
+    The async counterpart of run_workflow_batch for graphs built with
+    async_nodes=True: all states are awaited together with asyncio.gather.
+    
+    Args:
+        graph: Compiled graph
+        initial_states: List of initial states
+        max_concurrency: Optional limit on states executed at once
+        **kwargs: Additional arguments for run_workflow_async; execution_id
+            is used as the prefix for the per-state execution IDs
+        
+    Returns:
+        List of final states in the order of initial_states
+    """
+    batch_id = kwargs.pop("execution_id", None) or "batch"
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    
+    async def run_one(index: int, initial_state: Dict[str, Any]) -> GraphState:
+        try:
+            run = run_workflow_async(
+                graph=graph,
+                initial_state=initial_state,
+                execution_id=f"{batch_id}_{index}",
+                **kwargs
             )
-            error_state["errors"] = [str(e)]  # type: ignore
-            results.append(error_state)
+            if semaphore is None:
+                return await run
+            async with semaphore:
+                return await run
+        except Exception as e:
+            return _batch_error_state(initial_state, e)
     
-    return results
+    return list(await asyncio.gather(
+        *(run_one(i, state) for i, state in enumerate(initial_states))
+    ))
+
+
+def _batch_error_state(initial_state: Dict[str, Any], error: Exception) -> GraphState:
+    """Build the result state recorded for a failed batch item."""
+    error_state = create_initial_state(
+        user_input=initial_state.get("user_input", "")
+    )
+    error_state["errors"] = [str(error)]  # type: ignore
+    return error_state
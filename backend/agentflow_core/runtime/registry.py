@@ -5,6 +5,8 @@ Central registry for storing and retrieving sources at runtime.
 Provides thread-safe access to source configurations.
 """
 
+import os
+from collections import OrderedDict, deque
 from threading import Lock
 from typing import Any, Dict, List, Optional
 
@@ -21,10 +23,17 @@ logger = get_logger(__name__)
 _sources: Dict[str, Dict[str, Any]] = {}
 _sources_lock = Lock()
 
-_compiled_graphs: Dict[str, Any] = {}
+# Compiled graphs kept before the least recently used one is dropped
+GRAPH_CACHE_SIZE = int(os.getenv("AGENTFLOW_GRAPH_CACHE_SIZE", "256"))
+
+_compiled_graphs: "OrderedDict[str, Any]" = OrderedDict()
 _graphs_lock = Lock()
 
+# Finished execution records kept before the oldest one is dropped
+EXECUTION_HISTORY_SIZE = int(os.getenv("AGENTFLOW_EXECUTION_HISTORY_SIZE", "1024"))
+
 _active_executions: Dict[str, Dict[str, Any]] = {}
+_finished_executions: "deque[str]" = deque()
 _executions_lock = Lock()
 
 
@@ -36,6 +45,8 @@ _executions_lock = Lock()
 class RegistryView:
     """Read-only view of the registry for inspection."""
     
+    __slots__ = ()
+    
     @property
     def sources(self) -> Dict[str, Dict[str, Any]]:
         """Get a copy of all registered sources."""
@@ -180,16 +191,39 @@ def register_sources_from_spec(sources: List[Dict[str, Any]]) -> None:
 # =============================================================================
 
 
+def graph_cache_key(spec_hash: str, async_nodes: bool = False) -> str:
+    """
+    Build the graph cache key for a workflow specification.
+    
+    Sync and async builds of the same spec are different graphs, so
+    they are cached under different keys.
+    
+    Args:
+        spec_hash: Hash of the workflow specification
+        async_nodes: Whether the graph uses the async node factories
+        
+    Returns:
+        Key for cache_compiled_graph / get_cached_graph
+    """
+    return f"{spec_hash}:async" if async_nodes else spec_hash
+
+
 def cache_compiled_graph(workflow_id: str, graph: Any) -> None:
     """
     Cache a compiled graph for reuse.
     
+    The cache holds at most GRAPH_CACHE_SIZE graphs, evicting the least
+    recently used one.
+    
     Args:
         workflow_id: Unique workflow identifier
         graph: Compiled LangGraph instance
     """
     with _graphs_lock:
         _compiled_graphs[workflow_id] = graph
+        _compiled_graphs.move_to_end(workflow_id)
+        while len(_compiled_graphs) > GRAPH_CACHE_SIZE:
+            _compiled_graphs.popitem(last=False)
         logger.info("graph_cached", workflow_id=workflow_id)
 
 
@@ -204,7 +238,10 @@ def get_cached_graph(workflow_id: str) -> Optional[Any]:
         Cached graph if exists, None otherwise
     """
     with _graphs_lock:
-        return _compiled_graphs.get(workflow_id)
+        graph = _compiled_graphs.get(workflow_id)
+        if graph is not None:
+            _compiled_graphs.move_to_end(workflow_id)
+        return graph
 
 
 def invalidate_cached_graph(workflow_id: str) -> bool:
@@ -274,6 +311,9 @@ def complete_execution(
     """
     Mark an execution as complete.
     
+    Running executions are always tracked; only the most recent
+    EXECUTION_HISTORY_SIZE finished ones are kept.
+    
     Args:
         execution_id: The execution to complete
         status: Final status (completed, failed, timeout)
@@ -283,9 +323,19 @@ def complete_execution(
     
     with _executions_lock:
         if execution_id in _active_executions:
-            _active_executions[execution_id]["status"] = status
-            _active_executions[execution_id]["completed_at"] = time.time()
-            _active_executions[execution_id]["result"] = result
+            record = _active_executions[execution_id]
+            if record["status"] == "running":
+                _finished_executions.append(execution_id)
+            record["status"] = status
+            record["completed_at"] = time.time()
+            record["result"] = result
+            
+            while len(_finished_executions) > EXECUTION_HISTORY_SIZE:
+                # An ID registered again since it finished is running now
+                dropped_id = _finished_executions.popleft()
+                dropped = _active_executions.get(dropped_id)
+                if dropped is not None and dropped["status"] != "running":
+                    del _active_executions[dropped_id]
             logger.info(
                 "execution_completed",
                 execution_id=execution_id,
@@ -326,6 +376,7 @@ def clear_executions() -> None:
     """Clear all execution records."""
     with _executions_lock:
         _active_executions.clear()
+        _finished_executions.clear()
         logger.info("executions_cleared")
 
 
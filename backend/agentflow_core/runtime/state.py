@@ -6,7 +6,7 @@ State is passed between nodes and tracks the execution context.
 """
 
 import operator
-from typing import Annotated, Any, Dict, List, Optional, TypedDict
+from typing import Annotated, Any, Dict, FrozenSet, List, Optional, TypedDict
 
 
 def merge_dict(left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
@@ -107,6 +107,10 @@ class GraphState(TypedDict, total=False):
     """Dynamic outputs from nodes (custom output_key values like 'summary', 'translation')."""
 
 
+# Keys stored at the top level of the state; anything else goes to outputs
+_STATE_KEYS: FrozenSet[str] = frozenset(GraphState.__annotations__)
+
+
 def create_initial_state(
     user_input: str = "",
     **kwargs: Any
@@ -145,7 +149,7 @@ def create_initial_state(
     
     # Override with any provided values
     for key, value in kwargs.items():
-        if key in GraphState.__annotations__:
+        if key in _STATE_KEYS:
             state[key] = value  # type: ignore
         else:
             # Store custom keys in outputs dict
@@ -160,6 +164,9 @@ def merge_state(base: GraphState, updates: Dict[str, Any]) -> GraphState:
     
     This follows immutable state pattern - creates new state instead of modifying.
     Custom keys (not in GraphState) are stored in the 'outputs' dict.
+    Only the top-level dict is copied; values, including the outputs dict
+    when no custom key is written, are shared with base and must not be
+    mutated in place.
     
     Args:
         base: The base state to start from
@@ -180,17 +187,23 @@ def merge_state(base: GraphState, updates: Dict[str, Any]) -> GraphState:
     """
     # Create shallow copy
     new_state: GraphState = dict(base)  # type: ignore
-    new_outputs = dict(base.get("outputs", {}))
+    new_outputs: Optional[Dict[str, Any]] = None
     
     # Process updates
     for key, value in updates.items():
-        if key in GraphState.__annotations__:
+        if key in _STATE_KEYS:
             # Known key - update directly
             new_state[key] = value  # type: ignore
         else:
-            # Custom key - store in outputs
+            # Custom key - store in a copy of outputs
+            if new_outputs is None:
+                new_outputs = dict(base.get("outputs", {}))
             new_outputs[key] = value
     
+    if new_outputs is None:
+        # No custom keys: share the base outputs instead of copying them
+        new_outputs = base.get("outputs", {})
+    
     new_state["outputs"] = new_outputs  # type: ignore
     
     return new_state
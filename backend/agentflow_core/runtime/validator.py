@@ -10,8 +10,12 @@ from typing import Any, Dict, List, Optional, Set
 from pydantic import BaseModel, Field
 
 from agentflow_core.api.models.workflow_model import (
-    NodeType,
-    SourceKind,
+    NODE_TYPE_DB,
+    NODE_TYPE_IMAGE,
+    NODE_TYPE_LLM,
+    NODE_TYPE_ROUTER,
+    SOURCE_KIND_DB,
+    SOURCE_KIND_LLM,
     WorkflowSpecModel,
 )
 from agentflow_core.utils.logger import get_logger
@@ -208,8 +212,7 @@ def _validate_edges(
             ))
         
         # Validate target node(s)
-        targets = edge.to if isinstance(edge.to, list) else [edge.to]
-        for target in targets:
+        for target in edge.targets:
             if target not in node_ids:
                 errors.append(ValidationError(
                     type=ERROR_TYPES["INVALID_EDGE_TARGET"],
@@ -262,8 +265,9 @@ def _validate_nodes(
         
         # Validate metadata based on node type
         metadata = node.metadata or {}
+        node_type = node.type.value
         
-        if node.type == NodeType.LLM:
+        if node_type == NODE_TYPE_LLM:
             # LLM nodes should reference a source
             source_id = metadata.get("source_id")
             if source_id and source_id not in source_ids:
@@ -283,7 +287,7 @@ def _validate_nodes(
                     field="metadata.prompt"
                 ))
         
-        elif node.type == NodeType.IMAGE:
+        elif node_type == NODE_TYPE_IMAGE:
             # Image nodes should reference a source
             source_id = metadata.get("source_id")
             if source_id and source_id not in source_ids:
@@ -294,7 +298,7 @@ def _validate_nodes(
                     field="metadata.source_id"
                 ))
         
-        elif node.type == NodeType.DB:
+        elif node_type == NODE_TYPE_DB:
             # DB nodes should reference a source and have a query
             source_id = metadata.get("source_id")
             if source_id and source_id not in source_ids:
@@ -313,7 +317,7 @@ def _validate_nodes(
                     field="metadata.query"
                 ))
         
-        elif node.type == NodeType.ROUTER:
+        elif node_type == NODE_TYPE_ROUTER:
             # Router nodes should have routing configuration
             if not metadata.get("routes") and not metadata.get("strategy"):
                 errors.append(ValidationError(
@@ -332,8 +336,9 @@ def _validate_sources(spec: WorkflowSpecModel) -> List[ValidationError]:
     
     for source in spec.sources:
         config = source.config or {}
+        kind = source.kind.value
         
-        if source.kind == SourceKind.LLM:
+        if kind == SOURCE_KIND_LLM:
             # LLM sources should have model configuration
             if not config.get("model") and not config.get("model_name"):
                 errors.append(ValidationError(
@@ -342,7 +347,7 @@ def _validate_sources(spec: WorkflowSpecModel) -> List[ValidationError]:
                     field=f"sources.{source.id}.config.model"
                 ))
         
-        elif source.kind == SourceKind.DB:
+        elif kind == SOURCE_KIND_DB:
             # DB sources should have connection configuration
             if not config.get("connection_string_env") and not config.get("connection_string"):
                 errors.append(ValidationError(
@@ -364,8 +369,7 @@ def _validate_orphaned_nodes(
     # Build set of nodes with incoming edges
     nodes_with_incoming: Set[str] = set()
     for edge in spec.edges:
-        targets = edge.to if isinstance(edge.to, list) else [edge.to]
-        nodes_with_incoming.update(targets)
+        nodes_with_incoming.update(edge.targets)
     
     # Also add targets from queues
     for queue in spec.queues:
@@ -399,8 +403,7 @@ def _detect_cycles(spec: WorkflowSpecModel) -> List[ValidationError]:
     # Build adjacency list
     adjacency: Dict[str, List[str]] = {node.id: [] for node in spec.nodes}
     for edge in spec.edges:
-        targets = edge.to if isinstance(edge.to, list) else [edge.to]
-        adjacency[edge.from_node].extend(targets)
+        adjacency[edge.from_node].extend(edge.targets)
     
     # DFS state
     WHITE, GRAY, BLACK = 0, 1, 2
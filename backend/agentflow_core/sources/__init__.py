@@ -4,11 +4,21 @@ AgentFlow Core - Source Adapters
 Exports all source adapters for external integrations.
 """
 
+import atexit
+import json
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+
 from agentflow_core.sources.llm_gemini import (
+    bind_gemini_credentials,
+    configure_gemini,
     create_gemini_client,
     generate_chat,
     generate_text,
     get_gemini_client,
+    get_genai,
 )
 from agentflow_core.sources.image_gemini import (
     create_image_client,
@@ -16,6 +26,7 @@ from agentflow_core.sources.image_gemini import (
     get_image_client,
 )
 from agentflow_core.sources.db_postgres import (
+    DEFAULT_QUERY_TIMEOUT,
     close_client as close_postgres_client,
     create_postgres_client,
     execute_query,
@@ -33,6 +44,9 @@ from agentflow_core.sources.api_http import (
     post,
     put,
 )
+from agentflow_core.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 # Source type to factory mapping
 SOURCE_FACTORIES = {
@@ -74,13 +88,190 @@ def create_source_client(kind: str, config: dict) -> any:
     return factory(config)
 
 
+# =============================================================================
+# Client Cache
+# =============================================================================
+
+# Maximum number of distinct (kind, config) clients kept alive
+SOURCE_CLIENT_CACHE_SIZE = 128
+
+# Releases the resources (pools, sockets) held by a client of a given kind
+_CLIENT_CLOSERS = {
+    "db": close_postgres_client,
+    "postgres": close_postgres_client,
+    "postgresql": close_postgres_client,
+    "api": close_http_client,
+    "http": close_http_client,
+}
+
+# (kind, canonical config JSON) -> client, least recently used first
+_client_cache: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+_client_cache_lock = Lock()
+
+
+# Kinds backed by a PostgreSQL connection pool, shared per database
+POSTGRES_KINDS = frozenset({"db", "postgres", "postgresql"})
+
+# Config fields that change the pool create_postgres_client opens
+_POSTGRES_POOL_FIELDS = ("pool_size", "max_overflow", "pool_timeout")
+
+
+def _canonical_client_config(kind: str, config: dict) -> Tuple[str, Dict[str, Any]]:
+    """
+    Reduce a source config to the fields that determine its client.
+    
+    Database sources registered through the API, tested, and queried by
+    db nodes describe the same pool with different kinds and extra keys
+    (provider, connection_string_env). They are all mapped to kind
+    "postgres" and the resolved connection string, pool settings and
+    statement timeout, so every caller shares one pool and eviction
+    finds it.
+    """
+    kind = kind.lower()
+    if kind not in POSTGRES_KINDS:
+        return kind, config
+    
+    connection_string = config.get("connection_string") or os.getenv(
+        config.get("connection_string_env", "DATABASE_URL")
+    )
+    pool_config = {field: config[field] for field in _POSTGRES_POOL_FIELDS if field in config}
+    pool_config["connection_string"] = connection_string
+    pool_config["statement_timeout"] = config.get("statement_timeout", DEFAULT_QUERY_TIMEOUT)
+    return "postgres", pool_config
+
+
+def _client_cache_key(kind: str, config: dict) -> Tuple[str, str]:
+    """Build a cache key that is stable across dict ordering."""
+    return kind, json.dumps(config, sort_keys=True, default=str)
+
+
+def _close_cached_client(kind: str, client: Any) -> None:
+    """Close a client dropped from the cache, logging instead of raising."""
+    closer = _CLIENT_CLOSERS.get(kind)
+    if closer is None:
+        return
+    try:
+        closer(client)
+    except Exception as e:
+        logger.warning("source_client_close_failed", kind=kind, error=str(e))
+
+
+def get_cached_source_client(kind: str, config: dict) -> Any:
+    """
+    Get a source client, reusing one previously created for the same config.
+    
+    Clients (and the connection pools they hold) are kept in a bounded
+    LRU cache so repeated calls skip connection setup. Clients evicted
+    from the cache are closed.
+    
+    Args:
+        kind: Source kind (llm, image, db, api)
+        config: Source configuration
+        
+    Returns:
+        Configured client instance
+        
+    Raises:
+        ValueError: If source kind is not supported
+    """
+    kind, config = _canonical_client_config(kind, config)
+    key = _client_cache_key(kind, config)
+    
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is not None:
+            _client_cache.move_to_end(key)
+            return client
+    
+    # Created outside the lock since connecting may block
+    client = create_source_client(kind, config)
+    
+    evicted: List[Tuple[Tuple[str, str], Any]] = []
+    with _client_cache_lock:
+        existing = _client_cache.get(key)
+        if existing is not None:
+            # Another caller created the same client first; keep theirs
+            evicted.append((key, client))
+            client = existing
+        else:
+            _client_cache[key] = client
+            while len(_client_cache) > SOURCE_CLIENT_CACHE_SIZE:
+                evicted.append(_client_cache.popitem(last=False))
+    
+    for (evicted_kind, _), evicted_client in evicted:
+        _close_cached_client(evicted_kind, evicted_client)
+    
+    return client
+
+
+def evict_source_client(kind: str, config: dict) -> bool:
+    """
+    Drop and close the cached clients for a source configuration.
+    
+    For database sources this closes every pool opened for the source's
+    database, whatever statement timeout the db nodes using it set.
+    
+    Args:
+        kind: Source kind
+        config: Source configuration the client was created from
+        
+    Returns:
+        True if a cached client was removed
+    """
+    kind, config = _canonical_client_config(kind, config)
+    
+    with _client_cache_lock:
+        if kind == "postgres":
+            pool_identity = {k: v for k, v in config.items() if k != "statement_timeout"}
+            keys = [
+                key for key in _client_cache
+                if key[0] == kind and _without_timeout(key[1]) == pool_identity
+            ]
+        else:
+            keys = [_client_cache_key(kind, config)]
+        removed = [_client_cache.pop(key) for key in keys if key in _client_cache]
+    
+    for client in removed:
+        _close_cached_client(kind, client)
+    return bool(removed)
+
+
+def _without_timeout(config_json: str) -> Dict[str, Any]:
+    """Decode a cached postgres config, dropping its statement timeout."""
+    config = json.loads(config_json)
+    config.pop("statement_timeout", None)
+    return config
+
+
+def clear_source_client_cache() -> None:
+    """Close and drop every cached source client."""
+    with _client_cache_lock:
+        entries = list(_client_cache.items())
+        _client_cache.clear()
+    
+    for (kind, _), client in entries:
+        _close_cached_client(kind, client)
+
+
+# Close pooled connections cleanly when the process exits
+atexit.register(clear_source_client_cache)
+
+
 __all__ = [
     # Factory
     "create_source_client",
     "SOURCE_FACTORIES",
+    # Client Cache
+    "get_cached_source_client",
+    "evict_source_client",
+    "clear_source_client_cache",
+    "POSTGRES_KINDS",
     # Gemini LLM
+    "bind_gemini_credentials",
+    "configure_gemini",
     "create_gemini_client",
     "get_gemini_client",
+    "get_genai",
     "generate_text",
     "generate_chat",
     # Gemini Image
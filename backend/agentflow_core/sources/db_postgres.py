@@ -41,6 +41,8 @@ def create_postgres_client(config: Dict[str, Any]) -> Any:
             - pool_size: Connection pool size
             - max_overflow: Maximum overflow connections
             - pool_timeout: Pool timeout in seconds
+            - statement_timeout: Per-statement timeout in seconds, applied
+              once per connection at connect time
     
     Returns:
         Connection pool or connection factory
@@ -76,6 +78,7 @@ def create_postgres_client(config: Dict[str, Any]) -> Any:
             return {
                 "type": "factory",
                 "connection_string": connection_string,
+                "connect_kwargs": _connect_kwargs(config),
                 "config": config,
             }
         except ImportError:
@@ -96,6 +99,7 @@ def create_postgres_client(config: Dict[str, Any]) -> Any:
             min_size=1,
             max_size=pool_size + max_overflow,
             timeout=pool_timeout,
+            kwargs=_connect_kwargs(config),
         )
         
         logger.info(
@@ -118,6 +122,19 @@ def create_postgres_client(config: Dict[str, Any]) -> Any:
         )
 
 
+def _connect_kwargs(config: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build connection parameters applied when each connection is opened.
+    
+    A statement timeout passed as a startup option saves the
+    `SET statement_timeout` round trip before every query.
+    """
+    statement_timeout = config.get("statement_timeout")
+    if not statement_timeout:
+        return {}
+    return {"options": f"-c statement_timeout={int(statement_timeout * 1000)}"}
+
+
 def get_postgres_client(config: Dict[str, Any]) -> Any:
     """Alias for create_postgres_client."""
     return create_postgres_client(config)
@@ -150,7 +167,7 @@ def get_connection(client: Dict[str, Any]) -> Generator[Any, None, None]:
     else:
         # Factory mode - create new connection
         connection_string = client["connection_string"]
-        with psycopg.connect(connection_string) as conn:
+        with psycopg.connect(connection_string, **client.get("connect_kwargs", {})) as conn:
             yield conn
 
 
@@ -8,6 +8,7 @@ Provides a unified interface for image generation operations.
 import os
 from typing import Any, Dict, Optional
 
+from agentflow_core.sources.llm_gemini import configure_gemini, get_genai
 from agentflow_core.utils.error_handler import SourceConnectionError
 from agentflow_core.utils.logger import get_logger
 
@@ -42,9 +43,8 @@ def create_image_client(config: Dict[str, Any]) -> Any:
     Raises:
         SourceConnectionError: If client creation fails
     """
-    try:
-        import google.generativeai as genai
-    except ImportError:
+    genai = get_genai()
+    if genai is None:
         raise SourceConnectionError(
             message="google-generativeai package not installed",
             source_id="gemini-image",
@@ -64,7 +64,7 @@ def create_image_client(config: Dict[str, Any]) -> Any:
             source_kind="image"
         )
     
-    genai.configure(api_key=api_key)
+    configure_gemini(api_key)
     
     logger.info("gemini_image_client_created")
     
@@ -184,12 +184,14 @@ def is_image_generation_available() -> bool:
     Returns:
         True if Imagen API is accessible
     """
+    if get_genai() is None:
+        return False
+    
     try:
-        import google.generativeai as genai
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             return False
-        genai.configure(api_key=api_key)
+        configure_gemini(api_key)
         return True
     except Exception:
         return False
@@ -5,8 +5,18 @@ Adapter for Google Gemini language models.
 Provides a unified interface for LLM operations.
 """
 
+import asyncio
+import copy
+import hashlib
+import inspect
 import os
-from typing import Any, Dict, List, Optional
+import random
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
 
 from agentflow_core.utils.error_handler import SourceConnectionError
 from agentflow_core.utils.logger import get_logger
@@ -33,6 +43,317 @@ SUPPORTED_MODELS = [
 ]
 
 
+# =============================================================================
+# Shared SDK Configuration
+# =============================================================================
+
+# 1 = treat google-generativeai as unavailable without importing it
+GEMINI_DISABLED = os.getenv("AGENTFLOW_DISABLE_GEMINI", "0") == "1"
+
+# API key the SDK is currently configured with
+_configured_api_key: Optional[str] = None
+_configure_lock = Lock()
+
+
+@lru_cache(maxsize=1)
+def get_genai() -> Optional[Any]:
+    """
+    Import the google.generativeai module once per process.
+    
+    The outcome is cached, so deployments without the SDK pay for the
+    failed import only once and callers can fall back with a None check.
+    
+    Returns:
+        The google.generativeai module, or None if it is not installed
+        or disabled with AGENTFLOW_DISABLE_GEMINI
+    """
+    if GEMINI_DISABLED:
+        logger.info("gemini_sdk_disabled")
+        return None
+    
+    try:
+        import google.generativeai as genai
+    except ImportError:
+        logger.info("gemini_sdk_not_installed")
+        return None
+    
+    return genai
+
+
+def configure_gemini(api_key: str) -> Any:
+    """
+    Configure the Gemini SDK for an API key and return the genai module.
+    
+    genai.configure() drops the SDK's cached service clients, so calling
+    it before every request opened a new connection (DNS, TCP, TLS) each
+    time. The SDK is only reconfigured when the key changes; otherwise
+    its clients and their keep-alive connections are reused.
+    
+    Args:
+        api_key: Gemini API key
+        
+    Returns:
+        The configured google.generativeai module
+        
+    Raises:
+        ImportError: If google-generativeai is not installed or disabled
+    """
+    global _configured_api_key
+    
+    genai = get_genai()
+    if genai is None:
+        raise ImportError("google-generativeai is not installed or is disabled")
+    
+    if api_key != _configured_api_key:
+        with _configure_lock:
+            if api_key != _configured_api_key:
+                genai.configure(api_key=api_key)
+                _configured_api_key = api_key
+    
+    return genai
+
+
+@lru_cache(maxsize=16)
+def _sync_service_client(api_key: str) -> Any:
+    """Blocking generative service client for an API key, shared per process."""
+    from google.ai import generativelanguage as glm
+    
+    return glm.GenerativeServiceClient(client_options={"api_key": api_key})
+
+
+# Event loop -> API key -> async service client; grpc.aio channels belong
+# to the loop they were created on, so each loop gets its own clients
+_async_service_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = (
+    WeakKeyDictionary()
+)
+_async_service_clients_lock = Lock()
+
+
+def gemini_service_client(api_key: str, asynchronous: bool = False) -> Any:
+    """
+    Get the generative service client for an API key.
+    
+    The blocking client is shared per process. The async client is shared
+    per running event loop and must be requested from a coroutine.
+    
+    Args:
+        api_key: Gemini API key the client authenticates with
+        asynchronous: Return the asyncio client instead of the blocking one
+        
+    Returns:
+        A GenerativeServiceClient or GenerativeServiceAsyncClient
+    """
+    if not asynchronous:
+        return _sync_service_client(api_key)
+    
+    loop = asyncio.get_running_loop()
+    with _async_service_clients_lock:
+        clients = _async_service_clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            from google.ai import generativelanguage as glm
+            
+            client = glm.GenerativeServiceAsyncClient(client_options={"api_key": api_key})
+            clients[api_key] = client
+    return client
+
+
+def bind_gemini_credentials(model: Any, api_key: str, asynchronous: bool = False) -> Any:
+    """
+    Make a GenerativeModel call the API with its own key.
+    
+    Without a bound client, a model falls back to the SDK's global
+    configuration, so serving several keys meant calling genai.configure()
+    between requests, racing with calls in flight. A bound model needs no
+    global configuration at all.
+    
+    The blocking client is bound to the model itself. The async client
+    belongs to the running event loop, so a shallow copy of the model
+    bound to this loop's client is returned instead, leaving the (possibly
+    shared) model usable from other loops.
+    
+    Args:
+        model: GenerativeModel instance
+        api_key: Gemini API key for this model's calls
+        asynchronous: Bind the client used by generate_content_async
+        
+    Returns:
+        The model to call: the same model, or for async a bound copy
+    """
+    if asynchronous:
+        client = gemini_service_client(api_key, asynchronous=True)
+        if getattr(model, "_async_client", None) is client:
+            return model
+        bound = copy.copy(model)
+        bound._async_client = client
+        return bound
+    
+    if getattr(model, "_client", None) is None:
+        model._client = gemini_service_client(api_key)
+    return model
+
+
+# Async Gemini requests (LLM and image) allowed in flight per event loop
+GEMINI_CONCURRENCY = int(os.getenv("AGENTFLOW_GEMINI_CONCURRENCY", "5"))
+
+# Event loop -> semaphore; asyncio primitives bind to the first loop that
+# waits on them, so a single module-level semaphore broke later loops
+_gemini_semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    WeakKeyDictionary()
+)
+_gemini_semaphores_lock = Lock()
+
+
+def get_gemini_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding async Gemini calls on the running loop.
+    
+    Bounds concurrent fan-out so parallel branches do not trip rate
+    limits. Must be called from a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _gemini_semaphores.get(loop)
+    if semaphore is None:
+        # Loops in other threads may register theirs concurrently
+        with _gemini_semaphores_lock:
+            semaphore = _gemini_semaphores.setdefault(loop, asyncio.Semaphore(GEMINI_CONCURRENCY))
+    return semaphore
+
+
+# =============================================================================
+# Retries
+# =============================================================================
+
+# Attempts per generate call, including the first
+GEMINI_MAX_ATTEMPTS = 5
+
+# Upper bound in seconds for a single backoff wait
+GEMINI_RETRY_MAX_WAIT = 60.0
+
+
+@lru_cache(maxsize=1)
+def _retryable_errors() -> Tuple[Type[BaseException], ...]:
+    """Exception types worth retrying: rate limits, overload and timeouts."""
+    try:
+        from google.api_core import exceptions as api_exceptions
+    except ImportError:
+        return (TimeoutError, ConnectionError)
+    
+    return (
+        api_exceptions.ResourceExhausted,
+        api_exceptions.TooManyRequests,
+        api_exceptions.ServiceUnavailable,
+        api_exceptions.InternalServerError,
+        api_exceptions.DeadlineExceeded,
+        TimeoutError,
+        ConnectionError,
+    )
+
+
+def _retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying after a failed attempt.
+    
+    Uses the server's retry_delay hint when the error carries one, and
+    otherwise full-jitter exponential backoff.
+    
+    Returns:
+        The wait in seconds, or None if the error should not be retried
+    """
+    if attempt >= GEMINI_MAX_ATTEMPTS or not isinstance(error, _retryable_errors()):
+        return None
+    
+    for detail in getattr(error, "details", None) or ():
+        retry_delay = getattr(detail, "retry_delay", None)
+        if retry_delay is not None:
+            hinted = retry_delay.seconds + retry_delay.nanos / 1e9
+            return min(hinted, GEMINI_RETRY_MAX_WAIT)
+    
+    return random.uniform(0, min(GEMINI_RETRY_MAX_WAIT, 2.0 ** attempt))
+
+
+def generate_content_with_retry(
+    model: Any,
+    prompt: str,
+    on_chunk: Optional[Callable[[str], Any]] = None
+) -> Any:
+    """
+    Call model.generate_content, retrying transient failures with backoff.
+    
+    With `on_chunk`, the response is streamed and each chunk's text is
+    passed to it as it arrives; once a chunk has been delivered, failures
+    are no longer retried so no text is repeated.
+    
+    Returns:
+        The (fully consumed) response
+        
+    Raises:
+        The last error once it is not retryable or attempts run out
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        streamed = False
+        try:
+            if on_chunk is None:
+                return model.generate_content(prompt)
+            
+            response = model.generate_content(prompt, stream=True)
+            for chunk in response:
+                streamed = True
+                on_chunk(chunk.text)
+            return response
+        except Exception as e:
+            delay = None if streamed else _retry_delay(e, attempt)
+            if delay is None:
+                raise
+            logger.warning("gemini_retry", attempt=attempt, wait=round(delay, 2), error=str(e))
+            time.sleep(delay)
+
+
+async def generate_content_with_retry_async(
+    model: Any,
+    prompt: str,
+    on_chunk: Optional[Callable[[str], Any]] = None
+) -> Any:
+    """
+    Await model.generate_content_async, retrying transient failures.
+    
+    Each attempt holds the loop's Gemini semaphore (get_gemini_semaphore);
+    backoff waits do not.
+    Streaming works as in generate_content_with_retry; `on_chunk` may be
+    a coroutine function.
+    
+    Returns:
+        The (fully consumed) response
+        
+    Raises:
+        The last error once it is not retryable or attempts run out
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        streamed = False
+        try:
+            async with get_gemini_semaphore():
+                if on_chunk is None:
+                    return await model.generate_content_async(prompt)
+                
+                response = await model.generate_content_async(prompt, stream=True)
+                async for chunk in response:
+                    streamed = True
+                    delivered = on_chunk(chunk.text)
+                    if inspect.isawaitable(delivered):
+                        await delivered
+                return response
+        except Exception as e:
+            delay = None if streamed else _retry_delay(e, attempt)
+            if delay is None:
+                raise
+            logger.warning("gemini_retry", attempt=attempt, wait=round(delay, 2), error=str(e))
+            await asyncio.sleep(delay)
+
+
 # =============================================================================
 # Gemini Client Factory
 # =============================================================================
@@ -56,9 +377,8 @@ def create_gemini_client(config: Dict[str, Any]) -> Any:
     Raises:
         SourceConnectionError: If client creation fails
     """
-    try:
-        import google.generativeai as genai
-    except ImportError:
+    genai = get_genai()
+    if genai is None:
         raise SourceConnectionError(
             message="google-generativeai package not installed. Run: pip install google-generativeai",
             source_id="gemini",
@@ -78,9 +398,6 @@ def create_gemini_client(config: Dict[str, Any]) -> Any:
             source_kind="llm"
         )
     
-    # Configure the library
-    genai.configure(api_key=api_key)
-    
     # Get model configuration
     model_name = config.get("model", config.get("model_name", DEFAULT_MODEL))
     temperature = config.get("temperature", DEFAULT_TEMPERATURE)
@@ -104,6 +421,7 @@ def create_gemini_client(config: Dict[str, Any]) -> Any:
         safety_settings=safety_settings,
         system_instruction=config.get("system_prompt"),
     )
+    bind_gemini_credentials(model, api_key)
     
     logger.info(
         "gemini_client_created",
@@ -159,6 +477,9 @@ def generate_text(
         # Extract text
         text = response.text if response.text else ""
         
+        prompt_length = len(prompt)
+        response_length = len(text)
+        
         # Get usage metrics
         tokens_used = 0
         if hasattr(response, "usage_metadata"):
@@ -166,7 +487,7 @@ def generate_text(
             tokens_used = getattr(usage, "total_token_count", 0)
         else:
             # Approximate
-            tokens_used = (len(prompt) + len(text)) // 4
+            tokens_used = (prompt_length + response_length) // 4
         
         # Get finish reason
         finish_reason = "completed"
@@ -177,8 +498,8 @@ def generate_text(
         
         logger.info(
             "gemini_generation_success",
-            prompt_length=len(prompt),
-            response_length=len(text),
+            prompt_length=prompt_length,
+            response_length=response_length,
             tokens_used=tokens_used
         )
         
@@ -293,10 +614,45 @@ async def generate_text_stream(
 # =============================================================================
 
 
+# Token counts kept per (model, text digest); counting is an API round trip
+TOKEN_COUNT_CACHE_SIZE = 1024
+
+_token_counts: "OrderedDict[Tuple[str, bytes], int]" = OrderedDict()
+_token_counts_lock = Lock()
+
+
+def _token_count_key(client: Any, text: str) -> Tuple[str, bytes]:
+    """Cache key for a token count: the model name and a digest of the text."""
+    return (
+        str(getattr(client, "model_name", "")),
+        hashlib.blake2b(text.encode(), digest_size=16).digest(),
+    )
+
+
+def _get_cached_token_count(key: Tuple[str, bytes]) -> Optional[int]:
+    """Return a cached token count, marking it as recently used."""
+    with _token_counts_lock:
+        tokens = _token_counts.get(key)
+        if tokens is not None:
+            _token_counts.move_to_end(key)
+        return tokens
+
+
+def _cache_token_count(key: Tuple[str, bytes], tokens: int) -> None:
+    """Store a token count, evicting the least recently used beyond the limit."""
+    with _token_counts_lock:
+        _token_counts[key] = tokens
+        while len(_token_counts) > TOKEN_COUNT_CACHE_SIZE:
+            _token_counts.popitem(last=False)
+
+
 def count_tokens(client: Any, text: str) -> int:
     """
     Count tokens in text using Gemini's tokenizer.
     
+    Counts are cached per model, so repeated texts skip the tokenizer
+    call. Approximations used when the call fails are not cached.
+    
     Args:
         client: Gemini client
         text: Text to count tokens for
@@ -304,12 +660,49 @@ def count_tokens(client: Any, text: str) -> int:
     Returns:
         Token count
     """
+    key = _token_count_key(client, text)
+    tokens = _get_cached_token_count(key)
+    if tokens is not None:
+        return tokens
+    
     try:
-        result = client.count_tokens(text)
-        return result.total_tokens
+        tokens = client.count_tokens(text).total_tokens
     except Exception:
         # Fallback: approximate
         return len(text) // 4
+    
+    _cache_token_count(key, tokens)
+    return tokens
+
+
+async def count_tokens_async(client: Any, text: str) -> int:
+    """
+    Count tokens without blocking the event loop.
+    
+    Shares count_tokens' cache. The call goes through the model's async
+    client, so a model bound with bind_gemini_credentials(...,
+    asynchronous=True) counts with the source's API key.
+    
+    Args:
+        client: Gemini client
+        text: Text to count tokens for
+        
+    Returns:
+        Token count
+    """
+    key = _token_count_key(client, text)
+    tokens = _get_cached_token_count(key)
+    if tokens is not None:
+        return tokens
+    
+    try:
+        tokens = (await client.count_tokens_async(text)).total_tokens
+    except Exception:
+        # Fallback: approximate
+        return len(text) // 4
+    
+    _cache_token_count(key, tokens)
+    return tokens
 
 
 def list_models() -> List[str]:
@@ -319,8 +712,11 @@ def list_models() -> List[str]:
     Returns:
         List of model names
     """
+    genai = get_genai()
+    if genai is None:
+        return SUPPORTED_MODELS
+    
     try:
-        import google.generativeai as genai
         models = genai.list_models()
         return [m.name for m in models if "generateContent" in m.supported_generation_methods]
     except Exception as e:
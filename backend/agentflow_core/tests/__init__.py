@@ -0,0 +1,3 @@
+"""
+AgentFlow Core - Test Suite
+"""
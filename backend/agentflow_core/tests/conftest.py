@@ -0,0 +1,23 @@
+"""
+AgentFlow Core - Shared Test Fixtures
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from agentflow_core.api.main import app
+from agentflow_core.runtime.registry import reset_registry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Give every test an empty source, graph and execution registry."""
+    reset_registry()
+    yield
+    reset_registry()
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Test client for the API routes."""
+    return TestClient(app)
@@ -0,0 +1,157 @@
+"""
+AgentFlow Core - API Response Tests
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from agentflow_core.runtime import builder
+
+# Directory containing the agentflow_core package
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+def _etag_under_hash_seed(seed: str) -> str:
+    """Import the workflow routes in a fresh interpreter and read the ETag."""
+    env = {**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": str(BACKEND_DIR)}
+    return subprocess.run(
+        [
+            sys.executable, "-c",
+            "from agentflow_core.api.routes import workflows; "
+            "print(workflows._SOURCE_TYPES_ETAG)",
+        ],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+
+class TestStaticPayloads:
+    """Pre-rendered catalog payloads are identical across processes."""
+    
+    def test_source_types_etag_ignores_hash_seed(self):
+        """Workers with different hash seeds serve the same ETag."""
+        etags = {_etag_under_hash_seed(seed) for seed in ("1", "2", "3")}
+        
+        assert len(etags) == 1
+    
+    def test_source_types_are_sorted(self, client):
+        """Source types are listed in a stable, sorted order."""
+        source_types = client.get("/api/v1/workflows/source-types").json()["source_types"]
+        
+        assert source_types == sorted(source_types)
+
+
+# Catalog endpoints served from pre-rendered payloads
+CATALOG_PATHS = (
+    "/api/v1/workflows/node-types",
+    "/api/v1/workflows/source-types",
+    "/api/v1/sources/types/available",
+)
+
+
+class TestConditionalResponses:
+    """Metadata endpoints honour If-None-Match."""
+    
+    @pytest.mark.parametrize("path", CATALOG_PATHS)
+    def test_matching_etag_returns_304(self, client, path):
+        """A client holding the current ETag gets an empty 304."""
+        first = client.get(path)
+        etag = first.headers["etag"]
+        
+        second = client.get(path, headers={"If-None-Match": etag})
+        
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        assert second.headers["cache-control"] == first.headers["cache-control"]
+    
+    @pytest.mark.parametrize("path", CATALOG_PATHS)
+    def test_stale_etag_returns_payload(self, client, path):
+        """A client holding another ETag gets the full payload."""
+        response = client.get(path, headers={"If-None-Match": 'W/"stale"'})
+        
+        assert response.status_code == 200
+        assert response.json()
+    
+    def test_etag_list_and_strong_form_match(self, client):
+        """Weak comparison accepts strong tags and lists of candidates."""
+        path = CATALOG_PATHS[0]
+        etag = client.get(path).headers["etag"]
+        strong = etag.removeprefix("W/")
+        
+        response = client.get(path, headers={"If-None-Match": f'"other", {strong}'})
+        
+        assert response.status_code == 304
+    
+    def test_source_list_etag_follows_registry(self, client):
+        """Registering a source changes the ETag of the source list."""
+        etag = client.get("/api/v1/sources/").headers["etag"]
+        assert client.get(
+            "/api/v1/sources/", headers={"If-None-Match": etag}
+        ).status_code == 304
+        
+        client.post("/api/v1/sources/", json={
+            "id": "api-1", "kind": "api", "config": {"base_url": "http://example.com"}
+        })
+        response = client.get("/api/v1/sources/", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+
+# Input -> aggregator workflow that runs without any external sources
+ECHO_WORKFLOW = {
+    "name": "echo",
+    "start_node": "input",
+    "nodes": [
+        {"id": "input", "type": "input"},
+        {"id": "agg", "type": "aggregator"},
+    ],
+    "edges": [{"from": "input", "to": "agg"}],
+}
+
+
+class TestExecuteEndpoint:
+    """The execute endpoint shares compiled graphs across identical specs."""
+    
+    def test_identical_specs_are_built_once(self, client, monkeypatch):
+        """Only the first execution of a spec compiles a graph."""
+        builds = []
+        build_graph_from_json = builder.build_graph_from_json
+        
+        def counting_build(spec, **kwargs):
+            builds.append(spec.name)
+            return build_graph_from_json(spec, **kwargs)
+        
+        monkeypatch.setattr(builder, "build_graph_from_json", counting_build)
+        
+        for _ in range(2):
+            response = client.post(
+                "/api/v1/workflows/execute",
+                json={"workflow": ECHO_WORKFLOW, "initial_state": {"user_input": "hi"}},
+            )
+            assert response.status_code == 200, response.text
+            assert response.json()["final_state"]["execution_path"] == ["input", "agg"]
+        
+        assert builds == ["echo"]
+
+
+class TestValidateEndpoint:
+    """Validation errors are reported individually."""
+    
+    def test_errors_keep_their_type(self, client):
+        """Each validation error is returned as-is, not as a conversion error."""
+        workflow = dict(ECHO_WORKFLOW, nodes=ECHO_WORKFLOW["nodes"] + [
+            {"id": "orphan", "type": "llm", "metadata": {}}
+        ])
+        
+        result = client.post("/api/v1/workflows/validate", json=workflow).json()
+        
+        assert result["valid"] is False
+        assert result["errors"]
+        assert all(error["type"] != "conversion_error" for error in result["errors"])
+        assert any(error["node_id"] == "orphan" for error in result["errors"])
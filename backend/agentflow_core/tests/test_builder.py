@@ -0,0 +1,48 @@
+"""
+AgentFlow Core - Graph Builder Tests
+"""
+
+from langgraph.graph import END
+
+from agentflow_core.runtime import builder
+from agentflow_core.runtime.builder import _RouteTable
+
+
+class TestRouteTable:
+    """Conditional edges map intents to targets."""
+    
+    def test_exact_and_case_insensitive_matches(self):
+        """Intents match target names regardless of case."""
+        routes = _RouteTable(["greeting_agent", "Billing"])
+        
+        assert routes["greeting_agent"] == "greeting_agent"
+        assert routes["BILLING"] == "Billing"
+    
+    def test_first_containing_target_wins(self):
+        """An intent routes to the first target whose name contains it."""
+        routes = _RouteTable(["support_agent", "sales_support"])
+        
+        assert routes["support"] == "support_agent"
+        assert routes["sales"] == "sales_support"
+    
+    def test_unknown_intent_uses_first_target(self):
+        """Intents that match nothing fall back to the first target."""
+        routes = _RouteTable(["greeting", "billing"])
+        
+        assert routes["weather"] == "greeting"
+        assert routes[""] == "greeting"
+    
+    def test_no_targets_routes_to_end(self):
+        """An edge without targets ends the graph."""
+        assert _RouteTable([])["anything"] == END
+    
+    def test_remembered_intents_are_bounded(self, monkeypatch):
+        """Only ROUTE_CACHE_SIZE intents are stored; the rest still resolve."""
+        monkeypatch.setattr(builder, "ROUTE_CACHE_SIZE", 3)
+        routes = _RouteTable(["greeting", "billing"])
+        
+        resolved = [routes[f"intent-{i}"] for i in range(5)]
+        
+        assert resolved == ["greeting"] * 5
+        assert len(routes) == 3
+        assert "intent-0" in routes and "intent-4" not in routes
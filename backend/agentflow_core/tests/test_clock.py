@@ -0,0 +1,20 @@
+"""
+AgentFlow Core - Clock Utility Tests
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from agentflow_core.utils.clock import utc_now_iso
+
+
+class TestUtcNowIso:
+    """Cached timestamps are explicit UTC."""
+    
+    def test_timestamp_is_marked_utc(self):
+        """The timestamp carries a Z marker and parses as the current UTC time."""
+        timestamp = utc_now_iso()
+        parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        
+        assert timestamp.endswith("Z")
+        assert parsed.tzinfo == timezone.utc
+        assert abs(datetime.now(timezone.utc) - parsed) < timedelta(seconds=2)
@@ -0,0 +1,175 @@
+"""
+AgentFlow Core - Database Node Tests
+"""
+
+import pytest
+
+from agentflow_core.nodes import db_node
+from agentflow_core.nodes.db_node import (
+    _is_read_only_query,
+    _compile_parameterized_query,
+    create_db_node,
+)
+from agentflow_core.runtime.state import create_initial_state
+from agentflow_core.utils.error_handler import NodeExecutionError
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    """Record the queries db nodes send instead of opening a connection."""
+    sent = []
+    
+    def fake_execute_query(source_config, query, params, timeout, node_id, prepare=None):
+        sent.append({"query": query, "params": params, "prepare": prepare})
+        return [{"id": 1}]
+    
+    monkeypatch.setattr(db_node, "_execute_query", fake_execute_query)
+    return sent
+
+
+class TestReadOnlyQuery:
+    """Only read statements reach the database."""
+    
+    @pytest.mark.parametrize("query", [
+        "SELECT * FROM users",
+        "  select id from users where name = 'x'",
+        "WITH t AS (SELECT 1) SELECT * FROM t",
+        "EXPLAIN SELECT * FROM users",
+        "-- leading comment\nSELECT 1",
+        "SELECT updated_at, created_by FROM users",
+    ])
+    def test_reads_are_allowed(self, query):
+        """Read statements pass, including columns named like keywords."""
+        assert _is_read_only_query(query)
+    
+    @pytest.mark.parametrize("query", [
+        "DELETE FROM users",
+        "UPDATE users SET name = 'x'",
+        "SELECT 1; DROP TABLE users",
+        "WITH t AS (DELETE FROM users RETURNING *) SELECT * FROM t",
+        "/* SELECT */ INSERT INTO users VALUES (1)",
+        "",
+    ])
+    def test_writes_are_blocked(self, query):
+        """Write statements are rejected wherever the keyword appears."""
+        assert not _is_read_only_query(query)
+
+
+class TestLimitInjection:
+    """A LIMIT is added once, based on the query text in the node config."""
+    
+    def test_limit_is_appended(self, queries):
+        """Queries without a LIMIT get the configured one."""
+        node = create_db_node("db", {"query": "SELECT * FROM users;", "limit": 5})
+        
+        updates = node(create_initial_state(user_input="x"))
+        
+        assert queries[0]["query"] == "SELECT * FROM users LIMIT 5"
+        assert updates["db_result"] == [{"id": 1}]
+    
+    def test_existing_limit_is_kept(self, queries):
+        """Queries that already limit their rows are sent unchanged."""
+        node = create_db_node("db", {"query": "SELECT * FROM users LIMIT 2"})
+        
+        node(create_initial_state(user_input="x"))
+        
+        assert queries[0]["query"] == "SELECT * FROM users LIMIT 2"
+    
+    def test_limit_in_input_does_not_suppress_injection(self, queries):
+        """A LIMIT inside interpolated state does not count as the query's."""
+        node = create_db_node("db", {
+            "query_template": "SELECT * FROM docs WHERE title = '{user_input}'",
+            "limit": 10,
+        })
+        
+        node(create_initial_state(user_input="no limit"))
+        
+        assert queries[0]["query"] == (
+            "SELECT * FROM docs WHERE title = 'no limit' LIMIT 10"
+        )
+    
+    def test_write_query_is_blocked(self, queries):
+        """A static write query fails without reaching the database."""
+        node = create_db_node("db", {"query": "DELETE FROM users"})
+        
+        with pytest.raises(NodeExecutionError):
+            node(create_initial_state(user_input="x"))
+        
+        assert queries == []
+
+
+class TestParameterizedQueries:
+    """param_keys are bound by the driver instead of spliced into SQL."""
+    
+    def test_template_rewrite(self):
+        """Bound keys become %(key)s, other placeholders are interpolated."""
+        render = _compile_parameterized_query(
+            "SELECT * FROM t WHERE a = {a} AND b LIKE '5%' AND c = {c:>3}", ("a",)
+        )
+        
+        assert render({"c": 7}) == (
+            "SELECT * FROM t WHERE a = %(a)s AND b LIKE '5%%' AND c =   7"
+        )
+    
+    def test_interpolated_percent_is_escaped(self, queries):
+        """`%` in an interpolated value cannot break the driver's parsing."""
+        node = create_db_node("db", {
+            "query_template": "SELECT * FROM t WHERE a = {a} AND b LIKE '{pattern}'",
+            "param_keys": ["a"],
+            "limit": 0,
+        })
+        state = create_initial_state(user_input="x")
+        state["outputs"] = {"a": 1, "pattern": "ab%"}
+        
+        node(state)
+        
+        assert queries[0]["query"] == "SELECT * FROM t WHERE a = %(a)s AND b LIKE 'ab%%'"
+    
+    @pytest.mark.parametrize("param_keys", [["a"], []])
+    def test_malformed_template_fails_at_build_time(self, param_keys):
+        """A malformed template is rejected before any query is sent."""
+        with pytest.raises(NodeExecutionError, match="Malformed query template"):
+            create_db_node("db", {
+                "query_template": "SELECT * FROM t WHERE a = {a",
+                "param_keys": param_keys,
+            })
+    
+    def test_values_are_bound_as_parameters(self, queries):
+        """State values for param_keys travel as parameters, not SQL text."""
+        node = create_db_node("db", {
+            "query_template": "SELECT * FROM users WHERE name = {user_input}",
+            "param_keys": ["user_input"],
+            "params": {"tenant": 7},
+            "limit": 3,
+        })
+        
+        node(create_initial_state(user_input="x'; DROP TABLE users; --"))
+        
+        sent = queries[0]
+        assert sent["query"] == "SELECT * FROM users WHERE name = %(user_input)s LIMIT 3"
+        assert sent["params"] == {"tenant": 7, "user_input": "x'; DROP TABLE users; --"}
+        assert sent["prepare"] is True
+    
+    def test_custom_output_values_are_bound(self, queries):
+        """Values produced by earlier nodes under outputs can be bound."""
+        node = create_db_node("db", {
+            "query_template": "SELECT * FROM users WHERE id = {user_id}",
+            "param_keys": ["user_id"],
+        })
+        state = create_initial_state(user_input="x")
+        state["outputs"] = {"user_id": 42}
+        
+        node(state)
+        
+        assert queries[0]["params"] == {"user_id": 42}
+    
+    def test_interpolated_templates_are_not_prepared(self, queries):
+        """Without param_keys the driver decides whether to prepare."""
+        node = create_db_node("db", {
+            "query_template": "SELECT * FROM users WHERE name = '{user_input}'",
+        })
+        
+        node(create_initial_state(user_input="x"))
+        
+        assert queries[0]["prepare"] is None
+        assert queries[0]["params"] == {}
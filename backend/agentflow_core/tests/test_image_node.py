@@ -0,0 +1,141 @@
+"""
+AgentFlow Core - Image Node Tests
+"""
+
+import os
+
+import pytest
+
+from agentflow_core.nodes import image_node
+from agentflow_core.nodes.image_node import (
+    IMAGE_STORAGE_FILE,
+    _cache_image,
+    _generate_image,
+    _get_cached_image,
+    _store_image,
+    clear_image_cache,
+)
+
+
+@pytest.fixture
+def image_dir(tmp_path, monkeypatch):
+    """Write image files to a temp dir with a retention of two files."""
+    monkeypatch.setattr(image_node, "IMAGE_DIR", str(tmp_path))
+    monkeypatch.setattr(image_node, "IMAGE_RETENTION", 2)
+    monkeypatch.setattr(image_node, "_stored_images", image_node.deque())
+    clear_image_cache()
+    yield tmp_path
+    clear_image_cache()
+
+
+class TestImageFileStorage:
+    """Images stored as files are bounded by the retention limit."""
+    
+    def test_oldest_files_are_deleted(self, image_dir):
+        """Only the newest IMAGE_RETENTION files stay on disk."""
+        paths = [
+            _store_image(b"png", "image/png", IMAGE_STORAGE_FILE)["path"]
+            for _ in range(3)
+        ]
+        
+        assert not os.path.exists(paths[0])
+        assert all(os.path.exists(path) for path in paths[1:])
+        assert sorted(os.listdir(image_dir)) == sorted(
+            os.path.basename(path) for path in paths[1:]
+        )
+    
+    def test_cached_result_with_pruned_file_is_dropped(self, image_dir):
+        """A cache hit never returns a path that retention has deleted."""
+        key = ("imagen-3.0", "a cat", "1024x1024", IMAGE_STORAGE_FILE)
+        result = _store_image(b"png", "image/png", IMAGE_STORAGE_FILE)
+        _cache_image(key, result)
+        assert _get_cached_image(key, "image_1") == result
+        
+        _store_image(b"png", "image/png", IMAGE_STORAGE_FILE)
+        _store_image(b"png", "image/png", IMAGE_STORAGE_FILE)
+        
+        assert _get_cached_image(key, "image_1") is None
+    
+    def test_memory_storage_writes_nothing(self, image_dir):
+        """Memory storage keeps the bytes in the result."""
+        result = _store_image(b"png", "image/png", "memory")
+        
+        assert result["data"] == b"png"
+        assert os.listdir(image_dir) == []
+
+
+@pytest.fixture
+def generations(monkeypatch):
+    """Count Gemini image generations, returning the queued results."""
+    calls = []
+    results = []
+    
+    def fake_generate_with_gemini(source_config, prompt, size, node_id, storage):
+        calls.append(prompt)
+        if results:
+            return results.pop(0)
+        return {"type": "base64", "data": b"png", "mime_type": "image/png"}
+    
+    monkeypatch.setattr(image_node, "_generate_with_gemini", fake_generate_with_gemini)
+    clear_image_cache()
+    yield calls, results
+    clear_image_cache()
+
+
+def generate(prompt, use_cache=True, size="1024x1024"):
+    """Generate an image with the gemini provider."""
+    return _generate_image(
+        {"provider": "gemini"}, prompt, size, "standard", "vivid", "image_1",
+        use_cache=use_cache
+    )
+
+
+class TestImageCache:
+    """Image results are reused only when a node opts in."""
+    
+    def test_cached_prompt_is_generated_once(self, generations):
+        """Identical requests share one generation, each getting its own dict."""
+        calls, _ = generations
+        
+        first = generate("a cat")
+        second = generate("a cat")
+        
+        assert calls == ["a cat"]
+        assert first == second and first is not second
+    
+    def test_cache_is_keyed_on_size(self, generations):
+        """A different size is a different image."""
+        calls, _ = generations
+        
+        generate("a cat")
+        generate("a cat", size="512x512")
+        
+        assert calls == ["a cat", "a cat"]
+    
+    def test_uncached_nodes_always_generate(self, generations):
+        """Without `cache` every execution generates a new image."""
+        calls, _ = generations
+        
+        generate("a cat", use_cache=False)
+        generate("a cat", use_cache=False)
+        
+        assert len(calls) == 2
+    
+    def test_placeholders_are_not_cached(self, generations):
+        """A failed generation is retried on the next execution."""
+        calls, results = generations
+        results.append({"type": "placeholder", "url": "https://placeholder"})
+        
+        assert generate("a cat")["type"] == "placeholder"
+        assert generate("a cat")["type"] == "base64"
+        assert len(calls) == 2
+    
+    def test_cache_is_bounded(self, generations, monkeypatch):
+        """Least recently used results are evicted beyond IMAGE_CACHE_SIZE."""
+        calls, _ = generations
+        monkeypatch.setattr(image_node, "IMAGE_CACHE_SIZE", 2)
+        
+        for prompt in ("a", "b", "a", "c", "a", "b"):
+            generate(prompt)
+        
+        assert calls == ["a", "b", "c", "b"]
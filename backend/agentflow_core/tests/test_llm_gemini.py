@@ -0,0 +1,225 @@
+"""
+AgentFlow Core - Gemini Source Adapter Tests
+"""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from agentflow_core.sources import llm_gemini
+from agentflow_core.sources.llm_gemini import (
+    bind_gemini_credentials,
+    gemini_service_client,
+    generate_content_with_retry,
+    generate_content_with_retry_async,
+    get_gemini_semaphore,
+)
+
+
+class SlowModel:
+    """Model whose async calls overlap, so the semaphore is contended."""
+    
+    async def generate_content_async(self, prompt, stream=False):
+        await asyncio.sleep(0.01)
+        return prompt
+
+
+class TestGeminiSemaphore:
+    """Async Gemini calls are bounded per event loop."""
+    
+    def test_semaphore_is_per_event_loop(self):
+        """Each running loop gets its own semaphore."""
+        async def current():
+            return get_gemini_semaphore()
+        
+        first = asyncio.run(current())
+        second = asyncio.run(current())
+        
+        assert first is not second
+    
+    def test_contended_calls_work_across_event_loops(self, monkeypatch):
+        """Contended calls in a second asyncio.run do not hit a foreign loop."""
+        monkeypatch.setattr(llm_gemini, "GEMINI_CONCURRENCY", 1)
+        
+        async def fan_out():
+            model = SlowModel()
+            return await asyncio.gather(
+                *(generate_content_with_retry_async(model, str(i)) for i in range(3))
+            )
+        
+        assert asyncio.run(fan_out()) == ["0", "1", "2"]
+        assert asyncio.run(fan_out()) == ["0", "1", "2"]
+
+
+class FakeAsyncClient:
+    def __init__(self, client_options):
+        self.api_key = client_options["api_key"]
+
+
+class FakeModel:
+    _client = None
+    _async_client = None
+
+
+@pytest.fixture
+def fake_glm(monkeypatch):
+    """Provide google.ai.generativelanguage with a fake async client."""
+    glm = types.ModuleType("google.ai.generativelanguage")
+    glm.GenerativeServiceAsyncClient = FakeAsyncClient
+    google_ai = types.ModuleType("google.ai")
+    google_ai.generativelanguage = glm
+    monkeypatch.setitem(sys.modules, "google.ai", google_ai)
+    monkeypatch.setitem(sys.modules, "google.ai.generativelanguage", glm)
+    return glm
+
+
+class TestAsyncServiceClient:
+    """Async service clients belong to the event loop that created them."""
+    
+    def test_async_client_is_per_event_loop(self, fake_glm):
+        """Each loop gets its own client; calls within a loop share one."""
+        async def clients():
+            return (
+                gemini_service_client("key", asynchronous=True),
+                gemini_service_client("key", asynchronous=True),
+            )
+        
+        first_a, first_b = asyncio.run(clients())
+        second, _ = asyncio.run(clients())
+        
+        assert first_a is first_b
+        assert first_a is not second
+    
+    def test_shared_model_is_not_bound_to_a_loop(self, fake_glm):
+        """Async binding returns a bound copy and leaves the model untouched."""
+        model = FakeModel()
+        
+        async def bind():
+            return bind_gemini_credentials(model, "key", asynchronous=True)
+        
+        first = asyncio.run(bind())
+        second = asyncio.run(bind())
+        
+        assert model._async_client is None
+        assert first is not model and second is not model
+        assert first._async_client is not second._async_client
+        assert first._async_client.api_key == "key"
+
+
+class RetryDelay:
+    """A google.rpc.RetryInfo-like retry_delay hint."""
+    
+    def __init__(self, seconds, nanos=0):
+        self.seconds = seconds
+        self.nanos = nanos
+
+
+class HintedTimeout(TimeoutError):
+    """Transient error carrying a server retry hint."""
+    
+    def __init__(self, seconds):
+        super().__init__("rate limited")
+        self.details = [types.SimpleNamespace(retry_delay=RetryDelay(seconds, 500_000_000))]
+
+
+class FlakyModel:
+    """Raises the queued errors, then returns "ok"."""
+    
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+    
+    def generate_content(self, prompt, stream=False):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+    
+    async def generate_content_async(self, prompt, stream=False):
+        return self.generate_content(prompt, stream)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff waits instead of sleeping."""
+    waits = []
+    
+    async def fake_async_sleep(delay):
+        waits.append(delay)
+    
+    monkeypatch.setattr(llm_gemini.time, "sleep", waits.append)
+    monkeypatch.setattr(llm_gemini.asyncio, "sleep", fake_async_sleep)
+    return waits
+
+
+class TestGeminiRetry:
+    """Transient Gemini failures are retried with backoff."""
+    
+    def test_transient_errors_are_retried(self, sleeps):
+        """The call succeeds after transient failures, backing off each time."""
+        model = FlakyModel(TimeoutError(), ConnectionError())
+        
+        assert generate_content_with_retry(model, "hi") == "ok"
+        assert model.calls == 3
+        assert len(sleeps) == 2
+        # Full jitter: each wait is within the attempt's exponential cap
+        assert 0 <= sleeps[0] <= 2.0 and 0 <= sleeps[1] <= 4.0
+    
+    def test_server_retry_hint_is_used(self, sleeps):
+        """A retry_delay hint replaces the jittered backoff."""
+        model = FlakyModel(HintedTimeout(3))
+        
+        generate_content_with_retry(model, "hi")
+        
+        assert sleeps == [3.5]
+    
+    def test_server_retry_hint_is_capped(self, sleeps):
+        """Hints longer than GEMINI_RETRY_MAX_WAIT are capped."""
+        generate_content_with_retry(FlakyModel(HintedTimeout(3600)), "hi")
+        
+        assert sleeps == [llm_gemini.GEMINI_RETRY_MAX_WAIT]
+    
+    def test_other_errors_are_not_retried(self, sleeps):
+        """Non-transient errors surface on the first attempt."""
+        model = FlakyModel(ValueError("bad request"))
+        
+        with pytest.raises(ValueError):
+            generate_content_with_retry(model, "hi")
+        
+        assert model.calls == 1
+        assert sleeps == []
+    
+    def test_attempts_are_bounded(self, sleeps):
+        """The last error is raised once GEMINI_MAX_ATTEMPTS are used."""
+        attempts = llm_gemini.GEMINI_MAX_ATTEMPTS
+        model = FlakyModel(*(TimeoutError(str(i)) for i in range(attempts + 1)))
+        
+        with pytest.raises(TimeoutError, match=str(attempts - 1)):
+            generate_content_with_retry(model, "hi")
+        
+        assert model.calls == attempts
+        assert len(sleeps) == attempts - 1
+    
+    def test_streams_are_not_retried_after_a_chunk(self, sleeps):
+        """Failing after text was delivered raises instead of repeating it."""
+        class BrokenStream:
+            def generate_content(self, prompt, stream=False):
+                yield types.SimpleNamespace(text="partial")
+                raise TimeoutError()
+        
+        chunks = []
+        with pytest.raises(TimeoutError):
+            generate_content_with_retry(BrokenStream(), "hi", on_chunk=chunks.append)
+        
+        assert chunks == ["partial"]
+        assert sleeps == []
+    
+    def test_async_calls_are_retried(self, sleeps):
+        """The async variant retries with the same policy."""
+        model = FlakyModel(HintedTimeout(1))
+        
+        assert asyncio.run(generate_content_with_retry_async(model, "hi")) == "ok"
+        assert model.calls == 2
+        assert sleeps == [1.5]
@@ -0,0 +1,135 @@
+"""
+AgentFlow Core - LLM Node Tests
+"""
+
+import asyncio
+import types
+from collections import OrderedDict
+
+import pytest
+
+from agentflow_core.nodes import llm_node
+from agentflow_core.nodes.llm_node import (
+    _call_llm,
+    _read_gemini_response_async,
+    clear_llm_cache,
+)
+from agentflow_core.sources import llm_gemini
+
+SOURCE_CONFIG = {"provider": "gemini", "model": "gemini-1.5-flash"}
+
+
+@pytest.fixture
+def gemini_calls(monkeypatch):
+    """Answer Gemini calls with a numbered response instead of the API."""
+    calls = []
+    
+    def fake_call_gemini(prompt, system_prompt, **kwargs):
+        calls.append((prompt, system_prompt))
+        return f"answer {len(calls)}", 10
+    
+    monkeypatch.setattr(llm_node, "_call_gemini", fake_call_gemini)
+    clear_llm_cache()
+    yield calls
+    clear_llm_cache()
+
+
+def call(prompt, temperature=0.0, system_prompt=None, use_cache=True, on_chunk=None):
+    """Call the LLM with the test source."""
+    return _call_llm(
+        SOURCE_CONFIG, prompt, system_prompt, temperature, 256, "llm_1",
+        use_cache=use_cache, on_chunk=on_chunk
+    )
+
+
+class TestResponseCache:
+    """Deterministic LLM calls reuse earlier responses."""
+    
+    def test_temperature_zero_responses_are_reused(self, gemini_calls):
+        """A repeated call returns the cached text and spends no tokens."""
+        chunks = []
+        
+        assert call("hi") == ("answer 1", 10)
+        assert call("hi", on_chunk=chunks.append) == ("answer 1", 0)
+        assert len(gemini_calls) == 1
+        assert chunks == ["answer 1"]
+    
+    def test_sampled_responses_are_not_cached(self, gemini_calls):
+        """Calls with a temperature above zero always reach the model."""
+        call("hi", temperature=0.7)
+        call("hi", temperature=0.7)
+        
+        assert len(gemini_calls) == 2
+    
+    def test_cache_can_be_disabled(self, gemini_calls):
+        """`cache: false` bypasses the cache."""
+        call("hi", use_cache=False)
+        call("hi", use_cache=False)
+        
+        assert len(gemini_calls) == 2
+    
+    def test_key_includes_system_prompt(self, gemini_calls):
+        """A different system prompt is a different request."""
+        call("hi", system_prompt="Be brief.")
+        
+        assert call("hi", system_prompt="Be verbose.") == ("answer 2", 10)
+    
+    def test_cache_is_bounded(self, gemini_calls, monkeypatch):
+        """Least recently used responses are evicted beyond RESPONSE_CACHE_SIZE."""
+        monkeypatch.setattr(llm_node, "RESPONSE_CACHE_SIZE", 2)
+        
+        for prompt in ("a", "b", "a", "c", "a", "b"):
+            call(prompt)
+        
+        assert [prompt for prompt, _ in gemini_calls] == ["a", "b", "c", "b"]
+
+
+class AsyncCountingModel:
+    """Model whose tokenizer may only be reached through the async client."""
+    
+    model_name = "models/gemini-test"
+    
+    def __init__(self):
+        self.counted = []
+    
+    def count_tokens(self, text):
+        raise AssertionError("sync count_tokens blocks the event loop")
+    
+    async def count_tokens_async(self, text):
+        self.counted.append(text)
+        return types.SimpleNamespace(total_tokens=len(text.split()))
+
+
+class TestAsyncTokenCounting:
+    """Async LLM calls count missing usage without blocking the loop."""
+    
+    def test_usage_is_counted_with_the_async_client(self, monkeypatch):
+        """Prompt and reply are counted via count_tokens_async and cached."""
+        monkeypatch.setattr(llm_gemini, "_token_counts", OrderedDict())
+        model = AsyncCountingModel()
+        response = types.SimpleNamespace(text="two words")
+        
+        async def read_twice():
+            return [
+                await _read_gemini_response_async(
+                    response, "a longer prompt", model, "gemini-test"
+                )
+                for _ in range(2)
+            ]
+        
+        assert asyncio.run(read_twice()) == [("two words", 5), ("two words", 5)]
+        assert sorted(model.counted) == ["a longer prompt", "two words"]
+    
+    def test_reported_usage_skips_the_tokenizer(self):
+        """Responses with usage metadata are never re-counted."""
+        model = AsyncCountingModel()
+        response = types.SimpleNamespace(
+            text="hi", usage_metadata=types.SimpleNamespace(total_token_count=9)
+        )
+        
+        result = asyncio.run(
+            _read_gemini_response_async(response, "prompt", model, "gemini-test")
+        )
+        
+        assert result == ("hi", 9)
+        assert model.counted == []
@@ -0,0 +1,53 @@
+"""
+AgentFlow Core - Node Wrapper Tests
+"""
+
+import pytest
+
+from agentflow_core.nodes.base_node import create_node_wrapper
+from agentflow_core.runtime.state import create_initial_state, merge_state
+
+
+def write_summary(state, metadata):
+    """Node logic writing a custom output_key and a known state key."""
+    return merge_state(state, {"summary": "hi", "text_result": "done"})
+
+
+class TestCreateNodeWrapper:
+    """The wrapper returns only the fields a node changed."""
+    
+    @pytest.mark.parametrize("metadata", [
+        {},
+        {"writes": ["summary", "text_result"]},
+        {"writes": ["text_result"]},
+    ])
+    def test_custom_output_keys_are_returned(self, metadata):
+        """Custom keys stored in outputs survive a declared write set."""
+        node = create_node_wrapper("n", "custom", write_summary, metadata)
+        
+        updates = node(create_initial_state(user_input="x"))
+        
+        assert updates["outputs"] == {"summary": "hi"}
+        assert updates["text_result"] == "done"
+    
+    def test_unchanged_outputs_are_not_returned(self):
+        """Outputs shared unchanged with the input state are left out."""
+        node = create_node_wrapper(
+            "n", "custom",
+            lambda state, metadata: merge_state(state, {"text_result": "done"}),
+            {"writes": ["text_result"]}
+        )
+        
+        updates = node(create_initial_state(user_input="x"))
+        
+        assert "outputs" not in updates
+        assert updates["execution_path"] == ["n"]
+    
+    def test_undeclared_known_keys_are_skipped(self):
+        """With a write set, other changed top-level keys are not diffed."""
+        node = create_node_wrapper("n", "custom", write_summary, {"writes": []})
+        
+        updates = node(create_initial_state(user_input="x"))
+        
+        assert "text_result" not in updates
+        assert updates["outputs"] == {"summary": "hi"}
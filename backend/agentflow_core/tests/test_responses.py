@@ -0,0 +1,52 @@
+"""
+AgentFlow Core - Response Serializer Tests
+"""
+
+import orjson
+import pytest
+
+from agentflow_core.api.models.workflow_model import ExecuteResponse
+from agentflow_core.api.responses import serialize_execute_response
+
+
+class TestCompiledSerializer:
+    """Compiled serializers render what the Pydantic model would."""
+    
+    def test_matches_model_dump(self):
+        """Output parses to the same document as ExecuteResponse."""
+        values = {
+            "status": "success",
+            "final_state": {"final_output": "hi", "execution_path": ["input"]},
+            "execution_time_ms": 12.5,
+            "tokens_used": 7,
+        }
+        
+        rendered = orjson.loads(serialize_execute_response(values))
+        
+        assert rendered == ExecuteResponse(**values).model_dump(mode="json")
+        assert list(rendered) == list(ExecuteResponse.model_fields)
+    
+    def test_missing_optional_fields_use_defaults(self):
+        """Omitted optional fields are rendered with the model defaults."""
+        rendered = orjson.loads(serialize_execute_response({"status": "error"}))
+        
+        assert rendered == ExecuteResponse(status="error").model_dump(mode="json")
+    
+    def test_bytes_are_base64_encoded(self):
+        """In-memory image bytes in the state are rendered as base64."""
+        rendered = orjson.loads(serialize_execute_response({
+            "status": "success",
+            "final_state": {"image": {"data": b"png"}},
+        }))
+        
+        assert rendered["final_state"]["image"]["data"] == "cG5n"
+    
+    def test_invalid_literal_is_rejected(self):
+        """Literal fields only accept their declared values."""
+        with pytest.raises(ValueError, match="status"):
+            serialize_execute_response({"status": "done"})
+    
+    def test_missing_required_field_is_rejected(self):
+        """Required fields must be present."""
+        with pytest.raises(ValueError, match="status"):
+            serialize_execute_response({"final_state": {}})
@@ -0,0 +1,174 @@
+"""
+AgentFlow Core - Source Registration and Client Cache Tests
+"""
+
+import sys
+import types
+from contextlib import contextmanager
+
+import pytest
+
+import agentflow_core.sources as sources
+from agentflow_core.api.routes.sources import MASKED_VALUE, _mask_sensitive_config
+from agentflow_core.nodes.db_node import _execute_postgresql
+from agentflow_core.runtime.registry import get_source
+
+
+class FakePool:
+    """Stands in for psycopg_pool.ConnectionPool."""
+    
+    def __init__(self, config):
+        self.config = config
+        self.closed = False
+        self.queries = []
+    
+    @contextmanager
+    def connection(self):
+        yield FakeConnection(self)
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self, pool):
+        self.pool = pool
+    
+    @contextmanager
+    def cursor(self, row_factory=None):
+        yield FakeCursor(self.pool)
+
+
+class FakeCursor:
+    description = (("one",),)
+    
+    def __init__(self, pool):
+        self.pool = pool
+    
+    def execute(self, query, params=None, prepare=None):
+        self.pool.queries.append(query)
+    
+    def fetchall(self):
+        return [{"one": 1}]
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    """Route postgres client creation to FakePool and record the pools."""
+    created = []
+    
+    def create_pool(config):
+        pool = FakePool(config)
+        created.append(pool)
+        return {"type": "pool", "pool": pool, "config": config}
+    
+    for kind in sources.POSTGRES_KINDS:
+        monkeypatch.setitem(sources.SOURCE_FACTORIES, kind, create_pool)
+    
+    psycopg = types.ModuleType("psycopg")
+    psycopg_rows = types.ModuleType("psycopg.rows")
+    psycopg_rows.dict_row = object()
+    psycopg.rows = psycopg_rows
+    monkeypatch.setitem(sys.modules, "psycopg", psycopg)
+    monkeypatch.setitem(sys.modules, "psycopg.rows", psycopg_rows)
+    
+    sources.clear_source_client_cache()
+    yield created
+    sources.clear_source_client_cache()
+
+
+DB_SOURCE = {
+    "id": "warehouse",
+    "kind": "db",
+    "config": {"connection_string": "postgresql://user:pw@db/warehouse"},
+}
+
+
+class TestDatabasePools:
+    """Registration, db node queries and unregistration share one pool."""
+    
+    def test_query_uses_pool_opened_at_registration(self, client, pools):
+        """The db node checks out connections from the registration pool."""
+        assert client.post("/api/v1/sources/", json=DB_SOURCE).status_code == 201
+        assert len(pools) == 1
+        
+        rows = _execute_postgresql(
+            get_source("warehouse")["config"], "SELECT 1", {}, 30, "db_node"
+        )
+        
+        assert rows == [{"one": 1}]
+        assert len(pools) == 1
+        assert pools[0].queries == ["SELECT 1"]
+    
+    def test_unregister_closes_the_query_pool(self, client, pools):
+        """After DELETE no pool for the source stays open or cached."""
+        client.post("/api/v1/sources/", json=DB_SOURCE)
+        _execute_postgresql(get_source("warehouse")["config"], "SELECT 1", {}, 30, "db_node")
+        # A node with its own timeout opens a second pool for the same database
+        _execute_postgresql(get_source("warehouse")["config"], "SELECT 2", {}, 5, "db_node")
+        assert len(pools) == 2
+        
+        assert client.delete("/api/v1/sources/warehouse").status_code == 200
+        
+        assert all(pool.closed for pool in pools)
+        assert not sources._client_cache
+    
+    def test_reregister_with_new_credentials_closes_old_pool(self, client, pools):
+        """Replacing a source's config closes the pool built from the old one."""
+        client.post("/api/v1/sources/", json=DB_SOURCE)
+        _execute_postgresql(get_source("warehouse")["config"], "SELECT 1", {}, 30, "db_node")
+        
+        updated = {**DB_SOURCE, "config": {"connection_string": "postgresql://user:new@db/warehouse"}}
+        client.post("/api/v1/sources/", json=updated)
+        
+        assert pools[0].closed
+        assert not pools[-1].closed
+        assert pools[-1].config["connection_string"].endswith("new@db/warehouse")
+
+
+class TestSensitiveMasking:
+    """Secrets in source configs never reach API responses."""
+    
+    def test_sensitive_keys_are_masked(self):
+        """Exact, mixed-case and substring matches are all masked."""
+        masked = _mask_sensitive_config({
+            "id": "s1",
+            "API_KEY": "k",
+            "openai_api_key": "k",
+            "config": {"password": "p", "db_token": "t", "host": "db"},
+        })
+        
+        assert masked == {
+            "id": "s1",
+            "API_KEY": MASKED_VALUE,
+            "openai_api_key": MASKED_VALUE,
+            "config": {"password": MASKED_VALUE, "db_token": MASKED_VALUE, "host": "db"},
+        }
+    
+    def test_input_is_not_modified(self):
+        """Masking copies configs instead of editing the registry's dicts."""
+        config = {"id": "s1", "config": {"connection_string": "postgres://u:p@h/db"}}
+        
+        _mask_sensitive_config(config)
+        
+        assert config["config"]["connection_string"] == "postgres://u:p@h/db"
+    
+    def test_clean_config_is_returned_as_is(self):
+        """Configs without secrets are passed through without a copy."""
+        config = {"id": "s1", "kind": "api", "config": {"base_url": "http://example.com"}}
+        
+        assert _mask_sensitive_config(config) is config
+    
+    def test_endpoints_mask_registered_source(self, client):
+        """The list and detail endpoints both mask secrets."""
+        client.post("/api/v1/sources/", json={
+            "id": "api-1", "kind": "api",
+            "config": {"base_url": "http://example.com", "api_key": "k"},
+        })
+        
+        listed = client.get("/api/v1/sources/").json()["sources"]["api-1"]
+        detail = client.get("/api/v1/sources/api-1").json()
+        
+        assert listed["config"]["api_key"] == MASKED_VALUE
+        assert detail["config"]["api_key"] == MASKED_VALUE
+        assert detail["config"]["base_url"] == "http://example.com"
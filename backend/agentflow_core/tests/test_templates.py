@@ -0,0 +1,80 @@
+"""
+AgentFlow Core - Template Compilation Tests
+"""
+
+import pytest
+
+from agentflow_core.nodes.base_node import compile_template
+
+
+class TestCompileTemplate:
+    """compile_template fast path must render exactly like str.format_map."""
+    
+    @pytest.mark.parametrize("template", [
+        "Hello {user_input}",
+        "{user_input}",
+        "no placeholders",
+        "escaped {{braces}} and {user_input}",
+        "{user_input} / {count} / {user_input}",
+        "",
+    ])
+    def test_fast_path_matches_format_map(self, template):
+        """Plain-name templates render like format_map over outputs then state."""
+        state = {"user_input": "world", "count": 3, "outputs": {}}
+        
+        assert compile_template(template)(state) == template.format_map(state)
+    
+    def test_outputs_take_precedence_over_state(self):
+        """A key in outputs shadows the same key in state."""
+        state = {"user_input": "state", "outputs": {"user_input": "output"}}
+        
+        assert compile_template("{user_input}")(state) == "output"
+    
+    def test_unknown_placeholder_is_kept(self):
+        """Placeholders without a value are left in the rendered text."""
+        state = {"user_input": "hi", "outputs": {}}
+        
+        assert compile_template("{user_input} {missing}")(state) == "hi {missing}"
+    
+    def test_format_spec_uses_format_map(self):
+        """Format specs and conversions go through str.format_map."""
+        state = {"count": 7, "name": "x", "outputs": {}}
+        
+        assert compile_template("{count:>3}|{name!r}")(state) == "  7|'x'"
+    
+    def test_malformed_template_is_returned_unchanged(self):
+        """A template that cannot be parsed renders as itself."""
+        assert compile_template("broken {")({"outputs": {}}) == "broken {"
+
+
+class TestJinjaTemplates:
+    """Templates with {% %} blocks render in a Jinja2 sandbox."""
+    
+    @pytest.fixture(autouse=True)
+    def require_jinja2(self):
+        pytest.importorskip("jinja2")
+    
+    def test_renders_blocks(self):
+        """Control blocks and outputs-over-state lookup work."""
+        render = compile_template("{% if flag %}{{ user_input }}{% endif %}")
+        
+        assert render({"flag": True, "user_input": "a", "outputs": {"user_input": "b"}}) == "b"
+    
+    def test_dunder_attribute_access_is_rejected(self):
+        """Dunder attributes are unsafe in the sandbox."""
+        from jinja2.exceptions import SecurityError
+        
+        from agentflow_core.nodes.base_node import _jinja_environment
+        
+        compiled = _jinja_environment().from_string("{{ value.__class__.__mro__ }}")
+        with pytest.raises(SecurityError):
+            compiled.render(value="")
+    
+    def test_code_execution_payload_does_not_run(self):
+        """A template reaching os through globals fails and renders unchanged."""
+        template = (
+            "{% if 1 %}{{ cycler.__init__.__globals__.os"
+            ".popen('echo PWNED').read() }}{% endif %}"
+        )
+        
+        assert compile_template(template)({"outputs": {}}) == template
@@ -0,0 +1,52 @@
+"""
+AgentFlow Core - Workflow Model Tests
+"""
+
+from agentflow_core.api.models.workflow_model import NodeModel, WorkflowSpecModel
+
+
+def make_spec():
+    """Input -> aggregator workflow."""
+    return WorkflowSpecModel.model_validate({
+        "name": "echo",
+        "start_node": "input",
+        "nodes": [
+            {"id": "input", "type": "input"},
+            {"id": "agg", "type": "aggregator"},
+        ],
+        "edges": [{"from": "input", "to": "agg"}],
+    })
+
+
+class TestWorkflowSpecModel:
+    """Lookups and the spec hash follow edits to a spec."""
+    
+    def test_lookups_see_edited_nodes(self):
+        """Nodes added after validation can be looked up."""
+        spec = make_spec()
+        assert spec.get_node("extra") is None
+        
+        spec.nodes.append(NodeModel(id="extra", type="llm"))
+        
+        assert spec.get_node("extra").id == "extra"
+        assert spec.get_node("input").id == "input"
+    
+    def test_hash_changes_with_the_spec(self):
+        """An edited spec no longer shares the hash of the original."""
+        spec = make_spec()
+        original = spec.spec_hash()
+        
+        spec.nodes[1].metadata = {"strategy": "concat"}
+        
+        assert spec.spec_hash() != original
+        assert make_spec().spec_hash() == original
+    
+    def test_edge_targets_follow_edits(self):
+        """Edge targets reflect a retargeted edge."""
+        spec = make_spec()
+        edge = spec.edges[0]
+        assert edge.targets == ("agg",)
+        
+        edge.to = ["agg", "input"]
+        
+        assert edge.targets == ("agg", "input")
@@ -6,10 +6,12 @@ This module exports common utility functions used across the application.
 
 from agentflow_core.utils.logger import (
     get_logger,
+    is_log_enabled,
     log_api_request,
     log_error,
     log_node_event,
     log_workflow_event,
+    record_error,
     setup_logging,
 )
 from agentflow_core.utils.id_generator import (
@@ -19,6 +21,7 @@ from agentflow_core.utils.id_generator import (
     generate_source_id,
     generate_workflow_id,
 )
+from agentflow_core.utils.clock import utc_now_iso
 from agentflow_core.utils.error_handler import (
     AgentFlowError,
     NodeExecutionError,
@@ -31,16 +34,20 @@ __all__ = [
     # Logging
     "get_logger",
     "setup_logging",
+    "is_log_enabled",
     "log_workflow_event",
     "log_node_event",
     "log_error",
     "log_api_request",
+    "record_error",
     # ID Generation
     "generate_id",
     "generate_workflow_id",
     "generate_node_id",
     "generate_queue_id",
     "generate_source_id",
+    # Time
+    "utc_now_iso",
     # Error Handling
     "AgentFlowError",
     "ValidationError",
@@ -0,0 +1,35 @@
+"""
+AgentFlow Core - Clock Utility
+
+Provides cheap wall-clock timestamps for API payloads and logs.
+Formatting is amortized across all calls made within the same second.
+"""
+
+import time
+from typing import Tuple
+
+
+# (epoch_second, formatted) for the most recent call
+_iso_cache: Tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with second resolution.
+
+    The string ends in "Z", so clients never mistake it for local time.
+
+    The formatted string is cached per wall-clock second, so concurrent
+    requests within the same second share a single formatting call.
+
+    Returns:
+        Timestamp string like '2024-01-01T12:00:00Z'
+    """
+    global _iso_cache
+
+    second = int(time.time())
+    cached_second, formatted = _iso_cache
+    if second != cached_second:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _iso_cache = (second, formatted)
+    return formatted
@@ -5,13 +5,32 @@ Provides consistent, structured logging across the entire application.
 Uses structlog for JSON-formatted logs suitable for production environments.
 """
 
+import asyncio
+import atexit
 import logging
+import queue
 import sys
-from typing import Any
+import time
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import structlog
 
 
+# Background listener that owns the real (blocking) log handlers
+_queue_listener: Optional[QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the background listener."""
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def setup_logging(
     log_level: str = "INFO",
     json_format: bool = False,
@@ -20,22 +39,49 @@ def setup_logging(
     """
     Configure structured logging for the application.
     
+    Records are handed to a QueueHandler on the root logger, and a
+    QueueListener thread performs the actual stream writes, so logging
+    from request handlers never blocks the event loop on I/O.
+    
+    Loggers filter by level before any processing: calls below the level
+    return immediately, without building the event dict or running the
+    processor chain. Calling this again only updates the level; loggers
+    already used keep the level they were first bound with.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: If True, output JSON formatted logs (for production)
         app_name: Application name to include in logs
     """
+    global _queue_listener
+    
+    level = getattr(logging, log_level.upper(), logging.INFO)
+    
     # Configure standard logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper(), logging.INFO),
-    )
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    
+    if _queue_listener is None:
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        
+        root_logger.addHandler(QueueHandler(log_queue))
+        _queue_listener = QueueListener(
+            log_queue,
+            stream_handler,
+            respect_handler_level=True,
+        )
+        _queue_listener.start()
+        atexit.register(_stop_queue_listener)
 
     # Configure structlog processors
     shared_processors: list[Any] = [
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
+        # Interpolates %-style arguments only for records that get rendered
+        structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.UnicodeDecoder(),
@@ -55,14 +101,15 @@ def setup_logging(
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Below-level methods are no-ops, resolved once per level
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
+def get_logger(name: str | None = None) -> structlog.typing.FilteringBoundLogger:
     """
     Get a structured logger instance.
     
@@ -83,6 +130,26 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
 logger = get_logger("agentflow_core")
 
 
+def is_log_enabled(level: int = logging.INFO, name: str = "agentflow_core") -> bool:
+    """
+    Check whether events at `level` would be emitted.
+    
+    Lets hot paths skip building log payloads (and structlog's processor
+    chain) when the level is filtered out. Before setup_logging() has
+    configured structlog, events are always printed, so this returns True.
+    
+    Args:
+        level: Standard logging level (e.g. logging.INFO)
+        name: Logger name whose effective level is checked
+        
+    Returns:
+        True if an event at this level would be logged
+    """
+    if not structlog.is_configured():
+        return True
+    return logging.getLogger(name).isEnabledFor(level)
+
+
 # Convenience functions for common log operations
 def log_workflow_event(
     event: str,
@@ -90,6 +157,8 @@ def log_workflow_event(
     **kwargs: Any
 ) -> None:
     """Log a workflow-related event with consistent structure."""
+    if not is_log_enabled():
+        return
     logger.info(
         event,
         workflow_id=workflow_id,
@@ -104,6 +173,8 @@ def log_node_event(
     **kwargs: Any
 ) -> None:
     """Log a node-related event with consistent structure."""
+    if not is_log_enabled():
+        return
     logger.info(
         event,
         node_id=node_id,
@@ -143,3 +214,113 @@ def log_api_request(
         duration_ms=round(duration_ms, 2),
         **kwargs
     )
+
+
+# =============================================================================
+# Error Burst Buffering
+# =============================================================================
+
+# Seconds between flushes of buffered errors while the flusher task runs
+ERROR_FLUSH_INTERVAL = 0.25
+
+# Errors reported individually in each aggregated entry
+ERROR_BURST_SAMPLES = 5
+
+# (event, error_type, message, timestamp, exception or None, context); oldest dropped first
+_error_ring: Deque[Tuple[str, str, str, float, Optional[BaseException], Dict[str, Any]]] = deque(maxlen=1024)
+_error_flusher: Optional["asyncio.Task[None]"] = None
+
+
+def record_error(
+    event: str,
+    error: BaseException,
+    with_traceback: bool = True,
+    **kwargs: Any
+) -> None:
+    """
+    Buffer an error for aggregated logging.
+    
+    While the background flusher runs, this only appends to an in-memory
+    ring, so request handlers skip traceback formatting during error storms.
+    Without a flusher the error is logged immediately.
+    
+    Args:
+        event: Event name the error is grouped under
+        error: The exception being reported
+        with_traceback: Whether the traceback may be logged for this error
+        **kwargs: Extra context kept with each sample (e.g. path)
+    """
+    _error_ring.append((
+        event,
+        type(error).__name__,
+        str(error),
+        time.time(),
+        error if with_traceback else None,
+        kwargs,
+    ))
+    if _error_flusher is None:
+        flush_errors()
+
+
+def flush_errors() -> int:
+    """
+    Emit one aggregated `error_burst` entry per event for buffered errors.
+    
+    Only the first error of each event is logged with its traceback,
+    and only if it was recorded with one.
+    
+    Returns:
+        Number of buffered errors that were flushed
+    """
+    drained = 0
+    bursts: Dict[str, List[Tuple[str, str, float, Optional[BaseException], Dict[str, Any]]]] = {}
+    while _error_ring:
+        event, error_type, message, timestamp, error, context = _error_ring.popleft()
+        bursts.setdefault(event, []).append((error_type, message, timestamp, error, context))
+        drained += 1
+    
+    for event, entries in bursts.items():
+        logger.error(
+            "error_burst",
+            source_event=event,
+            count=len(entries),
+            samples=[
+                {"error_type": error_type, "message": message, "timestamp": timestamp, **context}
+                for error_type, message, timestamp, _, context in entries[:ERROR_BURST_SAMPLES]
+            ],
+            exc_info=entries[0][3] or False
+        )
+    
+    return drained
+
+
+async def _run_error_flusher(interval: float) -> None:
+    """Flush buffered errors every `interval` seconds until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            flush_errors()
+    finally:
+        flush_errors()
+
+
+def start_error_flusher(interval: float = ERROR_FLUSH_INTERVAL) -> None:
+    """Start the background error flusher on the running event loop."""
+    global _error_flusher
+    
+    if _error_flusher is None:
+        _error_flusher = asyncio.get_running_loop().create_task(_run_error_flusher(interval))
+
+
+async def stop_error_flusher() -> None:
+    """Stop the background flusher and log anything still buffered."""
+    global _error_flusher
+    
+    task, _error_flusher = _error_flusher, None
+    if task is not None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    flush_errors()